@@ -8,6 +8,41 @@ data types that the SLIP interpreter will work with.
 from abc import ABC
 from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
 import collections.abc
+import sys
+import weakref
+
+
+# =================================================================
+# AST Node Kind Tags
+# =================================================================
+
+# Small-integer tags carried as a class attribute (`_kind`) by AST node types so hot
+# evaluator loops can dispatch with one attribute read and an int compare instead of
+# walking an isinstance chain. Untagged values (ints, strings, scopes, ...) are KIND_NONE.
+# The path node classes (GetPath, SetPath, PipedPath, Name, ...) are not meant to be
+# subclassed: evaluator hot paths test them with exact `type(x) is Cls` compares.
+KIND_NONE = 0
+KIND_PIPED_PATH = 1
+KIND_PATH_LITERAL = 2
+KIND_GET_PATH = 3
+KIND_GROUP = 4
+KIND_CODE = 5
+KIND_SET_PATH = 6
+KIND_DEL_PATH = 7
+KIND_POST_PATH = 8
+KIND_MULTI_SET_PATH = 9
+KIND_LIST = 10
+KIND_BYTE_STREAM = 11
+KIND_SIG = 12
+
+
+def node_kind(value: Any) -> int:
+    """Return the KIND_* tag for an AST node (KIND_NONE for anything untagged).
+
+    Reads the tag off the type so instance-level `__getattr__` fallbacks (Scope,
+    SlipDict) can never be consulted.
+    """
+    return getattr(type(value), "_kind", KIND_NONE)
 
 
 class PathNotFound(Exception):
@@ -47,21 +82,40 @@ class SlipBlock(collections.abc.MutableSequence):
 
     def __setitem__(self, index, value):
         self.nodes[index] = value
+        self._drop_caches()
 
     def __delitem__(self, index):
         del self.nodes[index]
+        self._drop_caches()
 
     def __len__(self) -> int:
         return len(self.nodes)
 
     def insert(self, index, value):
         self.nodes.insert(index, value)
+        self._drop_caches()
 
     @property
     def ast(self):
         """Provides access to the raw AST nodes for metaprogramming."""
         return self.nodes
 
+    @property
+    def has_templating(self) -> bool:
+        """True if the nodes contain `(inject ...)` or `(splice ...)` forms to expand."""
+        d = self.__dict__
+        flag = d.get("_has_templating")
+        if flag is None:
+            flag = d["_has_templating"] = _scan_templating(self.nodes)
+        return flag
+
+    def _drop_caches(self) -> None:
+        # Forget facts the evaluator derived from the nodes (compiled program, scans).
+        d = self.__dict__
+        d.pop("_bytecode", None)
+        d.pop("_has_templating", None)
+        d.pop("_splice_kind", None)
+
 
 # =================================================================
 # Core Runtime Types
@@ -88,6 +142,56 @@ class Scope:
         # Internal escape hatch to allow the evaluator to bind `this` capability
         # into the call scope without permitting it to be stored elsewhere.
         self._allow_this_token: bool = False
+        # Set once the scope escapes its creator (closure, `current-scope`, task,
+        # stored as a value); captured scopes are never pooled.
+        self._captured: bool = False
+
+    # Bounded free list of reset call scopes, shared by all evaluators.
+    # See Scope._acquire / Scope._release.
+    _free_list: List["Scope"] = []
+    _FREE_LIST_MAX = 64
+    # Instance attributes of a scope that nothing has customized.
+    _PLAIN_ATTRS = frozenset({"bindings", "meta", "_allow_this_token", "_captured"})
+    # Class default for subclasses that bypass Scope.__init__.
+    _captured = False
+
+    @classmethod
+    def _acquire(cls, parent: Optional["Scope"] = None) -> "Scope":
+        """Return an empty Scope with the given parent, reusing a released one if available."""
+        free = Scope._free_list
+        if cls is Scope and free:
+            scope = free.pop()
+            scope.meta["parent"] = parent
+            return scope
+        return cls(parent=parent)
+
+    @staticmethod
+    def _release(scope: "Scope") -> bool:
+        """Reset `scope` and return it to the free list unless it was captured.
+
+        Scopes marked by `_mark_captured` (closures, `current-scope`, tasks, scopes
+        stored as values), weakly referenced scopes, and scopes carrying extra state
+        are left alone. Returns True when pooled.
+        """
+        free = Scope._free_list
+        if type(scope) is not Scope or len(free) >= Scope._FREE_LIST_MAX:
+            return False
+        if scope._captured or scope._allow_this_token or weakref.getweakrefcount(scope):
+            return False
+        if scope.__dict__.keys() != Scope._PLAIN_ATTRS:
+            return False
+        scope.bindings.clear()
+        scope.meta.clear()
+        scope.meta["parent"] = None
+        free.append(scope)
+        return True
+
+    def _mark_captured(self):
+        """Mark this scope and its parent chain as reachable beyond the current call."""
+        cur = self
+        while isinstance(cur, Scope) and not cur._captured:
+            cur._captured = True
+            cur = cur.meta.get("parent")
 
     def _set_allow_this_token(self, allowed: bool):
         self._allow_this_token = bool(allowed)
@@ -100,10 +204,10 @@ class Scope:
             raise TypeError(f"Scope key must be a str, not {type(key)}")
         # Contract: `This` cannot be stored in a scope (except for the internal
         # evaluator binding of the reserved `this` param in a call scope).
-        from slip.slip_datatypes import This as _This
-
-        if isinstance(value, _This) and not getattr(self, "_allow_this_token", False):
+        if isinstance(value, This) and not getattr(self, "_allow_this_token", False):
             raise PermissionError("`this` cannot be stored")
+        if isinstance(value, Scope):
+            value._mark_captured()
         self.bindings[key] = value
 
     def __getitem__(self, key: Any) -> Any:
@@ -164,12 +268,10 @@ class Scope:
 
     def _normalize_key(self, key):
         """Allow a single-name PathLiteral(GetPath(...)) or GetPath to be used as a key."""
+        if isinstance(key, str):
+            return key
         try:
-            from slip.slip_datatypes import (
-                PathLiteral as _PL,
-            )  # local import to avoid cycle during edits
-
-            if isinstance(key, _PL):
+            if isinstance(key, PathLiteral):
                 inner = getattr(key, "inner", None)
                 if isinstance(inner, GetPath):
                     segs = getattr(inner, "segments", [])
@@ -188,6 +290,20 @@ class Scope:
         """Returns the prototype parent scope."""
         return self.meta.get("parent")
 
+    def _root_scope(self) -> Any:
+        """The outermost ancestor reached by following parent links (stops at non-Scopes).
+
+        A method rather than a `root` property so it cannot shadow a binding named `root`
+        for attribute-style access.
+        """
+        cur = self
+        while isinstance(cur, Scope):
+            nxt = cur.parent
+            if not nxt:
+                break
+            cur = nxt
+        return cur
+
     def keys(self) -> collections.abc.KeysView[str]:
         """Returns a view of keys in the current scope only."""
         return self.bindings.keys()
@@ -466,6 +582,8 @@ class Code(SlipBlock):
     first-class data type that can be passed to functions or manipulated.
     """
 
+    _kind = KIND_CODE
+
     def __init__(self, ast_nodes: List[Any]):
         super().__init__(ast_nodes)
 
@@ -476,6 +594,24 @@ class Code(SlipBlock):
         return isinstance(other, Code) and self.nodes == other.nodes
 
 
+def _scan_templating(exprs) -> bool:
+    """Scan expressions the way template expansion walks them (groups, list and dict literals)."""
+    for expr in exprs:
+        if not isinstance(expr, list):
+            continue
+        for term in expr:
+            if isinstance(term, Group):
+                if term.splice_kind is not None or term.has_templating:
+                    return True
+            elif isinstance(term, List):
+                if term.has_templating:
+                    return True
+            elif type(term) is tuple and len(term) == 2 and term[0] == "dict":
+                if _scan_templating(term[1]):
+                    return True
+    return False
+
+
 class List(SlipBlock):
     """Represents a SLIP list literal (`#[...]`).
 
@@ -483,6 +619,8 @@ class List(SlipBlock):
     expressions are run and their results collected into a new list of values.
     """
 
+    _kind = KIND_LIST
+
     def __init__(self, ast_nodes: List[Any]):
         super().__init__(ast_nodes)
 
@@ -496,6 +634,8 @@ class List(SlipBlock):
 class ByteStream(SlipBlock):
     """Represents a typed byte stream literal like 'u8#[...]', carrying unevaluated AST nodes."""
 
+    _kind = KIND_BYTE_STREAM
+
     def __init__(self, elem_type: str, ast_nodes: List[Any]):
         super().__init__(ast_nodes)
         self.elem_type = elem_type  # e.g., 'u8', 'i16', 'f32', 'b1'
@@ -512,6 +652,8 @@ class ByteStream(SlipBlock):
 
 
 class Sig:
+    _kind = KIND_SIG
+
     def __init__(
         self,
         positional: List[str],
@@ -529,6 +671,26 @@ class Sig:
     def __repr__(self) -> str:
         return f"Sig(pos={self.positional!r}, kw={self.keywords!r}, rest={self.rest!r}, ret={self.return_annotation!r}, where={self.where!r})"
 
+    def merge_key(self) -> Any:
+        """
+        Dict key identifying this signature when merging generic-function methods.
+
+        A tuple of the parts (keyword order kept, it is parameter order); falls
+        back to repr() when a part is unhashable, e.g. a `where` Code block.
+        """
+        key = (
+            tuple(self.positional or ()),
+            tuple((self.keywords or {}).items()),
+            self.rest,
+            self.return_annotation,
+            self.where,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return repr(self)
+        return key
+
     def __eq__(self, other):
         return isinstance(other, Sig) and (
             self.positional == other.positional
@@ -562,6 +724,8 @@ class SlipFunction(SlipCallable):
         self.body = body
         self.closure = closure
         self.meta: Dict[str, Any] = {}
+        if isinstance(closure, Scope):
+            closure._mark_captured()
 
     def __repr__(self) -> str:
         from slip.slip_printer import Printer
@@ -576,20 +740,75 @@ class SlipFunction(SlipCallable):
         # NOTE: closure comparison is intentionally omitted.
         return self.args == other.args and self.body == other.body
 
+    def is_zero_arity(self) -> bool:
+        """True if the function takes no arguments (per its Sig type, else its arg list)."""
+        s = self.meta.get("type")
+        if isinstance(s, Sig):
+            return len(s.positional) + len(s.keywords) == 0 and s.rest is None
+        return isinstance(self.args, Code) and len(self.args.nodes) == 0
+
 
 class GenericFunction(SlipCallable):
     def __init__(self, name: Optional[str] = None):
         self.name = name
         self.methods: List[SlipFunction] = []
         self.meta: Dict[str, Any] = {}
+        # Shape of the method set used by dispatch fast paths:
+        # 'plain-no-sig' (no typed parameters, `|where` or guards on any method), 'mixed', or
+        # None when it needs recomputing after the method set changed.
+        self._homogeneous_kind: Optional[str] = None
+        # Whether any method takes no arguments (argument auto-call), or None when
+        # it needs recomputing after the method set changed.
+        self._has_zero_arity: Optional[bool] = None
 
     def add_method(self, fn: SlipFunction):
         self.methods.append(fn)
+        self._homogeneous_kind = None
+        self._has_zero_arity = None
+
+    def has_zero_arity_method(self) -> bool:
+        """Whether any method is zero-arity, computed once per change of the method set."""
+        zero = self._has_zero_arity
+        if zero is None:
+            zero = self._has_zero_arity = any(m.is_zero_arity() for m in self.methods)
+        return zero
+
+    def homogeneous_kind(self) -> str:
+        """Classify the method set once per change; see `_homogeneous_kind`."""
+        kind = self._homogeneous_kind
+        if kind is None:
+            kind = "plain-no-sig"
+            for m in self.methods:
+                meta = getattr(m, "meta", None) or {}
+                sig = meta.get("type")
+                if meta.get("guards") or (
+                    isinstance(sig, Sig) and (sig.keywords or sig.where is not None)
+                ):
+                    kind = "mixed"
+                    break
+            self._homogeneous_kind = kind
+        return kind
 
     def __repr__(self) -> str:
         return f"<GenericFunction name={self.name!r} methods={len(self.methods)}>"
 
 
+_RETURN_STATUS = sys.intern("return")
+_INJECT = sys.intern("inject")
+_SPLICE = sys.intern("splice")
+
+
+def _is_return_status(status: Any) -> bool:
+    """True for the legacy `return` status: a PathLiteral of the single name `return`."""
+    if type(status) is not PathLiteral:
+        return False
+    inner = status.inner
+    if type(inner) is not GetPath:
+        return False
+    segs = inner.segments
+    return len(segs) == 1 and type(segs[0]) is Name and segs[0].text is _RETURN_STATUS
+
+
 class Response:
     """Represents a structured outcome from a function call (`response ...`)."""
 
@@ -597,6 +816,16 @@ class Response:
         self.status = status
         self.value = value
 
+    @property
+    def status(self) -> "PathLiteral":
+        return self._status
+
+    @status.setter
+    def status(self, status: "PathLiteral") -> None:
+        # Classify once here so the interpreter's return check is a flag load.
+        self._status = status
+        self._is_return = _is_return_status(status)
+
     def __repr__(self) -> str:
         from slip.slip_printer import Printer
 
@@ -682,6 +911,8 @@ class Cell:
         self.inputs = inputs
         self.body = body
         self.closure = closure
+        if isinstance(closure, Scope):
+            closure._mark_captured()
 
     def __repr__(self) -> str:
         return f"<Cell inputs={list(self.inputs.keys())!r}>"
@@ -699,6 +930,8 @@ class PipedPath(PathSegment):
     to a GetPath but signals the evaluator to perform an implicit-pipe call
     when it appears in expression position #2."""
 
+    _kind = KIND_PIPED_PATH
+
     def __init__(self, segments: List[PathSegment], meta: Optional["Group"] = None):
         if not segments:
             raise ValueError("PipedPath must have at least one segment.")
@@ -731,6 +964,8 @@ class PipedPath(PathSegment):
 class MultiSetPath(PathSegment):
     """Represents the left-hand pattern `[a, b.c]:` used for destructuring assignment."""
 
+    _kind = KIND_MULTI_SET_PATH
+
     def __init__(self, targets: List["SetPath"]):
         if not targets:
             raise ValueError("MultiSetPath must contain at least one SetPath target.")
@@ -752,6 +987,8 @@ class MultiSetPath(PathSegment):
 class GetPath:
     """Represents a SLIP get-path, an instruction to look up a value."""
 
+    _kind = KIND_GET_PATH
+
     def __init__(self, segments: List[PathSegment], meta: Optional["Group"] = None):
         if not segments:
             raise ValueError("GetPath must have at least one segment.")
@@ -787,6 +1024,8 @@ class GetPath:
 class PathLiteral:
     """Represents a quoted path value written with backticks. The inner may be any path-shaped object."""
 
+    _kind = KIND_PATH_LITERAL
+
     def __init__(self, inner: "GetPath | SetPath | DelPath | PipedPath | MultiSetPath"):
         self.inner = inner
         self._str_repr: Optional[str] = None
@@ -818,6 +1057,8 @@ class PathLiteral:
 class DelPath:
     """Represents a SLIP del-path (~path), an instruction to delete a binding."""
 
+    _kind = KIND_DEL_PATH
+
     def __init__(self, path: "GetPath"):
         self.path = path
 
@@ -839,6 +1080,8 @@ class SetPath:
     This is the data type representation for an assignment target.
     """
 
+    _kind = KIND_SET_PATH
+
     def __init__(self, segments: List[PathSegment], meta: Optional["Group"] = None):
         if not segments:
             raise ValueError("SetPath must have at least one segment.")
@@ -874,6 +1117,8 @@ class SetPath:
 class PostPath:
     """Represents a SLIP post-path, e.g., 'url<-', used as the head of a POST expression."""
 
+    _kind = KIND_POST_PATH
+
     def __init__(self, segments: List[PathSegment], meta: Optional["Group"] = None):
         if not segments:
             raise ValueError("PostPath must have at least one segment.")
@@ -914,7 +1159,16 @@ class Name(PathSegment):
     """A name segment in a path, e.g., 'user' in `user.name`."""
 
     def __init__(self, text: str):
+        if isinstance(text, str):
+            # Interned as exact str (subclasses such as IString are converted), so
+            # the evaluator can test reserved names by identity.
+            text = sys.intern(str(text))
+            # Lookup key: leading-dot names like ".outcome" resolve as "outcome".
+            key = sys.intern(text[1:]) if text.startswith(".") and len(text) > 1 else text
+        else:
+            key = text
         self.text = text
+        self.key = key
 
     def __repr__(self) -> str:
         return f"Name<{self.text!r}>"
@@ -972,6 +1226,13 @@ class FilterQuery(PathSegment):
         self.rhs_ast = rhs_ast
         self.predicate_ast = predicate_ast
 
+    @staticmethod
+    def legacy_predicate(operator: str, rhs_ast: Any) -> List[Any]:
+        """Predicate chain for the legacy `[op rhs]` shorthand: `[op, *rhs]`."""
+        return [GetPath([Name(operator)])] + (
+            rhs_ast if isinstance(rhs_ast, list) else [rhs_ast]
+        )
+
     def __repr__(self) -> str:
         if self.predicate_ast is not None:
             return f"FilterQuery(pred={self.predicate_ast!r})"
@@ -992,12 +1253,32 @@ class Group(SlipBlock, PathSegment):
     Also represents a group AST node that can be manipulated.
     """
 
+    _kind = KIND_GROUP
+
     def __init__(self, ast_nodes: List[Any]):
         super().__init__(ast_nodes)
 
     def __repr__(self) -> str:
         return f"Group({self.nodes!r})"
 
+    @property
+    def splice_kind(self) -> Optional[str]:
+        """'inject' or 'splice' if this group is an `(inject X)` / `(splice X)` form, else None."""
+        d = self.__dict__
+        if "_splice_kind" in d:
+            return d["_splice_kind"]
+        kind = None
+        if len(self.nodes) == 1:
+            inner = self.nodes[0]
+            if inner and isinstance(inner[0], GetPath):
+                segs = inner[0].segments
+                if len(segs) == 1 and isinstance(segs[0], Name):
+                    text = segs[0].text
+                    if text is _INJECT or text is _SPLICE:
+                        kind = text
+        d["_splice_kind"] = kind
+        return kind
+
     def __eq__(self, other):
         return isinstance(other, Group) and self.nodes == other.nodes
 
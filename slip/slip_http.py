@@ -1,9 +1,13 @@
 import asyncio
+import functools
 from typing import Optional, Dict, Any
 import os
 import sys
 import httpx
 
+from slip.slip_datatypes import IString as _IStr, PathLiteral as _PL, GetPath as _GP, Name as _Name
+from slip.slip_serialize import serialize as _serialize, detect_format as _detect_format
+
 def normalize_response_mode(cfg: dict) -> Optional[str]:
     """
     Returns one of 'lite' | 'full' | 'none' | None based on cfg['response-mode'] (or legacy flags).
@@ -19,8 +23,6 @@ def normalize_response_mode(cfg: dict) -> Optional[str]:
             return 'full'
         return None
 
-    from slip.slip_datatypes import IString as _IStr, PathLiteral as _PL, GetPath as _GP, Name as _Name
-
     match mode:
         case str() | _IStr():
             s = str(mode).strip().strip('`').lower()
@@ -41,6 +43,62 @@ def normalize_response_mode(cfg: dict) -> Optional[str]:
         case _:
             return None
 
+def package_response(raw: Any, mode: Optional[str]) -> Any:
+    """
+    Shape a raw (status, value, headers) tuple for the given response-mode.
+
+    `lite` -> [status, value]; `full` -> {status, value, meta: {headers}} with lowercased
+    header keys. Anything else (including plain deserialized bodies) is returned as-is.
+    """
+    if mode not in ('lite', 'full') or not (isinstance(raw, tuple) and len(raw) == 3):
+        return raw
+    status, value, headers = raw
+    if mode == 'lite':
+        return [status, value]
+    norm_headers = headers
+    try:
+        items = headers.items() if hasattr(headers, 'items') else []
+        norm_headers = {str(k).lower(): v for k, v in items}
+    except Exception:
+        pass
+    return {
+        'status': status,
+        'value': value,
+        'meta': {'headers': norm_headers},
+    }
+
+@functools.lru_cache(maxsize=128)
+def _format_for_content_type(ctype: Optional[str]) -> Optional[str]:
+    return _detect_format(ctype)
+
+def prepare_payload(value: Any, cfg: dict) -> Any:
+    """
+    Serialize a write body per cfg's content-type, updating cfg['headers'] in place.
+
+    The content-type is promoted into a Content-Type header; dict/list bodies with no
+    content-type default to JSON. Unknown formats send strings/bytes as-is, else str(value).
+    """
+    ctype = cfg.get('content-type') or cfg.get('content_type')
+    headers = dict(cfg.get('headers', {}))
+    if ctype:
+        headers['Content-Type'] = ctype
+        cfg['headers'] = headers
+    # Plain-str content types repeat heavily; other values (e.g. IString) skip the cache.
+    if ctype is None or type(ctype) is str:
+        fmt = _format_for_content_type(ctype)
+    else:
+        fmt = _detect_format(ctype)
+    if fmt is None and isinstance(value, (dict, list)):
+        fmt = 'json'
+        headers.setdefault('Content-Type', 'application/json')
+        cfg['headers'] = headers
+    if fmt is not None:
+        try:
+            return _serialize(value, fmt=fmt, pretty=True)
+        except Exception:
+            return str(value)
+    return value if isinstance(value, (str, bytes, bytearray)) else str(value)
+
 async def http_request(method: str, url: str, *, config: Optional[Dict] = None, data: Optional[str] = None) -> Any:
     """
     Core HTTP helper.
@@ -7,7 +7,11 @@ import inspect
 import sys
 import os
 import re
+import struct
 import collections.abc
+import itertools
+import operator
+import weakref
 from typing import Any, List, Optional, Union, Tuple, Dict
 from textwrap import dedent
 
@@ -41,26 +45,116 @@ from slip.slip_datatypes import (
     MultiSetPath,
     Ref,
     Cell,
+    ReturnSignal,
+    IdentityBoundary,
+    This,
+    node_kind,
+    KIND_PIPED_PATH,
+    KIND_PATH_LITERAL,
+    KIND_GET_PATH,
+    KIND_GROUP,
+    KIND_CODE,
+    KIND_NONE,
+    KIND_SET_PATH,
+    KIND_DEL_PATH,
+    KIND_POST_PATH,
+    KIND_MULTI_SET_PATH,
+    _INJECT,
+    _SPLICE,
 )
 
 
 # Helper: identify and unwrap control‑flow ReturnSignal
 def is_return(x) -> bool:
     # Use a dedicated ReturnSignal type for control flow.
-    try:
-        from slip.slip_datatypes import ReturnSignal
-    except Exception:
-        return False
     return isinstance(x, ReturnSignal)
 
 
 def unwrap_return(x):
-    return x.value if is_return(x) else x
+    # Inlined is_return: this runs on every predicate and assignment result.
+    return x.value if isinstance(x, ReturnSignal) else x
+
+
+def _unwrap_return_response(v):
+    """Unwrap a legacy `Response(`return`, value)` sentinel; anything else is returned as-is."""
+    if type(v) is Response and v._is_return:
+        return v.value
+    return v
+
+
+# Debug switches, read once at import (see _refresh_debug_flags to re-read them).
+_SLIP_DEBUG = bool(os.environ.get("SLIP_DEBUG"))
+_SLIP_PRUNE_DEBUG = bool(os.environ.get("SLIP_PRUNE_DEBUG"))
+
+
+def _debug_enabled() -> bool:
+    """Whether SLIP_DEBUG tracing is on (test it before building _dbg arguments)."""
+    return _SLIP_DEBUG
+
+
+def _refresh_debug_flags() -> None:
+    """Re-read SLIP_DEBUG / SLIP_PRUNE_DEBUG from the environment."""
+    global _SLIP_DEBUG, _SLIP_PRUNE_DEBUG
+    _SLIP_DEBUG = bool(os.environ.get("SLIP_DEBUG"))
+    _SLIP_PRUNE_DEBUG = bool(os.environ.get("SLIP_PRUNE_DEBUG"))
+
+
+# Reserved names, compared by identity (Name interns its text).
+_THIS = sys.intern("this")
+_I = sys.intern("i")
+
+# Sentinel: the pipe loop has not evaluated the term after the operator yet.
+_NOT_PEEKED = object()
+
+# Sentinel: Evaluator._eval_sync could not evaluate the node without awaiting.
+_NOT_SYNC = object()
+
+# Sentinel: dict.pop default for "key was not present".
+_MISSING = object()
+
+# Path "resolve program" opcodes (see PathResolver._resolve_program).
+_OP_NAME = 0  # (op, key, raw_text): plain name lookup; key is dot-normalized
+_OP_PARENT = 1  # (op, None, None): step to the prototype parent
+_OP_FILTER = 2  # (op, segment, None): apply a filter query
+_OP_KEY = 3  # (op, segment, None): evaluate the segment's key (index/slice/group)
+
+# Multi-byte ByteStream element types: (struct code, converter, unsigned mask).
+# Unsigned values are masked; signed/float values are range-checked by struct.
+_BYTESTREAM_FORMATS = {
+    "u16": ("H", int, 0xFFFF),
+    "i16": ("h", int, None),
+    "u32": ("I", int, 0xFFFFFFFF),
+    "i32": ("i", int, None),
+    "u64": ("Q", int, 0xFFFFFFFFFFFFFFFF),
+    "i64": ("q", int, None),
+    "f32": ("f", float, None),
+    "f64": ("d", float, None),
+}
+
+# Block program opcodes (see Evaluator._exec_block).
+_BC_LITERAL = 0  # (op, value, None): a lone primitive literal; evaluates to itself
+_BC_EXPR = 1  # (op, terms, plan): any other expression, run through _eval_expr
+_BC_LITERAL_TYPES = frozenset((int, float, bool, str, bytes, type(None)))
+# Nodes _eval returns unchanged (see Evaluator._eval_sync).
+_SYNC_VALUE_TYPES = _BC_LITERAL_TYPES | {PathLiteral}
+
+# Locator scheme prefixes, as tuples so each test is a single startswith call.
+_HTTP_SCHEMES = ("http://", "https://")
+_FILE_SCHEMES = ("file://",)
+_LOCATOR_SCHEMES = _FILE_SCHEMES + _HTTP_SCHEMES
+
+# http(s) token canonicalization in one scan: cut at the first '#' or '[', and when the
+# URL has a path, also at the first '.' after its first '/' (a dot-chained SLIP name).
+_HTTP_TOKEN_RE = re.compile(r"(?P<path>[^#\[]*?://[^/#\[]*/[^.#\[]*)|[^#\[]*")
+# Trailing SLIP segments after a URL's first path slash, matched from just past '://':
+# a '.' before any '#', or a '[' anywhere.
+_HTTP_TRAILING_RE = re.compile(r"[^/]*/(?:[^#]*?\.|.*\[)", re.DOTALL)
 
 
 # Global registry for christening Scope types
 TYPE_REGISTRY: Dict[str, int] = {}
-_next_type_id = 1
+# Source of fresh type ids (shared with the runtime's generated prototypes).
+_type_id_counter = itertools.count(1)
 
 
 def _is_list_like(value) -> bool:
@@ -69,8 +163,138 @@ def _is_list_like(value) -> bool:
     )
 
 
+# Exact-type fast path for dispatch typing; subclasses and other values fall
+# through to the isinstance chain in _type_name_of. Only types whose answer does
+# not depend on the instance belong here (a Scope can bind `realize`, so it can't).
+_EXACT_PRIMITIVE_TYPE_NAMES: Dict[type, str] = {
+    type(None): "none",
+    bool: "boolean",
+    int: "int",
+    float: "float",
+    IString: "i-string",
+    str: "string",
+    list: "list",
+    dict: "dict",
+    GetPath: "path",
+    SetPath: "path",
+    DelPath: "path",
+    PipedPath: "path",
+    PathLiteral: "path",
+    MultiSetPath: "path",
+    SlipFunction: "function",
+    GenericFunction: "function",
+    Code: "code",
+}
+
+
+def _type_name_of(val: object) -> str:
+    """Primitive type name of a value for dispatch typing (mirrors StdLib._type_of)."""
+    name = _EXACT_PRIMITIVE_TYPE_NAMES.get(type(val))
+    if name is not None:
+        return name
+    # Internal filtered selections behave as list for dispatch typing.
+    try:
+        if hasattr(val, "realize") and callable(getattr(val, "realize")):
+            return "list"
+    except Exception:
+        pass
+    if val is None:
+        return "none"
+    if isinstance(val, bool):
+        return "boolean"
+    if isinstance(val, int):
+        return "int"
+    if isinstance(val, float):
+        return "float"
+    if isinstance(val, IString):
+        return "i-string"
+    if isinstance(val, str):
+        return "string"
+    if isinstance(val, list):
+        return "list"
+    if isinstance(val, collections.abc.Mapping):
+        return "dict"
+    if isinstance(val, Scope):
+        return "scope"
+    if isinstance(val, (GetPath, SetPath, DelPath, PipedPath, PathLiteral, MultiSetPath)):
+        return "path"
+    if isinstance(val, (SlipFunction, GenericFunction)) or callable(val):
+        return "function"
+    if isinstance(val, Code):
+        return "code"
+    # Fallback: treat unknowns as string-like for typing purposes
+    return "string"
+
+
+# Primitive type names recognized in dispatch annotations.
+_ANNOTATION_PRIMITIVES = frozenset(
+    {
+        "int",
+        "float",
+        "string",
+        "i-string",
+        "list",
+        "dict",
+        "scope",
+        "function",
+        "code",
+        "path",
+        "boolean",
+        "none",
+    }
+)
+
+
+def _scope_matches(val_scope: object, target: Scope) -> bool:
+    """
+    Prototype match for dispatch typing: `target` is `val_scope` or one of its parents.
+
+    Scope.meta is always a dict, so the chain is walked with plain dict lookups.
+    """
+    if not isinstance(val_scope, Scope):
+        return False
+    cur = val_scope
+    while isinstance(cur, Scope):
+        if cur is target:
+            return True
+        cur = cur.meta.get("parent")
+    return False
+
+
+def _compile_sig_binder(names: tuple) -> Optional[Any]:
+    """
+    Generate a straight-line `_bind(bindings, args)` for a fixed parameter list.
+
+    Full-arity calls assign each name from a constant index; shorter argument lists
+    fall back to a zip-based update. Returns None when there is nothing to specialize.
+    """
+    if not names:
+        return None
+    lines = [f"    if len(args) >= {len(names)}:"]
+    lines.extend(f"        b[{n!r}] = args[{i}]" for i, n in enumerate(names))
+    lines.append("    else:")
+    lines.append("        b.update(zip(NAMES, args))")
+    src = "def _bind(b, args):\n" + "\n".join(lines) + "\n"
+    ns: Dict[str, Any] = {"NAMES": names}
+    try:
+        exec(compile(src, "<slip-sig-binder>", "exec"), ns)
+    except Exception:
+        return None
+    return ns["_bind"]
+
+
+def _loc_text(node) -> str | None:
+    """Source token text recorded on a node by the transformer, if any."""
+    loc = getattr(node, "loc", None)
+    return loc.get("text") if isinstance(loc, dict) else None
+
+
 def _tmpl_normalize_value(v):
     """Convert SLIP values into plain Python types for template helpers."""
+    # Scalar leaves are the common case; exact-type checks skip the isinstance chain.
+    t = type(v)
+    if t is str or t is int or t is float or t is bool or v is None:
+        return v
     if isinstance(v, Scope):
         return _scope_to_dict(v)
     if isinstance(v, collections.abc.Mapping):
@@ -90,21 +314,370 @@ def _tmpl_normalize_value(v):
     return v
 
 
-def _scope_to_dict(scope: Scope) -> dict:
-    """Flatten the current scope and its parents into a single plain dict."""
-    chain = []
+def _scope_chain_maps(scope: Scope) -> collections.ChainMap:
+    """Bindings of a scope and its parents as a ChainMap (current scope first)."""
+    maps = []
     cur = scope
     while cur is not None:
-        chain.append(cur)
+        maps.append(cur.bindings)
         cur = cur.parent
-    out: dict = {}
-    # Populate from root to current so current bindings override parents
-    for s in reversed(chain):
-        for k, v in s.bindings.items():
-            out[k] = _tmpl_normalize_value(v)
+    return collections.ChainMap(*maps)
+
+
+def _scope_to_dict(scope: Scope) -> dict:
+    """Flatten the current scope and its parents into a single plain dict."""
+    chain = _scope_chain_maps(scope)
+    return {k: _tmpl_normalize_value(chain[k]) for k in chain}
+
+
+# Interpolated strings are split and parsed once per distinct source text and reused.
+_ISTRING_CACHE_MAX = 1024
+_ISTRING_TEMPLATE_CACHE: Dict[str, tuple] = {}
+_ISTRING_EXPR_CACHE: Dict[str, Any] = {}
+_ISTRING_PLACEHOLDER_RE = re.compile(r"\{\{(.*?)\}\}", re.DOTALL)
+_TO_STR_PATH = GetPath([Name("to-str")])
+
+
+# Dict literal entry plans (see _dict_literal_plan), keyed by id() of the
+# expression list; each entry holds the list itself so the id stays valid.
+_DICT_NAME = 0  # (tag, key_text, rhs_terms, sugar, expr): "name: value"
+_DICT_GROUP = 1  # (tag, group, rhs_terms, sugar, expr): "(key-expr): value"
+_DICT_EXPR = 2  # (tag, None, None, None, expr): any other expression
+_DICT_PLAN_CACHE: Dict[int, tuple] = {}
+
+
+def _dict_literal_plan(exprs: list) -> tuple:
+    """
+    Classify the expressions of a `#{...}` literal once per AST node.
+
+    `sugar` is the IString of an `i"..."` value (stored verbatim, not evaluated),
+    or _MISSING when the right-hand side must be evaluated.
+    """
+    hit = _DICT_PLAN_CACHE.get(id(exprs))
+    if hit is not None and hit[0] is exprs:
+        return hit[1]
+    plan = []
+    for expr in exprs:
+        if isinstance(expr, list) and expr and isinstance(expr[0], SetPath):
+            segs = expr[0].segments
+            if len(segs) == 1 and isinstance(segs[0], (Name, Group)):
+                rhs_terms = expr[1:]
+                sugar = _MISSING
+                # Normalize i-string sugar inside dict values:
+                # allow "key: i\"...\"" syntax by treating [GetPath('i'), IString(...)] as a single IString value
+                if (
+                    len(rhs_terms) == 2
+                    and isinstance(rhs_terms[0], GetPath)
+                    and len(rhs_terms[0].segments) == 1
+                    and isinstance(rhs_terms[0].segments[0], Name)
+                    and rhs_terms[0].segments[0].text is _I
+                    and isinstance(rhs_terms[1], IString)
+                ):
+                    sugar = rhs_terms[1]
+                if isinstance(segs[0], Name):
+                    plan.append((_DICT_NAME, segs[0].text, rhs_terms, sugar, expr))
+                else:
+                    plan.append((_DICT_GROUP, segs[0], rhs_terms, sugar, expr))
+                continue
+        plan.append((_DICT_EXPR, None, None, None, expr))
+    plan = tuple(plan)
+    _cache_put(_DICT_PLAN_CACHE, id(exprs), (exprs, plan))
+    return plan
+
+
+def _collect_names(terms, acc: set) -> None:
+    for t in terms:
+        if (
+            isinstance(t, GetPath)
+            and len(t.segments) == 1
+            and isinstance(t.segments[0], Name)
+        ):
+            acc.add(t.segments[0].text)
+        elif isinstance(t, (Group, SlipList)):
+            for expr in t.nodes:
+                _collect_names(expr, acc)
+        elif isinstance(t, list):
+            _collect_names(t, acc)
+
+
+def _copy_expr_terms(terms: list) -> list:
+    """
+    Copy an expression the way template expansion rebuilds it: Group, list literal
+    and dict literal subtrees are new objects (source loc kept), other terms are
+    shared. In-place edits to one Code value then never reach its source literal.
+    """
+    out = []
+    for t in terms:
+        if isinstance(t, (Group, SlipList)):
+            cls = Group if isinstance(t, Group) else SlipList
+            new = cls([_copy_expr_terms(expr) for expr in t.nodes])
+            if hasattr(t, "loc"):
+                try:
+                    new.loc = t.loc
+                except Exception:
+                    pass
+            out.append(new)
+        elif type(t) is tuple and len(t) == 2 and t[0] == "dict":
+            out.append(("dict", [_copy_expr_terms(expr) for expr in t[1]]))
+        else:
+            out.append(t)
     return out
 
 
+def _rhs_names(target: SetPath, terms: list) -> frozenset:
+    """
+    Bare names read by the right-hand side of `target: ...` (terms[1:]), including
+    inside groups and list literals. Cached on the SetPath for this expression.
+    """
+    cached = target.__dict__.get("_rhs_names")
+    if cached is not None and cached[0] is terms:
+        return cached[1]
+    acc: set = set()
+    _collect_names(terms[1:], acc)
+    names = frozenset(acc)
+    target._rhs_names = (terms, names)
+    return names
+
+
+# slip_runtime imports this module, so SlipDict is bound on first use.
+_SLIP_DICT = None
+
+
+def _load_slip_dict() -> type:
+    global _SLIP_DICT
+    from slip.slip_runtime import SlipDict
+
+    _SLIP_DICT = SlipDict
+    return SlipDict
+
+
+# slip_printer imports slip_runtime (and so this module); Printer is bound on first use.
+_PRINTER = None
+
+
+def _load_printer() -> type:
+    global _PRINTER
+    from slip.slip_printer import Printer
+
+    _PRINTER = Printer
+    return Printer
+
+
+def _sig_merge_key(sig) -> Any:
+    """Method-merge key for a method's meta type (see Sig.merge_key)."""
+    return sig.merge_key() if isinstance(sig, Sig) else repr(sig)
+
+
+def _is_multi_set_tuple(value: Any) -> bool:
+    """The legacy ("multi-set", targets) tuple form of a multi-assignment target."""
+    return isinstance(value, tuple) and len(value) > 0 and value[0] == "multi-set"
+
+
+def _dot_name(text: Any) -> bool:
+    return isinstance(text, str) and text.startswith(".") and len(text) > 1
+
+
+def _fold_at(arg_terms: list, i: int) -> Optional[tuple]:
+    """
+    The property chain that folds onto arg_terms[i]: (segs, term_seg_counts) for
+    the run of following get-paths (`.name`, or bare names after a Group/Code
+    base), else None. Depends only on the terms, so it is computed once.
+    """
+    segs = []
+    term_seg_counts = []
+    j = i + 1
+    allow_bare = isinstance(arg_terms[i], (Group, Code))
+    while j < len(arg_terms):
+        t = arg_terms[j]
+        if type(t) is not GetPath:
+            break
+        segs_list = t.segments
+        if not segs_list:
+            break
+
+        # Case 1: single-name get-path
+        if len(segs_list) == 1 and type(segs_list[0]) is Name:
+            name_txt = segs_list[0].text
+            if _dot_name(name_txt):
+                segs.append(Name(name_txt[1:]))
+            elif allow_bare:
+                segs.append(Name(name_txt))
+            else:
+                break
+            term_seg_counts.append(1)
+            j += 1
+            continue
+
+        # Case 2: multi-name get-path immediately after base; fold contiguous names
+        if j == i + 1 and all(type(s) is Name for s in segs_list):
+            if _dot_name(segs_list[0].text) or allow_bare:
+                for s in segs_list:
+                    txt = s.text
+                    segs.append(Name(txt[1:]) if _dot_name(txt) else Name(txt))
+                term_seg_counts.append(len(segs_list))
+                j += 1
+                continue
+
+        break
+    if not segs:
+        return None
+    return tuple(segs), tuple(term_seg_counts)
+
+
+def _fold_layout(arg_terms: list) -> tuple:
+    """
+    Per-position property chains of a call's argument terms (see _fold_at), or
+    () when no argument folds, so the common case evaluates terms one by one.
+    """
+    layout = tuple(_fold_at(arg_terms, i) for i in range(len(arg_terms)))
+    return layout if any(layout) else ()
+
+
+# Special-form heads, classified once per expression (see _expr_plan).
+_SF_NONE = 0
+_SF_LOGICAL_AND = 1  # short-circuiting; args evaluated by _eval_expr
+_SF_LOGICAL_OR = 2
+_SF_MACRO = 3  # if / fn / while / foreach: called with the raw argument terms
+_SF_RETURN = 4  # arity-checked, then called like any function
+_SPECIAL_FORMS = {
+    "logical-and": _SF_LOGICAL_AND,
+    "logical-or": _SF_LOGICAL_OR,
+    "if": _SF_MACRO,
+    "fn": _SF_MACRO,
+    "while": _SF_MACRO,
+    "foreach": _SF_MACRO,
+    "return": _SF_RETURN,
+}
+
+
+def _expr_plan(terms: list) -> tuple:
+    """
+    Static facts about an expression that _eval_expr would otherwise rescan on
+    every run: (head_name, split_at, rhs_plan, arg_layout, special).
+    head_name is the text of a one-segment Name head (stack frame names), else
+    None; split_at is the index of the first PipedPath after the head, else
+    None; rhs_plan is the plan of the value terms of an assignment, else None;
+    arg_layout is the _fold_layout of the prefix-call arguments; special is the
+    head's _SF_* special-form class.
+    """
+    head = terms[0]
+    head_name = None
+    if (
+        type(head) is GetPath
+        and len(head.segments) == 1
+        and type(head.segments[0]) is Name
+    ):
+        head_name = head.segments[0].text
+    split_at = None
+    for idx in range(1, len(terms)):
+        # Only actual PipedPath terms start an infix chain. A PipedPathLiteral is a value.
+        if type(terms[idx]) is PipedPath:
+            split_at = idx
+            break
+    rhs_plan = None
+    if isinstance(head, SetPath) and len(terms) > 1:
+        rhs_plan = _expr_plan(terms[1:])
+    arg_layout = _fold_layout(terms[1 : split_at if split_at is not None else len(terms)])
+    special = _SPECIAL_FORMS.get(head_name, _SF_NONE)
+    return head_name, split_at, rhs_plan, arg_layout, special
+
+
+_SLIP_FUNCTION_TYPES = (SlipFunction, GenericFunction)
+
+
+class _PendingAwait:
+    """A call left for the caller to await (see Evaluator._call_sync)."""
+
+    __slots__ = ("awaitable",)
+
+    def __init__(self, awaitable):
+        self.awaitable = awaitable
+
+
+# Unwrap steps allowed when resolving an operator alias before reporting a cycle.
+_OP_RESOLVE_MAX_STEPS = 16
+
+
+def _is_call_primitive(fn) -> bool:
+    """True for StdLib's `call` builtin, whose arguments are never auto-invoked."""
+    try:
+        return (
+            getattr(fn, "__name__", "") == "_call"
+            and inspect.ismethod(fn)
+            and type(fn.__self__).__name__ == "StdLib"
+        )
+    except Exception:
+        return False
+
+
+def _root_div_path(term) -> GetPath:
+    """The `/` operator path for a Root-only GetPath (the ambiguous `/` token)."""
+    return GetPath([Name("/")], getattr(term, "meta", None))
+
+
+# Entries kept for callables that cannot be weak cache keys; least recently used go first.
+_CALLABLE_STRONG_CACHE_MAX = 64
+
+
+def _cache_put(cache: dict, key, value):
+    if len(cache) >= _ISTRING_CACHE_MAX:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+# Hole values that need the full expression path: callables (auto-called),
+# refs/cells (reduced) and write targets (dynamic assignment).
+_HOLE_SLOW_TYPES = (SlipCallable, SetPath, MultiSetPath, tuple, Ref, Cell)
+
+
+def _simple_hole_path(nodes: list) -> Optional[GetPath]:
+    """The GetPath of an i-string hole that is just a bare name, else None."""
+    if len(nodes) != 1 or not isinstance(nodes[0], list) or len(nodes[0]) != 1:
+        return None
+    term = nodes[0][0]
+    if type(term) is not GetPath or term.meta is not None or len(term.segments) != 1:
+        return None
+    seg = term.segments[0]
+    if type(seg) is not Name or not isinstance(seg.text, str) or ":" in seg.text:
+        return None
+    return term
+
+
+def _compile_istring_template(raw: str) -> tuple:
+    """
+    Split an i-string into alternating static text and expression source.
+
+    Returns (chunks, exprs) where len(chunks) == len(exprs) + 1; empty placeholders
+    are folded into the surrounding static text.
+    """
+    try:
+        return _ISTRING_TEMPLATE_CACHE[raw]
+    except KeyError:
+        pass
+    text = dedent(raw)
+    if text.startswith("\n"):
+        text = text[1:]
+    if text.endswith("\n"):
+        text = text[:-1]
+
+    chunks: List[str] = []
+    exprs: List[str] = []
+    pending = []
+    pos = 0
+    for match in _ISTRING_PLACEHOLDER_RE.finditer(text):
+        pending.append(text[pos:match.start()])
+        expr_text = match.group(1).strip()
+        if expr_text:
+            chunks.append("".join(pending))
+            exprs.append(expr_text)
+            pending = []
+        pos = match.end()
+    pending.append(text[pos:])
+    chunks.append("".join(pending))
+    return _cache_put(_ISTRING_TEMPLATE_CACHE, raw, (tuple(chunks), tuple(exprs)))
+
+
 class View:
     """Simple placeholder for lazy query results (to be materialized later)."""
 
@@ -158,21 +731,65 @@ class _Selection(collections.abc.Sequence):
         return False
 
 
+# type -> public class-level attribute names that may be non-callable on an instance.
+_OVERLAY_ATTR_CACHE: "weakref.WeakKeyDictionary[type, tuple[str, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _overlay_attr_names(item) -> list:
+    """
+    Public attribute names of a plain object, in dir() order, without calling dir() per item.
+
+    Class attributes are scanned once per type (plain methods are dropped there);
+    instance __dict__ names are added per item. Types with a custom __dir__ use dir().
+    """
+    cls = type(item)
+    if cls.__dir__ is not object.__dir__:
+        return [n for n in dir(item) if not n.startswith("_")]
+    names = _OVERLAY_ATTR_CACHE.get(cls)
+    if names is None:
+        names = tuple(
+            n
+            for n in dir(cls)
+            if not n.startswith("_")
+            and not inspect.isfunction(inspect.getattr_static(cls, n, None))
+        )
+        try:
+            _OVERLAY_ATTR_CACHE[cls] = names
+        except TypeError:
+            pass
+    inst = getattr(item, "__dict__", None)
+    if not inst:
+        return list(names)
+    extra = [n for n in inst if isinstance(n, str) and not n.startswith("_") and n not in names]
+    if not extra:
+        return list(names)
+    return sorted(set(names).union(extra))
+
+
 class PathResolver:
     """Handles all path traversal and resolution logic."""
 
     def __init__(self, evaluator: "Evaluator"):
         self.evaluator = evaluator
 
-    def _build_item_overlay_scope(self, item, parent: Scope) -> Scope:
+    def _build_item_overlay_scope(self, item, parent: Scope, preloaded=None) -> Scope:
+        """
+        Scope exposing an item's fields for predicate evaluation, parented to `parent`.
+
+        `preloaded` is an optional (field_name, value) pair the caller has already read
+        from the item; plain objects reuse it instead of fetching that attribute again.
+        """
         s = Scope(parent=parent)
         try:
-            # Scope-like
-            from slip.slip_datatypes import Scope as _Scope
-
-            if isinstance(item, _Scope):
-                for k, v in item.bindings.items():
-                    s[k] = v
+            # Scope-like (and plain str-keyed dicts): read through to the item instead of
+            # copying it. Writes made while evaluating the predicate land in the front
+            # dict of the ChainMap and never touch the item.
+            if isinstance(item, Scope):
+                s.bindings = collections.ChainMap({}, item.bindings)
+            elif type(item) is dict and all(type(k) is str for k in item):
+                s.bindings = collections.ChainMap({}, item)
             # Mapping-like
             elif isinstance(item, collections.abc.Mapping):
                 for k in item.keys():
@@ -183,11 +800,10 @@ class PathResolver:
                         continue
             else:
                 # Plain object: expose public attributes (non-callables, no _ prefix)
-                for name in dir(item):
-                    if name.startswith("_"):
-                        continue
+                pre_name, pre_val = preloaded if preloaded is not None else (None, None)
+                for name in _overlay_attr_names(item):
                     try:
-                        v = getattr(item, name)
+                        v = pre_val if name == pre_name else getattr(item, name)
                         if callable(v):
                             continue
                         s[name] = v
@@ -199,45 +815,37 @@ class PathResolver:
 
     def _normalize_relative_predicate_terms(self, terms):
         # Strip a leading '.' in single-name GetPath nodes to support .hp syntax.
-        from slip.slip_datatypes import (
-            GetPath as _GP,
-            Name as _Name,
-            Group as _Group,
-            List as _List,
-            Parent as _Parent,
-        )
-
         def norm_term(t):
-            if isinstance(t, _GP) and t.segments and isinstance(t.segments[0], _Name):
+            if isinstance(t, GetPath) and t.segments and isinstance(t.segments[0], Name):
                 txt = t.segments[0].text
                 if isinstance(txt, str):
                     if txt.startswith(".") and len(txt) > 1:
                         # .field -> field (item-relative; evaluate in overlay)
-                        new_first = _Name(txt[1:])
+                        new_first = Name(t.segments[0].key)
                         segs = [new_first] + list(t.segments[1:])
-                        return _GP(segs, getattr(t, "meta", None))
+                        return GetPath(segs, getattr(t, "meta", None))
                     else:
                         # Bare name -> force lexical: rewrite to ../name so overlay cannot shadow it
-                        segs = [_Parent, _Name(txt)] + list(t.segments[1:])
-                        return _GP(segs, getattr(t, "meta", None))
+                        segs = [Parent, Name(txt)] + list(t.segments[1:])
+                        return GetPath(segs, getattr(t, "meta", None))
                 return t
-            if isinstance(t, _Group):
+            if isinstance(t, Group):
                 # Recurse into nested expression lists
                 inner = []
                 for expr in t.nodes:
                     inner.append([norm_term(x) for x in expr])
-                g = _Group(inner)
+                g = Group(inner)
                 try:
                     g.loc = getattr(t, "loc", None)
                 except Exception:
                     pass
                 return g
-            if isinstance(t, _List):
+            if isinstance(t, SlipList):
                 # Recurse into list literal expressions
                 inner = []
                 for expr in t.nodes:
                     inner.append([norm_term(x) for x in expr])
-                l = _List(inner)
+                l = SlipList(inner)
                 try:
                     l.loc = getattr(t, "loc", None)
                 except Exception:
@@ -248,16 +856,14 @@ class PathResolver:
         return [norm_term(x) for x in terms]
 
     def _split_top_level_and(self, terms):
-        from slip.slip_datatypes import GetPath as _GP, Name as _Name, Parent as _Parent
-
         if not isinstance(terms, list):
             return None
         for i, t in enumerate(terms):
-            if isinstance(t, _GP):
+            if isinstance(t, GetPath):
                 segs = getattr(t, "segments", [])
                 if (
                     len(segs) == 1
-                    and isinstance(segs[0], _Name)
+                    and isinstance(segs[0], Name)
                     and segs[0].text in ("and", "logical-and")
                 ):
                     left = terms[:i]
@@ -265,8 +871,8 @@ class PathResolver:
                     return left, right
                 if (
                     len(segs) == 2
-                    and segs[0] is _Parent
-                    and isinstance(segs[1], _Name)
+                    and segs[0] is Parent
+                    and isinstance(segs[1], Name)
                     and segs[1].text in ("and", "logical-and")
                 ):
                     left = terms[:i]
@@ -275,9 +881,7 @@ class PathResolver:
         return None
 
     def _read_field(self, item, field_name):
-        from slip.slip_datatypes import This as _This
-
-        if isinstance(item, _This):
+        if isinstance(item, This):
             item = item.receiver
         if isinstance(item, Scope):
             return item[field_name]
@@ -285,10 +889,16 @@ class PathResolver:
             return item[field_name]
         return getattr(item, field_name)
 
-    def _write_field(self, owner, field_name, new_val):
-        from slip.slip_datatypes import This as _This
+    def _field_reader(self, item_type: type, field_name):
+        """A reader equivalent to _read_field for items of exactly `item_type`."""
+        if issubclass(item_type, This):
+            return lambda item: self._read_field(item, field_name)
+        if issubclass(item_type, (Scope, collections.abc.Mapping)):
+            return operator.itemgetter(field_name)
+        return lambda item: getattr(item, field_name)
 
-        if isinstance(owner, _This):
+    def _write_field(self, owner, field_name, new_val):
+        if isinstance(owner, This):
             owner = owner.receiver
         if isinstance(owner, Scope):
             owner[field_name] = new_val
@@ -302,6 +912,30 @@ class PathResolver:
             return
         setattr(owner, field_name, new_val)
 
+    def _field_writer(self, owner_type: type, field_name):
+        """A writer equivalent to _write_field for owners of exactly `owner_type`."""
+        if issubclass(owner_type, This):
+            return lambda owner, val: self._write_field(owner, field_name, val)
+        if issubclass(owner_type, Scope) or (
+            issubclass(owner_type, collections.abc.Mapping)
+            and hasattr(owner_type, "__setitem__")
+        ):
+            return lambda owner, val: owner.__setitem__(field_name, val)
+        return lambda owner, val: setattr(owner, field_name, val)
+
+    def _field_write_fn(self, field_name):
+        """Return write(owner, value), choosing the write strategy once per owner type."""
+        writers: dict = {}
+
+        def write(owner, new_val):
+            owner_type = type(owner)
+            fn = writers.get(owner_type)
+            if fn is None:
+                fn = writers[owner_type] = self._field_writer(owner_type, field_name)
+            fn(owner, new_val)
+
+        return write
+
     async def _collect_vector_targets(
         self,
         base_container,
@@ -317,95 +951,208 @@ class PathResolver:
           - include_old=False -> list of owners
         """
         out = []
+        # The predicate depends only on the filter; build it once for all items.
+        matches = self._item_predicate(filt, scope, field=field_name)
+        # Field readers are chosen once per item type rather than re-tested per item.
+        readers: dict = {}
         for item in base_container:
+            item_type = type(item)
+            read = readers.get(item_type)
+            if read is None:
+                read = readers[item_type] = self._field_reader(item_type, field_name)
             try:
-                val = self._read_field(item, field_name)
+                val = read(item)
             except Exception:
                 continue
-            try:
-                keep = await self._predicate_matches(
-                    item, filt, scope, fallback_base=val
-                )
-            except Exception:
-                keep = False
-            if keep:
+            if await matches(item, val):
                 out.append((item, val) if include_old else item)
         return out
 
-    async def _predicate_matches(
-        self, item, filt: FilterQuery, scope: Scope, *, fallback_base=None
-    ) -> bool:
-        """
-        Normalize terms (dot/bare names), split top-level 'and', evaluate in item overlay,
-        unwrap 'return' Responses, and fallback to legacy pipeline style using fallback_base.
-        """
-        # Build predicate terms from FilterQuery
+    def _compile_predicate_plan(self, filt: FilterQuery) -> tuple:
+        # Build predicate terms from FilterQuery. Parsed filters always carry
+        # predicate_ast; host-built legacy [op rhs] filters are synthesized here, once.
         pred = getattr(filt, "predicate_ast", None)
         if pred is None:
             op = getattr(filt, "operator", None)
-            rhs_ast = getattr(filt, "rhs_ast", None) or []
             if op is None:
-                return False
-            pred = [GetPath([Name(op)])] + (
-                rhs_ast if isinstance(rhs_ast, list) else [rhs_ast]
-            )
-
+                return None, None, None, None
+            pred = FilterQuery.legacy_predicate(op, getattr(filt, "rhs_ast", None) or [])
         try:
             pred_terms = self._normalize_relative_predicate_terms(pred)
-            overlay = self._build_item_overlay_scope(item, scope)
             split = self._split_top_level_and(pred_terms)
-            if split:
-                left_terms, right_terms = split
-                lval = await self.evaluator._eval_expr(left_terms, overlay)
-                lval = unwrap_return(lval)
-                if not lval:
-                    return False
-                rval = await self.evaluator._eval_expr(right_terms, overlay)
-                rval = unwrap_return(rval)
-                return bool(rval)
-            ok_eval = await self.evaluator._eval_expr(pred_terms, overlay)
-            ok_eval = unwrap_return(ok_eval)
-            return bool(ok_eval)
         except Exception:
-            # Legacy pipeline fallback: evaluate as [base] + pred in caller scope
-            base = fallback_base if fallback_base is not None else item
-            try:
-                return bool(await self.evaluator._eval_expr([base] + pred, scope))
-            except Exception:
+            pred_terms, split = None, None
+        return pred, pred_terms, split, self._constant_predicate(pred_terms)
+
+    def _predicate_plan(self, filt: FilterQuery) -> tuple:
+        """
+        Return (pred, normalized_terms, and_split, constant_verdict) for a filter,
+        memoized on the segment. constant_verdict is None unless the predicate is a
+        single literal (see _constant_predicate).
+
+        Normalization and the top-level 'and' split depend only on the predicate AST, so
+        a filter over N items compiles its predicate once instead of N times. The
+        normalized nodes are reused too, which lets their own path plans memoize.
+        """
+        return self._memo_on_path(filt, "_slip_pred_plan", self._compile_predicate_plan)
+
+    @staticmethod
+    def _constant_predicate(pred_terms) -> bool | None:
+        """
+        Verdict of a predicate that is a single scalar literal (e.g. a host-built
+        FilterQuery(None, None, [True])), or None when it depends on the item.
+        """
+        if pred_terms and len(pred_terms) == 1:
+            t = pred_terms[0]
+            if t is None or type(t) in (bool, int, float, str):
+                return bool(t)
+        return None
+
+    def _item_predicate(self, filt: FilterQuery, scope: Scope, plan=None, field=None):
+        """
+        Build `async matches(item, fallback_base=None) -> bool` for one filter application.
+
+        With `field`, callers pass that field's already-read value as fallback_base and
+        the item overlay reuses it rather than reading the field again.
+
+        The and-split/generic choice is made once here, so the per-item path is a single
+        overlay build plus one or two evaluations; errors go to _predicate_fallback.
+        """
+        pred, pred_terms, split, verdict = (
+            plan if plan is not None else self._predicate_plan(filt)
+        )
+        if pred is None:
+
+            async def matches(item, fallback_base=None) -> bool:
                 return False
 
+            return matches
+
+        if verdict is not None:
+
+            async def matches(item, fallback_base=None) -> bool:
+                return verdict
+
+            return matches
+
+        # Bound once here so the per-item closures below use local lookups only.
+        eval_expr = self.evaluator._eval_expr
+        build = self._build_item_overlay_scope
+        fallback = self._predicate_fallback
+        unwrap = unwrap_return
+        if field is None:
+
+            def overlay_for(item, _value):
+                return build(item, scope)
+
+        else:
+
+            def overlay_for(item, value):
+                return build(item, scope, (field, value))
+
+        if pred_terms is None:
+            # Terms could not be normalized: only the legacy pipeline form applies.
+            async def matches(item, fallback_base=None) -> bool:
+                return await fallback(item, fallback_base, pred, scope)
+
+        elif split:
+            left_terms, right_terms = split
+
+            async def matches(item, fallback_base=None) -> bool:
+                try:
+                    overlay = overlay_for(item, fallback_base)
+                    if not unwrap(await eval_expr(left_terms, overlay)):
+                        return False
+                    return bool(unwrap(await eval_expr(right_terms, overlay)))
+                except Exception:
+                    return await fallback(item, fallback_base, pred, scope)
+
+        else:
+
+            async def matches(item, fallback_base=None) -> bool:
+                try:
+                    overlay = overlay_for(item, fallback_base)
+                    return bool(unwrap(await eval_expr(pred_terms, overlay)))
+                except Exception:
+                    return await fallback(item, fallback_base, pred, scope)
+
+        return matches
+
+    async def _predicate_fallback(self, item, fallback_base, pred, scope: Scope) -> bool:
+        # Legacy pipeline fallback: evaluate as [base] + pred in caller scope
+        base = fallback_base if fallback_base is not None else item
+        try:
+            return bool(await self.evaluator._eval_expr([base] + pred, scope))
+        except Exception:
+            return False
+
+    @staticmethod
+    def _name_segment_key(segment: Name) -> Any:
+        # Leading-dot names like ".outcome" after groups are pre-normalized on the node.
+        return segment.key
+
+    async def _name_key(self, segment: Name, scope: Scope) -> Any:
+        return self._name_segment_key(segment)
+
+    async def _index_key(self, segment: Index, scope: Scope) -> Any:
+        # Index.expr_ast is a single expression's term list (e.g. [GetPath(Name("target-id"))]).
+        # Use _eval_expr so it's evaluated as one expression, not misread as a list-of-expressions block.
+        return await self.evaluator._eval_expr(segment.expr_ast, scope)
+
+    @staticmethod
+    def _compute_slice_literals(segment: Slice) -> tuple:
+        """Per endpoint: its int value when it is a bare int literal, else _NOT_PEEKED."""
+        out = []
+        for ast in (segment.start_ast, segment.end_ast):
+            if not ast:
+                out.append(None)
+            elif len(ast) == 1 and type(ast[0]) is int:
+                out.append(ast[0])
+            else:
+                out.append(_NOT_PEEKED)
+        return tuple(out)
+
+    async def _slice_key(self, segment: Slice, scope: Scope) -> Any:
+        # Literal endpoints are read straight off the node; the rest are evaluated in
+        # order. They are not gathered concurrently: the evaluator's call stack and
+        # local-scope bookkeeping are per instance and would interleave.
+        start, end = self._memo_on_path(segment, "_slip_slice_literals", self._compute_slice_literals)
+        if start is _NOT_PEEKED:
+            # Slice start/end ASTs are also single-expression term lists.
+            start = await self.evaluator._eval_expr(segment.start_ast, scope)
+        if end is _NOT_PEEKED:
+            end = await self.evaluator._eval_expr(segment.end_ast, scope)
+        return slice(start, end)
+
+    async def _group_key(self, segment: Group, scope: Scope) -> Any:
+        return await self.evaluator._eval_expr(segment.nodes, scope)
+
+    # Segment type -> key handler name; subclasses resolve through the MRO on first use.
+    _SEGMENT_KEY_HANDLERS: Dict[type, str] = {
+        Name: "_name_key",
+        Index: "_index_key",
+        Slice: "_slice_key",
+        Group: "_group_key",
+    }
+
     async def _get_segment_key(self, segment: PathSegment, scope: Scope) -> Any:
         """Evaluates a path segment to determine the key for a lookup."""
-        match segment:
-            case Name():
-                txt = segment.text
-                # Normalize leading-dot names like ".outcome" after groups into "outcome"
-                if isinstance(txt, str) and txt.startswith(".") and len(txt) > 1:
-                    return txt[1:]
-                return txt
-            case Index():
-                # Index.expr_ast is a single expression's term list (e.g. [GetPath(Name("target-id"))]).
-                # Use _eval_expr so it's evaluated as one expression, not misread as a list-of-expressions block.
-                return await self.evaluator._eval_expr(segment.expr_ast, scope)
-            case Slice():
-                # Slice start/end ASTs are also single-expression term lists.
-                start = (
-                    await self.evaluator._eval_expr(segment.start_ast, scope)
-                    if segment.start_ast
-                    else None
-                )
-                end = (
-                    await self.evaluator._eval_expr(segment.end_ast, scope)
-                    if segment.end_ast
-                    else None
-                )
-                return slice(start, end)
-            case Group():
-                return await self.evaluator._eval_expr(segment.nodes, scope)
-            case _:
+        seg_type = type(segment)
+        if seg_type is Name:
+            return self._name_segment_key(segment)
+        handlers = self._SEGMENT_KEY_HANDLERS
+        handler = handlers.get(seg_type)
+        if handler is None:
+            for base in seg_type.__mro__[1:]:
+                handler = handlers.get(base)
+                if handler is not None:
+                    handlers[seg_type] = handler
+                    break
+            else:
                 raise TypeError(
                     f"Unsupported path segment for key extraction: {type(segment)}"
                 )
+        return await getattr(self, handler)(segment, scope)
 
     def _trim_http_token(self, u: str) -> str:
         return self._canonicalize_http_token(u)
@@ -419,23 +1166,7 @@ class PathResolver:
         and strip dot-chained SLIP name after the first path slash. Preserve trailing colon;
         caller decides to strip when needed.
         """
-        s = u
-        # Cut at first occurrence of known suffix markers
-        cut = len(s)
-        for ch in ("#", "["):
-            idx = s.find(ch)
-            if idx != -1:
-                cut = min(cut, idx)
-        s = s[:cut]
-        # If a dot-chained SLIP name follows the URL path (after the first '/'), trim before the dot.
-        scheme_i = s.find("://")
-        if scheme_i != -1:
-            slash_i = s.find("/", scheme_i + 3)
-            if slash_i != -1:
-                dot_i = s.find(".", slash_i + 1)
-                if dot_i != -1:
-                    s = s[:dot_i]
-        return s
+        return _HTTP_TOKEN_RE.match(u).group(0)
 
     def _http_has_trailing_segments_str(self, u: str) -> bool:
         """
@@ -444,29 +1175,14 @@ class PathResolver:
         scheme_i = u.find("://")
         if scheme_i == -1:
             return False
-        slash_i = u.find("/", scheme_i + 3)
-        if slash_i == -1:
-            return False
-        if u.find("[", slash_i + 1) != -1:
-            return True
-        stop = u.find("#", slash_i + 1)
-        if stop == -1:
-            stop = len(u)
-        return u.find(".", slash_i + 1, stop) != -1
+        return _HTTP_TRAILING_RE.match(u, scheme_i + 3) is not None
 
     def _canonicalize_file_token(self, u: str) -> str:
         """
         Trim inline config '#(...)' and any trailing bracketed query '[...]' from a file:// token.
         Do not touch dots to avoid confusing filename extensions. Preserve trailing colon; caller strips.
         """
-        s = u
-        hash_idx = s.find("#")
-        if hash_idx != -1:
-            s = s[:hash_idx]
-        br_idx = s.find("[")
-        if br_idx != -1:
-            s = s[:br_idx]
-        return s
+        return u.partition("#")[0].partition("[")[0]
 
     def _file_has_trailing_segments_str(self, u: str) -> bool:
         """
@@ -474,6 +1190,32 @@ class PathResolver:
         """
         return "[" in u
 
+    @staticmethod
+    def _memo_on_path(path, attr: str, compute):
+        """
+        Return compute(path), memoized in the path node's __dict__ under `attr`.
+
+        Locator scans depend only on the node's segments and token text, which are
+        fixed once the node is built, so each node is scanned at most once.
+        """
+        d = getattr(path, "__dict__", None)
+        if d is None:
+            return compute(path)
+        try:
+            return d[attr]
+        except KeyError:
+            val = d[attr] = compute(path)
+            return val
+
+    def _read_path(self, path) -> GetPath:
+        """
+        The GetPath twin of a write path (same segments and meta), built once per node
+        so reads through it reuse the GetPath's memoized resolve program.
+        """
+        return self._memo_on_path(
+            path, "_slip_read_path", lambda p: GetPath(p.segments, getattr(p, "meta", None))
+        )
+
     def _extract_http_url(self, path: GetPath | SetPath) -> str | None:
         """
         Extract a full http(s) URL from a path.
@@ -481,39 +1223,54 @@ class PathResolver:
           1) Use the raw token text if present.
           2) If the first segment is a Name that starts with http(s)://, return its text verbatim.
         """
-        loc = getattr(path, "loc", None) or {}
-        txt = loc.get("text") if isinstance(loc, dict) else None
+        return self._memo_on_path(path, "_slip_http_scan", self._scan_http_locator)[0]
 
-        def _strip_colon_if_needed(s: str) -> str:
-            if isinstance(path, SetPath) or s.endswith(":"):
-                return s.rstrip(":")
-            return s
-
-        if isinstance(txt, str) and (
-            txt.startswith("http://") or txt.startswith("https://")
-        ):
-            u = _strip_colon_if_needed(self._canonicalize_http_token(txt.rstrip()))
-            return u
+    def _scan_http_locator(self, path) -> tuple[str | None, bool]:
+        """
+        Return (url, has_trailing_segments) for a path, from one scan of its http(s) token.
+        """
         segments = getattr(path, "segments", None) or []
-        if segments and isinstance(segments[0], Name):
-            s0 = segments[0].text
-            if isinstance(s0, str) and (
-                s0.startswith("http://") or s0.startswith("https://")
-            ):
-                u = _strip_colon_if_needed(self._canonicalize_http_token(s0))
-                return u
-        return None
+        txt = _loc_text(path)
+        if isinstance(txt, str) and txt.startswith(_HTTP_SCHEMES):
+            token = txt.rstrip()
+        elif (
+            segments
+            and isinstance(segments[0], Name)
+            and isinstance(segments[0].text, str)
+            and segments[0].text.startswith(_HTTP_SCHEMES)
+        ):
+            token = segments[0].text
+        else:
+            return None, len(segments) > 1
+
+        m = _HTTP_TOKEN_RE.match(token)
+        u = m.group(0)
+        if len(segments) > 1:
+            trailing = True
+        elif m.group("path") is not None:
+            # The scan stopped at the first '.', '#' or '[' after the first path slash.
+            stop = token[m.end() : m.end() + 1]
+            trailing = stop == "." or stop == "[" or (
+                stop == "#" and token.find("[", m.end()) != -1
+            )
+        else:
+            trailing = self._http_has_trailing_segments_str(token)
+        if isinstance(path, SetPath) or u.endswith(":"):
+            u = u.rstrip(":")
+        return u, trailing
 
     def _extract_file_locator(self, path: GetPath | SetPath) -> str | None:
-        loc = getattr(path, "loc", None) or {}
-        txt = loc.get("text") if isinstance(loc, dict) else None
+        return self._memo_on_path(path, "_slip_file_loc", self._scan_file_locator)
+
+    def _scan_file_locator(self, path: GetPath | SetPath) -> str | None:
+        txt = _loc_text(path)
 
         def _strip_colon_if_needed(s: str) -> str:
             if isinstance(path, SetPath) or s.endswith(":"):
                 return s.rstrip(":")
             return s
 
-        if isinstance(txt, str) and txt.startswith("file://"):
+        if isinstance(txt, str) and txt.startswith(_FILE_SCHEMES):
             u = _strip_colon_if_needed(self._canonicalize_file_token(txt.rstrip()))
             # Canonicalize bare and relative forms
             try:
@@ -528,7 +1285,7 @@ class PathResolver:
         segments = getattr(path, "segments", None) or []
         if segments and isinstance(segments[0], Name):
             s0 = segments[0].text
-            if isinstance(s0, str) and s0.startswith("file://"):
+            if isinstance(s0, str) and s0.startswith(_FILE_SCHEMES):
                 u = _strip_colon_if_needed(self._canonicalize_file_token(s0))
                 try:
                     tail = u[len("file://") :]
@@ -547,22 +1304,7 @@ class PathResolver:
         (dot-chained names or bracketed queries) after an http(s) URL.
         This catches cases where the parser kept those in the first segment.
         """
-        segments = getattr(path, "segments", None) or []
-        if len(segments) > 1:
-            return True
-        loc = getattr(path, "loc", None) or {}
-        txt = loc.get("text") if isinstance(loc, dict) else None
-        if isinstance(txt, str) and (
-            txt.startswith("http://") or txt.startswith("https://")
-        ):
-            return self._http_has_trailing_segments_str(txt)
-        if segments and isinstance(segments[0], Name):
-            s0 = segments[0].text
-            if isinstance(s0, str) and (
-                s0.startswith("http://") or s0.startswith("https://")
-            ):
-                return self._http_has_trailing_segments_str(s0)
-        return False
+        return self._memo_on_path(path, "_slip_http_scan", self._scan_http_locator)[1]
 
     def _has_file_trailing_segments(self, path: GetPath | SetPath | PostPath) -> bool:
         """
@@ -570,16 +1312,21 @@ class PathResolver:
         Treats bracketed queries as trailing; dot detection is avoided to not
         confuse filename extensions.
         """
+        return self._memo_on_path(
+            path, "_slip_file_trailing", self._scan_file_trailing_segments
+        )
+
+    def _scan_file_trailing_segments(self, path: GetPath | SetPath | PostPath) -> bool:
         segments = getattr(path, "segments", None) or []
         if len(segments) > 1:
             return True
-        loc = getattr(path, "loc", None) or {}
-        txt = loc.get("text") if isinstance(loc, dict) else None
-        if isinstance(txt, str) and txt.startswith("file://"):
+        txt = _loc_text(path)
+        if isinstance(txt, str) and txt.startswith(_FILE_SCHEMES):
             return self._file_has_trailing_segments_str(txt)
         return False
 
     async def _meta_to_dict(self, meta_group: Group | None, scope: Scope) -> dict:
+        # Callers skip the await entirely when there is no meta group.
         if not isinstance(meta_group, Group):
             return {}
         ev_out = await self.evaluator._eval(("dict", meta_group.nodes), scope)
@@ -591,11 +1338,9 @@ class PathResolver:
 
     def _check_write_path(self, path: Union[GetPath, SetPath, PostPath, DelPath]):
         """Enforce that write paths cannot cross identity boundaries (::)."""
-        from slip.slip_datatypes import IdentityBoundary as _IB, DelPath as _DP
-
-        target = path.path if isinstance(path, _DP) else path
+        target = path.path if isinstance(path, DelPath) else path
         segments = getattr(target, "segments", [])
-        if any(s is _IB for s in segments):
+        if any(s is IdentityBoundary for s in segments):
             err = PermissionError("Cannot write across an identity boundary (::)")
             try:
                 err.slip_obj = path
@@ -603,6 +1348,66 @@ class PathResolver:
                 pass
             raise err
 
+    @staticmethod
+    def _compute_resolve_plan(path) -> tuple:
+        segs = path.segments
+        rooted = bool(segs) and segs[0] is Root
+        walk = tuple(segs[1:]) if rooted else tuple(segs)
+        return rooted, walk, walk[:-1], (walk[-1] if walk else None)
+
+    def _resolve_plan(self, path) -> tuple:
+        """
+        Return (rooted, segments, body, last) for a path, memoized on the node.
+
+        segments excludes a leading Root; body is every segment but the last.
+        """
+        return self._memo_on_path(path, "_slip_resolve_plan", self._compute_resolve_plan)
+
+    def _compile_segments(self, segments) -> tuple:
+        """Compile path segments into (opcode, arg, text) steps (see _OP_*)."""
+        ops = []
+        for seg in segments:
+            if seg is Parent:
+                ops.append((_OP_PARENT, None, None))
+            elif seg is Pwd or seg is IdentityBoundary:
+                # No-ops for traversal; dropped at compile time.
+                continue
+            elif isinstance(seg, Name):
+                ops.append((_OP_NAME, self._name_segment_key(seg), seg.text))
+            elif isinstance(seg, FilterQuery):
+                ops.append((_OP_FILTER, seg, None))
+            else:
+                ops.append((_OP_KEY, seg, None))
+        return tuple(ops)
+
+    def _compile_resolve_program(self, path) -> tuple:
+        _rooted, segments, body, _last = self._resolve_plan(path)
+        return self._compile_segments(segments), self._compile_segments(body)
+
+    def _resolve_program(self, path) -> tuple:
+        """
+        Return (program, body_program) for a path, memoized on the node.
+
+        Each program is a tuple of (opcode, arg, text) steps (see _OP_*) covering the
+        segments after any leading Root; body_program omits the final segment.
+        """
+        return self._memo_on_path(
+            path, "_slip_resolve_program", self._compile_resolve_program
+        )
+
+    def _compute_name_only_keys(self, path) -> tuple | None:
+        _rooted, _segments, _body, last = self._resolve_plan(path)
+        body_program = self._resolve_program(path)[1]
+        if type(last) is not Name or any(op != _OP_NAME for op, _arg, _text in body_program):
+            return None
+        return tuple(arg for _op, arg, _text in body_program), self._name_segment_key(last)
+
+    def _name_only_keys(self, path) -> tuple | None:
+        """
+        Return (body_keys, final_key) when every walked segment is a plain Name, else None.
+        """
+        return self._memo_on_path(path, "_slip_name_keys", self._compute_name_only_keys)
+
     async def _resolve(
         self, path: Union[GetPath, SetPath], scope: Scope
     ) -> Tuple[Any, Any]:
@@ -610,50 +1415,45 @@ class PathResolver:
         Traverses a path to find the container object and the final key.
         Returns (container, key).
         """
-        from slip.slip_datatypes import IdentityBoundary as _IB
-
-        if path.segments[0] is Root:
-            # Find the root scope
-            container = scope
-            while container.parent:
-                container = container.parent
-            segments = path.segments[1:]
-        else:
-            container = scope
-            segments = path.segments
+        rooted, segments, body, last_seg = self._resolve_plan(path)
+        # Rooted paths start at the outermost scope.
+        container = scope._root_scope() if rooted else scope
 
         if not segments:
             raise ValueError(
                 "Path resolution requires at least one segment after root."
             )
 
-        for segment in segments[:-1]:
-            if segment is Parent:
+        # Name-only paths (the common shape) walk precomputed keys with no per-segment dispatch.
+        name_keys = self._name_only_keys(path)
+        if name_keys is not None:
+            body_keys, final_key = name_keys
+            for key in body_keys:
+                if type(container) is Scope and key != "meta":
+                    value = container.bindings.get(key, _MISSING)
+                    if value is not _MISSING:
+                        container = value
+                        continue
+                container = container[key]
+            return container, final_key
+
+        for op, arg, _text in self._resolve_program(path)[1]:
+            if op == _OP_PARENT:
                 if not isinstance(container, Scope) or not container.parent:
                     raise KeyError(
                         "Path traversal failed: cannot use parent segment ('../') on non-Scope or root Scope."
                     )
                 container = container.parent
                 continue
-            if segment is Pwd:
-                # Pwd refers to the current scope, so it's a no-op in traversal
-                continue
-            if segment is _IB:
-                # Identity boundary is a no-op for resolution (it just traps writes)
-                continue
-
-            key = await self._get_segment_key(segment, scope)
-            if isinstance(container, Scope):
-                try:
-                    container = container[
-                        key
-                    ]  # Standard __getitem__ handles prototype lookup
-                except KeyError:
-                    raise
-            else:
-                container = container[key]  # For lists, dicts, etc.
-
-        final_key = await self._get_segment_key(segments[-1], scope)
+            key = arg if op == _OP_NAME else await self._get_segment_key(arg, scope)
+            # Scope.__getitem__ handles prototype lookup; lists, dicts, etc. index directly.
+            container = container[key]
+
+        final_key = (
+            self._name_segment_key(last_seg)
+            if type(last_seg) is Name
+            else await self._get_segment_key(last_seg, scope)
+        )
         return container, final_key
 
     async def get(self, path: GetPath, scope: Scope) -> Any:
@@ -668,26 +1468,15 @@ class PathResolver:
                 )
             from slip.slip_http import (
                 http_get,
+                normalize_response_mode,
+                package_response,
             )  # local import to avoid hard dependency until needed
 
-            cfg = await self._meta_to_dict(getattr(path, "meta", None), scope)
-
-            from slip.slip_http import normalize_response_mode
-
+            meta = getattr(path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
             mode = normalize_response_mode(cfg)
             raw = await http_get(url, cfg)
-            if mode == "lite" and isinstance(raw, tuple) and len(raw) == 3:
-                status, value, headers = raw
-                return [status, value]
-            if mode == "full" and isinstance(raw, tuple) and len(raw) == 3:
-                status, value, headers = raw
-                headers_map = {str(k).lower(): v for k, v in (headers or {}).items()}
-                return {
-                    "status": status,
-                    "value": value,
-                    "meta": {"headers": headers_map},
-                }
-            return raw
+            return package_response(raw, mode)
         file_loc = self._extract_file_locator(path)
         if file_loc:
             # Enforce two-step policy: no trailing segments on file GET
@@ -697,7 +1486,8 @@ class PathResolver:
                 )
             from slip.slip_file import file_get
 
-            cfg = await self._meta_to_dict(getattr(path, "meta", None), scope)
+            meta = getattr(path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
             base_dir = getattr(self.evaluator, "source_dir", None)
             try:
                 data = await file_get(file_loc, cfg, base_dir=base_dir)
@@ -714,27 +1504,21 @@ class PathResolver:
 
         # If the resolved value is itself a path (alias), try to dereference it safely.
         try:
-            from slip.slip_datatypes import GetPath as _GP, PathLiteral as _PL
-
             # Literal alias: return as-is. Callers that need a path object can use call.
-            if isinstance(val, _PL):
+            if isinstance(val, PathLiteral):
                 return val
             # Runtime path alias
-            if isinstance(val, _GP):
+            if isinstance(val, GetPath):
                 # Avoid immediate recursion when alias points to the same path.
                 if val.segments == path.segments and getattr(
                     val, "meta", None
                 ) == getattr(path, "meta", None):
-                    from slip.slip_datatypes import PathLiteral as _PLIT
-
-                    return _PLIT(val)
+                    return PathLiteral(val)
                 try:
                     return await self.get(val, scope)
                 except Exception:
                     # On failure, return a literal representation for stable equality
-                    from slip.slip_datatypes import PathLiteral as _PLIT
-
-                    return _PLIT(val)
+                    return PathLiteral(val)
         except Exception:
             pass
         return val
@@ -746,7 +1530,7 @@ class PathResolver:
         # Commit gating: writes rooted at `this` are only allowed inside resolver transactions.
         try:
             segs = getattr(path, "segments", None) or []
-            if segs and isinstance(segs[0], Name) and segs[0].text == "this":
+            if segs and isinstance(segs[0], Name) and segs[0].text is _THIS:
                 ev = getattr(self, "evaluator", None)
                 recv = (
                     getattr(ev, "_active_this_receiver", None)
@@ -777,33 +1561,11 @@ class PathResolver:
         if url:
             if self._has_http_trailing_segments(path):
                 raise TypeError("http write does not support trailing path segments")
-            from slip.slip_http import http_put
-            from slip.slip_serialize import serialize as _ser
-
-            cfg = await self._meta_to_dict(getattr(path, "meta", None), scope)
-            # Promote content-type into headers and choose serialization
-            ctype = cfg.get("content-type") or cfg.get("content_type")
-            headers = dict(cfg.get("headers", {}))
-            if ctype:
-                headers["Content-Type"] = ctype
-                cfg["headers"] = headers
-            from slip.slip_serialize import detect_format as _detect_fmt
-
-            fmt = _detect_fmt(ctype)
-            # Default to JSON when no content-type is provided and value is dict/list
-            if fmt is None and isinstance(value, (dict, list)):
-                fmt = "json"
-                headers.setdefault("Content-Type", "application/json")
-                cfg["headers"] = headers
-            if fmt is not None:
-                try:
-                    payload = _ser(value, fmt=fmt, pretty=True)
-                except Exception:
-                    payload = str(value)
-            else:
-                payload = (
-                    value if isinstance(value, (str, bytes, bytearray)) else str(value)
-                )
+            from slip.slip_http import http_put, prepare_payload
+
+            meta = getattr(path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
+            payload = prepare_payload(value, cfg)
             await http_put(url, payload, cfg)
             return  # assignment expression will still return the RHS value upstream
         file_loc = self._extract_file_locator(path)
@@ -812,7 +1574,8 @@ class PathResolver:
                 raise TypeError("file write does not support trailing path segments")
             from slip.slip_file import file_put
 
-            cfg = await self._meta_to_dict(getattr(path, "meta", None), scope)
+            meta = getattr(path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
             await file_put(
                 file_loc,
                 value,
@@ -824,15 +1587,12 @@ class PathResolver:
 
         # Scope christening: assign meta.name and meta.type_id on first assignment
         if isinstance(value, Scope) and "type_id" not in value.meta:
-            global _next_type_id
             name_str = str(key)
+            type_id = next(_type_id_counter)
             value.meta["name"] = name_str
-            value.meta["type_id"] = _next_type_id
-            value.meta["type-id"] = (
-                _next_type_id  # also expose kebab-case for path lookups
-            )
-            TYPE_REGISTRY[name_str] = _next_type_id
-            _next_type_id += 1
+            value.meta["type_id"] = type_id
+            value.meta["type-id"] = type_id  # also expose kebab-case for path lookups
+            TYPE_REGISTRY[name_str] = type_id
 
         if isinstance(container, Scope):
             if getattr(self.evaluator, "bind_locals_prefer_container", False):
@@ -853,7 +1613,7 @@ class PathResolver:
         # Commit gating: writes rooted at `this` are only allowed inside resolver transactions.
         try:
             segs = getattr(path, "segments", None) or []
-            if segs and isinstance(segs[0], Name) and segs[0].text == "this":
+            if segs and isinstance(segs[0], Name) and segs[0].text is _THIS:
                 ev = getattr(self, "evaluator", None)
                 recv = (
                     getattr(ev, "_active_this_receiver", None)
@@ -878,55 +1638,24 @@ class PathResolver:
             if isinstance(e, PermissionError):
                 raise
 
-        url = self._extract_http_url(
-            GetPath(path.segments, getattr(path, "meta", None))
-        )
+        url = self._extract_http_url(self._read_path(path))
         if url:
             if self._has_http_trailing_segments(path):
                 raise TypeError("http post does not support trailing path segments")
-            from slip.slip_http import http_post
-            from slip.slip_serialize import serialize as _ser
-
-            cfg = await self._meta_to_dict(getattr(path, "meta", None), scope)
-            ctype = cfg.get("content-type") or cfg.get("content_type")
-            headers = dict(cfg.get("headers", {}))
-            if ctype:
-                headers["Content-Type"] = ctype
-                cfg["headers"] = headers
-            from slip.slip_serialize import detect_format as _detect_fmt
-
-            fmt = _detect_fmt(ctype)
-            # Default to JSON when no content-type is provided and value is dict/list
-            if fmt is None and isinstance(value, (dict, list)):
-                fmt = "json"
-                headers.setdefault("Content-Type", "application/json")
-                cfg["headers"] = headers
-            if fmt is not None:
-                try:
-                    payload = _ser(value, fmt=fmt, pretty=True)
-                except Exception:
-                    payload = str(value)
-            else:
-                payload = (
-                    value if isinstance(value, (str, bytes, bytearray)) else str(value)
-                )
+            from slip.slip_http import (
+                http_post,
+                normalize_response_mode,
+                package_response,
+                prepare_payload,
+            )
+
+            meta = getattr(path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
+            payload = prepare_payload(value, cfg)
             raw = await http_post(url, payload, cfg)
             # Package per response-mode if requested
-            from slip.slip_http import normalize_response_mode
-
             mode = normalize_response_mode(cfg)
-            if mode == "lite" and isinstance(raw, tuple) and len(raw) == 3:
-                status, value, headers = raw
-                return [status, value]
-            if mode == "full" and isinstance(raw, tuple) and len(raw) == 3:
-                status, value, headers = raw
-                headers_map = {str(k).lower(): v for k, v in (headers or {}).items()}
-                return {
-                    "status": status,
-                    "value": value,
-                    "meta": {"headers": headers_map},
-                }
-            return raw
+            return package_response(raw, mode)
         # Non-HTTP post-paths are not supported
         raise TypeError("post-path expects an http(s) URL")
 
@@ -938,7 +1667,7 @@ class PathResolver:
         try:
             target = getattr(path, "path", None)
             segs = getattr(target, "segments", None) or []
-            if segs and isinstance(segs[0], Name) and segs[0].text == "this":
+            if segs and isinstance(segs[0], Name) and segs[0].text is _THIS:
                 ev = getattr(self, "evaluator", None)
                 recv = (
                     getattr(ev, "_active_this_receiver", None)
@@ -968,33 +1697,25 @@ class PathResolver:
         if url:
             if self._has_http_trailing_segments(path.path):
                 raise TypeError("http delete does not support trailing path segments")
-            from slip.slip_http import http_delete
-
-            cfg = await self._meta_to_dict(getattr(path.path, "meta", None), scope)
-
-            from slip.slip_http import normalize_response_mode
+            from slip.slip_http import (
+                http_delete,
+                normalize_response_mode,
+                package_response,
+            )
 
+            meta = getattr(path.path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
             raw = await http_delete(url, cfg)
             mode = normalize_response_mode(cfg)
-            if mode == "lite" and isinstance(raw, tuple) and len(raw) == 3:
-                status, value, headers = raw
-                return [status, value]
-            if mode == "full" and isinstance(raw, tuple) and len(raw) == 3:
-                status, value, headers = raw
-                headers_map = {str(k).lower(): v for k, v in (headers or {}).items()}
-                return {
-                    "status": status,
-                    "value": value,
-                    "meta": {"headers": headers_map},
-                }
-            return raw
+            return package_response(raw, mode)
         file_loc = self._extract_file_locator(path.path)
         if file_loc:
             if len(getattr(path.path, "segments", []) or []) > 1:
                 raise TypeError("file delete does not support trailing path segments")
             from slip.slip_file import file_delete
 
-            cfg = await self._meta_to_dict(getattr(path.path, "meta", None), scope)
+            meta = getattr(path.path, "meta", None)
+            cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
             await file_delete(
                 file_loc, cfg, base_dir=getattr(self.evaluator, "source_dir", None)
             )
@@ -1002,46 +1723,47 @@ class PathResolver:
         # Build a breadcrumb chain to support post-delete pruning
         target = path.path
         # Determine starting container and segments (mirror _resolve)
-        if target.segments and target.segments[0] is Root:
-            container = scope
-            while isinstance(container, Scope) and container.parent:
-                container = container.parent
-            segments = target.segments[1:]
-        else:
-            container = scope
-            segments = target.segments
+        rooted, segments, _body, last_seg = self._resolve_plan(target)
+        container = scope._root_scope() if rooted and isinstance(scope, Scope) else scope
+        if not segments:
+            raise ValueError(
+                "Path resolution requires at least one segment after root."
+            )
 
         # Walk to the leaf, tracking (owner, key, child) steps for pruning
         chain = []
-        for seg in segments[:-1]:
-            if seg is Parent:
+        for op, arg, _text in self._resolve_program(target)[1]:
+            if op == _OP_PARENT:
                 if not isinstance(container, Scope) or not container.parent:
                     raise KeyError(
                         "Path traversal failed: cannot use parent segment ('../') on non-Scope or root Scope."
                     )
                 container = container.parent
                 continue
-            if seg is Pwd:
-                continue
-            key = await self._get_segment_key(seg, scope)
-            next_container = (
-                container[key] if not isinstance(container, Scope) else container[key]
-            )
+            # Name keys are precompiled; other segments (filters included) go through
+            # _get_segment_key, which rejects what a delete walk cannot key on.
+            key = arg if op == _OP_NAME else await self._get_segment_key(arg, scope)
+            next_container = container[key]
             chain.append((container, key, next_container))
             container = next_container
 
         # Perform the deletion at the leaf
-        final_key = await self._get_segment_key(segments[-1], scope)
+        final_key = (
+            self._name_segment_key(last_seg)
+            if type(last_seg) is Name
+            else await self._get_segment_key(last_seg, scope)
+        )
         del container[final_key]
 
         # Determine pruning behavior: default True; allow #(prune: false) to disable
-        cfg = await self._meta_to_dict(getattr(path.path, "meta", None), scope)
+        meta = getattr(path.path, "meta", None)
+        cfg = await self._meta_to_dict(meta, scope) if isinstance(meta, Group) else {}
         prune_flag = cfg.get("prune")
         prune = True if prune_flag is None else bool(prune_flag)
 
         if prune:
             try:
-                dbg = bool(os.environ.get("SLIP_PRUNE_DEBUG"))
+                dbg = _SLIP_PRUNE_DEBUG
                 cur = container
                 i = len(chain) - 1
                 if dbg:
@@ -1082,17 +1804,17 @@ class PathResolver:
                                 except Exception:
                                     pass
                             break
-                    try:
-                        if dbg:
-                            try:
-                                print(
-                                    f"[PRUNE] del owner[{owner_key!r}] (owner_bindings_before={list(owner.bindings.keys())})",
-                                    file=sys.stderr,
-                                )
-                            except Exception:
-                                pass
-                        del owner[owner_key]
-                    except Exception:
+                    if dbg:
+                        try:
+                            print(
+                                f"[PRUNE] del owner[{owner_key!r}] (owner_bindings_before={list(owner.bindings.keys())})",
+                                file=sys.stderr,
+                            )
+                        except Exception:
+                            pass
+                    # owner is a Scope and owner_key a str (checked above): drop the binding
+                    # directly; a missing key (or the reserved 'meta') ends the cascade.
+                    if owner_key == "meta" or owner.bindings.pop(owner_key, _MISSING) is _MISSING:
                         if dbg:
                             try:
                                 print(
@@ -1119,86 +1841,49 @@ class PathResolver:
 
     async def _resolve_value(self, path: GetPath, scope: Scope) -> Any:
         """Resolves a GetPath to a concrete value, handling filter queries inline."""
-        from slip.slip_datatypes import (
-            FilterQuery,
-            PathNotFound,
-            IdentityBoundary as _IB,
-        )
-
         # Determine starting container based on the path and the passed-in scope.
-        if path.segments and path.segments[0] is Root:
-            container = scope
-            while isinstance(container, Scope) and container.parent:
-                container = container.parent
-            segments = path.segments[1:]
-        else:
-            container = scope
-            segments = path.segments
+        rooted, segments, _body, _last = self._resolve_plan(path)
+        container = scope._root_scope() if rooted and isinstance(scope, Scope) else scope
 
         if not segments:
             raise ValueError(
                 "Path resolution requires at least one segment after root."
             )
 
-        from slip.slip_datatypes import IdentityBoundary as _IB
-
-        for segment in segments:
-            match segment:
-                case _ if segment is Parent:
-                    if not isinstance(container, Scope) or not container.parent:
-                        raise KeyError(
-                            "Path traversal failed: cannot use parent segment ('../') on non-Scope or root Scope."
-                        )
-                    container = container.parent
-                    continue
-                case _ if segment is Pwd:
-                    # Pwd refers to the current scope, so it's a no-op in traversal
-                    continue
-                case _ if segment is _IB:
-                    continue
-                case FilterQuery():
-                    container = await self._apply_filter(container, segment, scope)
+        for op, arg, text in self._resolve_program(path)[0]:
+            if op == _OP_NAME:
+                # Own binding of a plain Scope: skip the prototype walk in Scope.__getitem__
+                # ('meta' is reserved there and resolves to the scope's metadata).
+                if type(container) is Scope and arg != "meta":
+                    value = container.bindings.get(arg, _MISSING)
+                    if value is not _MISSING:
+                        container = value
+                        continue
+                # Vectorized pluck: when container is a list (or internal filtered selection)
+                # and next segment is a Name, pluck that field from each item to produce a new list.
+                if isinstance(container, _Selection) or _is_list_like(container):
+                    container = self._pluck(container, text)
                     continue
-
-            # Vectorized pluck: when container is a list (or internal filtered selection)
-            # and next segment is a Name, pluck that field from each item to produce a new list.
-            if (
-                isinstance(container, _Selection) or _is_list_like(container)
-            ) and isinstance(segment, Name):
-                plucked = []
-                for item in container:
-                    if isinstance(item, Scope):
-                        try:
-                            val = item[segment.text]
-                        except KeyError:
-                            raise PathNotFound(segment.text)
-                        plucked.append(val)
-                    elif isinstance(item, collections.abc.Mapping):
-                        try:
-                            plucked.append(item[segment.text])
-                        except KeyError:
-                            raise PathNotFound(segment.text)
-                    else:
-                        # Best-effort: support attribute-style access on plain objects
-                        try:
-                            plucked.append(getattr(item, segment.text))
-                        except Exception:
-                            raise TypeError(
-                                f"Cannot pluck field {segment.text!r} from item of type {type(item).__name__}"
-                            )
-                container = plucked
+                key = arg
+                # Attribute fallback: allow name access on non-mapping objects (e.g., response.status)
+                if not isinstance(container, (Scope, collections.abc.Mapping)):
+                    try:
+                        container = getattr(container, key)
+                        continue
+                    except AttributeError:
+                        pass
+            elif op == _OP_PARENT:
+                if not isinstance(container, Scope) or not container.parent:
+                    raise KeyError(
+                        "Path traversal failed: cannot use parent segment ('../') on non-Scope or root Scope."
+                    )
+                container = container.parent
                 continue
-
-            key = await self._get_segment_key(segment, scope)
-            # Attribute fallback: allow name access on non-mapping objects (e.g., response.status)
-            if isinstance(segment, Name) and not isinstance(
-                container, (Scope, collections.abc.Mapping)
-            ):
-                try:
-                    container = getattr(container, key)
-                    continue
-                except AttributeError:
-                    pass
+            elif op == _OP_FILTER:
+                container = await self._apply_filter(container, arg, scope)
+                continue
+            else:
+                key = await self._get_segment_key(arg, scope)
             try:
                 # Let the container handle the lookup. For a Scope, its __getitem__
                 # will traverse the prototype chain correctly.
@@ -1206,42 +1891,33 @@ class PathResolver:
             except KeyError:
                 # Re-raise as a PathNotFound error for better semantics.
                 raise PathNotFound(str(key))
-            except Exception:
-                raise
 
         # Ref/Cell values dereference/compute on read.
         try:
-            from slip.slip_datatypes import (
-                Ref as _Ref,
-                Cell as _Cell,
-                PathLiteral as _PL,
-                GetPath as _GP,
-            )
-
-            if isinstance(container, _Ref):
+            if isinstance(container, Ref):
                 p = container.path
-                if isinstance(p, _PL):
+                if isinstance(p, PathLiteral):
                     p = p.inner
-                if isinstance(p, _GP):
+                if isinstance(p, GetPath):
                     return await self.get(p, scope)
-            if isinstance(container, _Cell):
+            if isinstance(container, Cell):
                 call_scope = Scope(parent=container.closure)
                 for name, spec in (container.inputs or {}).items():
                     v = spec
-                    if isinstance(v, _PL):
+                    if isinstance(v, PathLiteral):
                         inner = getattr(v, "inner", None)
-                        v = inner if isinstance(inner, _GP) else v
-                    if isinstance(v, _GP):
+                        v = inner if isinstance(inner, GetPath) else v
+                    if isinstance(v, GetPath):
                         bound_val = await self.get(v, scope)
                     else:
                         # Allow refs as inputs
-                        if isinstance(v, _Ref):
+                        if isinstance(v, Ref):
                             bound_val = await self.get(v.path, scope)
                         else:
                             bound_val = v
                     call_scope[str(name)] = bound_val
                 return (
-                    await self.evaluator._eval(container.body.ast, call_scope)
+                    await self.evaluator._exec_block(container.body, call_scope)
                     if hasattr(self, "evaluator")
                     else await self._eval(container.body.ast, call_scope)
                 )
@@ -1253,114 +1929,148 @@ class PathResolver:
     async def _apply_filter(self, container, segment, scope: Scope):
         """Applies a filter query to the current container. Supports predicate chains."""
         # Always evaluate via predicate_ast using the evaluator so operator rebinding/multimethods apply.
-        pred = getattr(segment, "predicate_ast", None)
-
-        if pred is None:
-            # Legacy shorthand like [> 10]: synthesize predicate_ast = [GetPath(Name(op))] + rhs_ast
-            op = getattr(segment, "operator", None)
-            rhs_ast = getattr(segment, "rhs_ast", None) or []
-            if op is None:
-                # No predicate and no operator → keep nothing by default
-                return [] if _is_list_like(container) else View(container, [segment])
-            pred = [GetPath([Name(op)])] + (
-                rhs_ast if isinstance(rhs_ast, list) else [rhs_ast]
-            )
+        # Legacy shorthand like [> 10] is synthesized into [GetPath(Name(op))] + rhs_ast by the plan.
+        plan = self._predicate_plan(segment)
+        if plan[0] is None:
+            # No predicate and no operator → keep nothing by default
+            return [] if _is_list_like(container) else View(container, [segment])
 
         if _is_list_like(container):
+            verdict = plan[3]
+            if verdict is not None:
+                # Literal predicate: keep everything or nothing without visiting items.
+                return _Selection(container, list(range(len(container))) if verdict else [])
+            # Items are tested one at a time, in order: predicates run through the shared
+            # evaluator, whose call stack and local-scope state are not safe to interleave.
+            matches = self._item_predicate(segment, scope, plan)
             idxs: list[int] = []
+            keep = idxs.append
             for i, item in enumerate(container):
-                try:
-                    if await self._predicate_matches(
-                        item, segment, scope, fallback_base=item
-                    ):
-                        idxs.append(i)
-                except Exception:
-                    pass
+                if await matches(item, item):
+                    keep(i)
             return _Selection(container, idxs)
         # For non-list containers, return a simple View placeholder for future materialization.
         return View(container, [segment])
 
-    async def _apply_segments(self, container, segments, scope: Scope):
-        """Apply SLIP path segments to an already-fetched container (list/dict/scope/etc.)."""
-        from slip.slip_datatypes import IdentityBoundary as _IB
-
-        cur = container
-        for segment in segments:
-            match segment:
-                case _ if segment is Parent:
-                    if not isinstance(cur, Scope) or not cur.parent:
-                        raise KeyError(
-                            "Path traversal failed: cannot use parent segment ('../') on some non-Scope or root Scope."
-                        )
-                    cur = cur.parent
-                    continue
-                case _ if segment is Pwd:
-                    continue
-                case _ if segment is _IB:
-                    continue
-                case FilterQuery():
-                    cur = await self._apply_filter(cur, segment, scope)
-                    continue
-            if (isinstance(cur, _Selection) or _is_list_like(cur)) and isinstance(
-                segment, Name
-            ):
-                plucked = []
-                for item in cur:
-                    if isinstance(item, Scope):
-                        try:
-                            plucked.append(item[segment.text])
-                        except KeyError:
-                            raise PathNotFound(segment.text)
-                    elif isinstance(item, collections.abc.Mapping):
-                        try:
-                            plucked.append(item[segment.text])
-                        except KeyError:
-                            raise PathNotFound(segment.text)
-                    else:
-                        try:
-                            plucked.append(getattr(item, segment.text))
-                        except Exception:
-                            raise TypeError(
-                                f"Cannot pluck field {segment.text!r} from item of type {type(item).__name__}"
-                            )
-                cur = plucked
-                continue
-            key = await self._get_segment_key(segment, scope)
-            if isinstance(segment, Name) and not isinstance(
-                cur, (Scope, collections.abc.Mapping)
-            ):
+    @staticmethod
+    def _pluck(items, text: str) -> list:
+        """
+        Vectorized pluck: read field `text` from each item of a list or selection.
+
+        Lists are almost always homogeneous, so the item kind (Scope/mapping vs plain
+        object) is decided once from the first item; mixed lists take the per-item loop.
+        """
+        seq = items if type(items) is list else list(items)
+        if not seq:
+            return []
+        t0 = type(seq[0])
+        if all(type(item) is t0 for item in seq):
+            if t0 is dict:
+                plucked = [item.get(text, _MISSING) for item in seq]
+                if any(v is _MISSING for v in plucked):
+                    raise PathNotFound(text)
+                return plucked
+            if issubclass(t0, (Scope, collections.abc.Mapping)):
+                # Scope lookups must walk the prototype chain, so they go through __getitem__.
                 try:
-                    cur = getattr(cur, key)
-                    continue
-                except AttributeError:
-                    pass
+                    return [item[text] for item in seq]
+                except KeyError:
+                    raise PathNotFound(text)
             try:
-                cur = cur[key]
-            except KeyError:
-                raise PathNotFound(str(key))
-        return cur
+                plucked = [getattr(item, text, _MISSING) for item in seq]
+            except Exception:
+                plucked = None
+            if plucked is not None and not any(v is _MISSING for v in plucked):
+                return plucked
+            # Fall through: the per-item loop reports the offending item.
+        plucked = []
+        for item in seq:
+            if isinstance(item, (Scope, collections.abc.Mapping)):
+                try:
+                    plucked.append(item[text])
+                except KeyError:
+                    raise PathNotFound(text)
+            else:
+                try:
+                    plucked.append(getattr(item, text))
+                except Exception:
+                    raise TypeError(
+                        f"Cannot pluck field {text!r} from item of type {type(item).__name__}"
+                    )
+        return plucked
+
+    def _try_apply_name(self, cur, seg: Name) -> Any:
+        """
+        Apply one Name segment to an already-fetched value, returning _MISSING on a
+        miss instead of raising. Plain dicts and attribute reads are probed without exceptions; only
+        plucks and Scope/mapping lookups still fail by raising, caught here.
+        """
+        text = seg.text
+        key = seg.key
+        t = type(cur)
+        if t is dict:
+            return cur.get(key, _MISSING)
+        try:
+            if isinstance(cur, _Selection) or _is_list_like(cur):
+                return self._pluck(cur, text)
+            if not isinstance(cur, (Scope, collections.abc.Mapping)):
+                val = getattr(cur, key, _MISSING)
+                if val is not _MISSING:
+                    return val
+            return cur[key]
+        except Exception:
+            return _MISSING
+
+    def _try_apply_names(self, base, segs) -> tuple:
+        """
+        Walk Name segments from base as far as they apply: (value, applied), where
+        applied counts the segments walked before the first miss.
+        """
+        cur = base
+        applied = 0
+        try_apply_name = self._try_apply_name
+        for seg in segs:
+            nxt = try_apply_name(cur, seg)
+            if nxt is _MISSING:
+                break
+            cur = nxt
+            applied += 1
+        return cur, applied
 
     def _parse_vectorized_target(self, set_path: SetPath):
         """
         Recognize vectorized write targets in either order:
           A) ... Name, FilterQuery      (e.g., players.hp[< 50]: ...)
           B) ... FilterQuery, Name      (e.g., players[.hp < 50].hp: ...)
-        Returns (base_segments, field_name, filter_query, meta) or None.
+        Returns (base_segments, field_name, filter_query, meta) or None, memoized on the node.
         """
-        segs = list(getattr(set_path, "segments", []) or [])
+        return self._memo_on_path(
+            set_path, "_slip_vec_target", self._compute_vectorized_target
+        )
+
+    @staticmethod
+    def _compute_vectorized_target(set_path: SetPath):
+        segs = getattr(set_path, "segments", None) or ()
         if len(segs) < 2:
             return None
         last = segs[-1]
         prev = segs[-2]
         meta = getattr(set_path, "meta", None)
-        from slip.slip_datatypes import Name as _Name, FilterQuery as _FQ
-
-        if isinstance(last, _FQ) and isinstance(prev, _Name):
+        if isinstance(last, FilterQuery) and isinstance(prev, Name):
             return segs[:-2], prev.text, last, meta
-        if isinstance(last, _Name) and isinstance(prev, _FQ):
+        if isinstance(last, Name) and isinstance(prev, FilterQuery):
             return segs[:-2], last.text, prev, meta
         return None
 
+    def _vectorized_base_path(self, set_path: SetPath) -> GetPath:
+        """The GetPath of a vectorized target's base list, built once per SetPath node."""
+
+        def build(p):
+            base_segs, _field, _filt, meta = self._parse_vectorized_target(p)
+            return GetPath(base_segs, meta)
+
+        return self._memo_on_path(set_path, "_slip_vec_base", build)
+
     async def set_vectorized_update(
         self, set_path: SetPath, update_expr_terms: list, scope: Scope
     ):
@@ -1376,10 +2086,10 @@ class PathResolver:
             raise NotImplementedError(
                 "vectorized update requires a trailing name/filter pair"
             )
-        base_segs, field_name, filt, meta = parsed
+        _base_segs, field_name, filt, _meta = parsed
 
         # Resolve the base container (e.g., 'players')
-        base_container = await self._resolve_value(GetPath(base_segs, meta), scope)
+        base_container = await self._resolve_value(self._vectorized_base_path(set_path), scope)
         if not _is_list_like(base_container):
             raise TypeError("vectorized update base must be a list")
 
@@ -1389,12 +2099,13 @@ class PathResolver:
         )
 
         # Apply update expression per match: new = f(old)
+        write = self._field_write_fn(field_name)
         out_vals = []
         for owner, old_val in matches:
             new_val = await self.evaluator._eval_expr(
                 [old_val] + update_expr_terms, scope
             )
-            self._write_field(owner, field_name, new_val)
+            write(owner, new_val)
             out_vals.append(new_val)
 
         return out_vals
@@ -1416,9 +2127,9 @@ class PathResolver:
             raise NotImplementedError(
                 "vectorized assign requires a trailing name/filter pair"
             )
-        base_segs, field_name, filt, meta = parsed
+        _base_segs, field_name, filt, _meta = parsed
 
-        base_container = await self._resolve_value(GetPath(base_segs, meta), scope)
+        base_container = await self._resolve_value(self._vectorized_base_path(set_path), scope)
         if not _is_list_like(base_container):
             raise TypeError("vectorized assign base must be a list")
 
@@ -1430,7 +2141,6 @@ class PathResolver:
         # Evaluate RHS once
         rhs_val = await self.evaluator._eval_expr(value_expr_terms, scope)
 
-        new_values = []
         if _is_list_like(rhs_val):
             if len(rhs_val) != len(owners):
                 raise TypeError(
@@ -1440,8 +2150,10 @@ class PathResolver:
         else:
             pairs = ((o, rhs_val) for o in owners)
 
+        write = self._field_write_fn(field_name)
+        new_values = []
         for owner, new_val in pairs:
-            self._write_field(owner, field_name, new_val)
+            write(owner, new_val)
             new_values.append(new_val)
 
         return new_values
@@ -1454,6 +2166,10 @@ class Evaluator:
     _core_ast_cache = None  # transformed Code object for root.slip
     _core_parser = None  # koine.Parser instance
     _core_parse_error = None  # str to suppress repeated attempts on failure
+    # Generate per-Sig parameter binders (exec-based); False uses generic zip binding.
+    sig_binder_codegen: bool = True
+    # Reuse call scopes that nothing captured (see Scope._acquire / Scope._release).
+    scope_pooling: bool = True
 
     def __init__(self):
         self.path_resolver = PathResolver(self)
@@ -1473,6 +2189,17 @@ class Evaluator:
         self.bind_locals_prefer_container: bool = True
         # Core library load flag
         self._core_loaded: bool = False
+        # Per-callable (needs_scope, is_coro) shapes for Python builtins; see _py_call_shape.
+        self._py_call_cache: "weakref.WeakKeyDictionary[Any, tuple[bool, bool]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._py_call_cache_strong: Dict[int, tuple[Any, tuple[bool, bool]]] = {}
+        # Per-callable zero-arity answers for Python callables; see _py_zero_arity.
+        # Both strong maps are bounded LRUs (see _callable_cache_put).
+        self._zero_arity_cache: "weakref.WeakKeyDictionary[Any, bool]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._zero_arity_cache_strong: Dict[int, tuple[Any, bool]] = {}
 
     def _normalize_root_div(self, term):
         # Convert ambiguous '/' token parsed as Root into a Name('/')
@@ -1481,7 +2208,7 @@ class Evaluator:
             and len(term.segments) == 1
             and term.segments[0] is Root
         ):
-            return GetPath([Name("/")], getattr(term, "meta", None))
+            return PathResolver._memo_on_path(term, "_slip_root_div", _root_div_path)
         return term
 
     async def _resolve_operator_to_func_path(self, raw_op_term, scope):
@@ -1489,90 +2216,50 @@ class Evaluator:
         Resolve an operator term (which may be an alias/path-literal/group/etc.)
         to a function GetPath (built from a PipedPath).
         Preserves source location and raises consistent TypeErrors with slip_obj.
+
+        Each operator site caches its last resolution on the term node, keyed by
+        the value the term evaluated to. The lookup itself is repeated (bindings
+        can change), but when it yields the same object again the alias walk is
+        skipped and the same func_path is returned. Walks that needed further
+        lookups (alias of an alias) or unwrapped a Group/Code value (mutable in
+        place) are redone, but still reuse the site's func_path when they end at
+        the same PipedPath.
         """
         op_term = self._normalize_root_div(raw_op_term)
-        try:
-            op_val = await self._eval(op_term, scope)
-        except Exception:
-            raise
-        visited = set()
+        op_val = await self._eval(op_term, scope)
+        site = getattr(raw_op_term, "__dict__", None)
+        ic = site.get("_slip_op_ic") if site is not None else None
+        if ic is not None and ic[0] is op_val:
+            return ic[1], ic[2]
+        first_val = op_val
+        cacheable = True
         steps = 0
 
-        def _op_key(v):
-            """
-            Canonicalize operator-like values so PathLiteral(`name`) and GetPath(name)
-            (and trivial wrappers) hash to the same key for cycle detection.
-            """
-            try:
-                if isinstance(v, PathLiteral):
-                    inner = getattr(v, "inner", None)
-                    if isinstance(inner, (GetPath, PipedPath)):
-                        return getattr(inner, "to_str_repr", lambda: repr(inner))()
-                if isinstance(v, (GetPath, PipedPath)):
-                    return getattr(v, "to_str_repr", lambda: repr(v))()
-                if (
-                    isinstance(v, Group)
-                    and getattr(v, "nodes", None)
-                    and isinstance(v.nodes[0], list)
-                    and v.nodes[0]
-                ):
-                    return _op_key(v.nodes[0][0])
-            except Exception:
-                pass
-            return getattr(v, "to_str_repr", lambda: repr(v))()
-
-        while not isinstance(op_val, PipedPath):
+        while True:
+            kind = node_kind(op_val)
+            if kind == KIND_PIPED_PATH:
+                break
+            # Cycle guard: real alias chains are a few steps long
             steps += 1
-            if steps > 50:
+            if steps > _OP_RESOLVE_MAX_STEPS:
                 err = RecursionError("operator resolution cycle detected")
                 try:
                     err.slip_obj = raw_op_term
                 except Exception:
                     pass
                 raise err
-            # Cycle guard with canonical key across PathLiteral/GetPath/PipedPath and wrappers
-            try:
-                key = _op_key(op_val)
-                if key in visited:
-                    err = RecursionError("operator resolution cycle detected")
-                    try:
-                        err.slip_obj = raw_op_term
-                    except Exception:
-                        pass
-                    raise err
-                visited.add(key)
-            except Exception:
-                pass
-            # Normalize legacy '/' parsed as Root
-            if (
-                isinstance(op_val, GetPath)
-                and len(op_val.segments) == 1
-                and op_val.segments[0] is Root
-            ):
-                op_val = GetPath([Name("/")], getattr(op_val, "meta", None))
-                continue
-            # Unwrap path-literal
-            if isinstance(op_val, PathLiteral):
-                inner = op_val.inner
-                # Follow through for both piped operators and plain get-path aliases
-                if isinstance(inner, (PipedPath, GetPath)):
-                    op_val = inner
+            if kind == KIND_GET_PATH:
+                # Normalize legacy '/' parsed as Root
+                if len(op_val.segments) == 1 and op_val.segments[0] is Root:
+                    op_val = PathResolver._memo_on_path(
+                        op_val, "_slip_root_div", _root_div_path
+                    )
                     continue
-                err = TypeError(
-                    "Unexpected term in expression - expected a piped-path for infix operation"
-                )
-                try:
-                    err.slip_obj = raw_op_term
-                except Exception:
-                    pass
-                raise err
-            # Follow aliases
-            if isinstance(op_val, GetPath):
+                # Follow aliases
+                cacheable = False
                 nxt = await self._eval(op_val, scope)
-                if (
-                    isinstance(nxt, GetPath)
-                    and getattr(nxt, "to_str_repr", lambda: None)()
-                    == getattr(op_val, "to_str_repr", lambda: None)()
+                if node_kind(nxt) == KIND_GET_PATH and (
+                    nxt is op_val or nxt.to_str_repr() == op_val.to_str_repr()
                 ):
                     err = RecursionError("operator resolution cycle detected")
                     try:
@@ -1582,18 +2269,24 @@ class Evaluator:
                     raise err
                 op_val = nxt
                 continue
-            # Unwrap trivial wrappers
-            if (
-                isinstance(op_val, Group)
-                and op_val.nodes
-                and isinstance(op_val.nodes[0], list)
-                and op_val.nodes[0]
-            ):
-                op_val = op_val.nodes[0][0]
-                continue
-            if isinstance(op_val, Code) and len(op_val.nodes) == 1 and op_val.nodes[0]:
-                op_val = op_val.nodes[0][0]
-                continue
+            if kind == KIND_PATH_LITERAL:
+                # Unwrap path-literal; follow through for both piped operators and plain get-path aliases
+                inner = op_val.inner
+                if node_kind(inner) in (KIND_PIPED_PATH, KIND_GET_PATH):
+                    op_val = inner
+                    continue
+            elif kind == KIND_GROUP:
+                # Unwrap trivial wrappers. Their contents can be edited in place,
+                # so the identity of the outer value does not pin the operator.
+                cacheable = False
+                if op_val.nodes and isinstance(op_val.nodes[0], list) and op_val.nodes[0]:
+                    op_val = op_val.nodes[0][0]
+                    continue
+            elif kind == KIND_CODE:
+                cacheable = False
+                if len(op_val.nodes) == 1 and op_val.nodes[0]:
+                    op_val = op_val.nodes[0][0]
+                    continue
             err = TypeError(
                 "Unexpected term in expression - expected a piped-path for infix operation"
             )
@@ -1603,28 +2296,37 @@ class Evaluator:
                 pass
             raise err
 
-        func_path = GetPath(op_val.segments, getattr(op_val, "meta", None))
-        if hasattr(raw_op_term, "loc"):
-            try:
-                func_path.loc = raw_op_term.loc
-            except Exception:
-                pass
-        func_name = None
-        if func_path.segments and isinstance(func_path.segments[-1], Name):
-            func_name = func_path.segments[-1].text
-        return func_path, func_name
-
-    async def _try_core_fallback(self, func, args, scope):
-        """
-        Try resolving a core- prefixed builtin (e.g., has-key? -> core-has-key?).
+        if ic is not None and ic[3] is op_val:
+            # Same operator as last time: keep its func_path (and its resolve program)
+            _, func_path, func_name, _ = ic
+        else:
+            func_path = GetPath(op_val.segments, getattr(op_val, "meta", None))
+            if hasattr(raw_op_term, "loc"):
+                try:
+                    func_path.loc = raw_op_term.loc
+                except Exception:
+                    pass
+            func_name = None
+            if func_path.segments and isinstance(func_path.segments[-1], Name):
+                func_name = func_path.segments[-1].text
+        if site is not None:
+            site["_slip_op_ic"] = (
+                first_val if cacheable else _MISSING,
+                func_path,
+                func_name,
+                op_val,
+            )
+        return func_path, func_name
+
+    async def _try_core_fallback(self, func, args, scope):
+        """
+        Try resolving a core- prefixed builtin (e.g., has-key? -> core-has-key?).
         Returns result or None if unavailable.
         """
         try:
             name = getattr(func, "name", None)
             if isinstance(name, str):
-                from slip.slip_datatypes import GetPath as _GP, Name as _Name
-
-                core_path = _GP([_Name(f"core-{name}")])
+                core_path = GetPath([Name(f"core-{name}")])
                 alt = await self.path_resolver.get(core_path, scope)
                 return await self.call(alt, args, scope)
         except Exception:
@@ -1632,20 +2334,6 @@ class Evaluator:
         return None
 
     def _infer_primitive_name(self, val: object) -> str:
-        from slip.slip_datatypes import (
-            Scope,
-            Code,
-            IString,
-            SlipFunction as _SF,
-            GenericFunction as _GF,
-            GetPath as _GP,
-            SetPath as _SP,
-            DelPath as _DP,
-            PipedPath as _PP,
-            PathLiteral as _PL,
-            MultiSetPath as _MSP,
-        )
-
         if val is None:
             return "none"
         if isinstance(val, bool):
@@ -1664,9 +2352,11 @@ class Evaluator:
             return "dict"
         if isinstance(val, Scope):
             return "scope"
-        if isinstance(val, (_GP, _SP, _DP, _PP, _PL, _MSP)):
+        if isinstance(
+            val, (GetPath, SetPath, DelPath, PipedPath, PathLiteral, MultiSetPath)
+        ):
             return "path"
-        if isinstance(val, (_SF, _GF)) or callable(val):
+        if isinstance(val, (SlipFunction, GenericFunction)) or callable(val):
             return "function"
         if isinstance(val, Code):
             return "code"
@@ -1674,12 +2364,47 @@ class Evaluator:
 
     async def _synthesize_methods_from_examples(self, fn, param_names, scope):
         """Return list of SlipFunction clones with typed Sig from fn.meta.examples."""
-        from slip.slip_datatypes import Sig, SlipFunction, GetPath, Name
-
-        methods = []
         examples = getattr(getattr(fn, "meta", {}), "get", lambda *_: [])(
             "examples"
         ) or fn.meta.get("examples", [])
+        # The inferred signatures depend only on the examples when every sample is a
+        # literal; then they are kept on the function and reused by later assignments.
+        names_key = tuple(param_names)
+        cached = getattr(fn, "__dict__", {}).get("_example_sigs")
+        if (
+            cached is not None
+            and cached[0] is examples
+            and cached[1] == len(examples)
+            and cached[2] == names_key
+        ):
+            typed = cached[3]
+        else:
+            typed, cacheable = await self._infer_example_sigs(
+                fn, examples, param_names, scope
+            )
+            if cacheable:
+                try:
+                    fn._example_sigs = (examples, len(examples), names_key, typed)
+                except Exception:
+                    pass
+        methods = []
+        for ex, typed_items in typed:
+            # Fresh clones and Sigs each time: merging mutates the clones' examples.
+            clone = type(fn)(fn.args, fn.body, fn.closure)
+            clone.meta["type"] = Sig([], dict(typed_items), None, None)
+            clone.meta["examples"] = [ex]
+            if "guards" in fn.meta:
+                clone.meta["guards"] = list(fn.meta["guards"])
+            methods.append(clone)
+        return methods
+
+    async def _infer_example_sigs(self, fn, examples, param_names, scope):
+        """
+        Infer (example, typed keyword items) pairs from fn's example Sigs.
+        Also reports whether the result is cacheable (every sample was a literal).
+        """
+        typed = []
+        cacheable = True
         for ex in examples:
             if not isinstance(ex, Sig):
                 continue
@@ -1693,6 +2418,8 @@ class Evaluator:
                     ok = False
                     break
                 sample_spec = ex_kws[pname]
+                if type(sample_spec) not in _SYNC_VALUE_TYPES:
+                    cacheable = False
                 try:
                     # closure first, else current scope
                     try:
@@ -1706,14 +2433,8 @@ class Evaluator:
                 typed_kw[pname] = GetPath([Name(tname)])
             if not ok or len(typed_kw) != len(param_names):
                 continue
-            typed_sig = Sig([], typed_kw, None, None)
-            clone = type(fn)(fn.args, fn.body, fn.closure)
-            clone.meta["type"] = typed_sig
-            clone.meta["examples"] = [ex]
-            if "guards" in fn.meta:
-                clone.meta["guards"] = list(fn.meta["guards"])
-            methods.append(clone)
-        return methods
+            typed.append((ex, tuple(typed_kw.items())))
+        return typed, cacheable
 
     def _merge_methods_into_container(self, existing_gf, new_methods):
         """Merge new methods by signature and keep/merge examples."""
@@ -1721,11 +2442,11 @@ class Evaluator:
         for m in existing_gf.methods:
             s = getattr(m, "meta", {}).get("type")
             if s is not None:
-                sig_map[repr(s)] = m
+                sig_map[_sig_merge_key(s)] = m
         to_add = []
         for m in new_methods:
             s = getattr(m, "meta", {}).get("type")
-            key = repr(s) if s is not None else None
+            key = _sig_merge_key(s) if s is not None else None
             if key is not None and key in sig_map:
                 try:
                     dst_ex = sig_map[key].meta.setdefault("examples", [])
@@ -1742,46 +2463,52 @@ class Evaluator:
         return existing_gf
 
     def _push_frame(self, name, func, args, call_site_node):
-        loc = getattr(call_site_node, "loc", None)
+        # The surface syntax is rendered on demand (_frame_surface): frames are
+        # pushed on every call but only read when an error is reported.
+        self.call_stack.append(
+            {
+                "name": name,
+                "func": func,
+                "args": args,
+                "call_site": getattr(call_site_node, "loc", None),
+                "node": call_site_node,
+                "source_kind": self.current_source,
+            }
+        )
+
+    def _pop_frame(self):
+        if self.call_stack:
+            self.call_stack.pop()
 
-        # Best-effort: capture surface syntax for stacktraces.
+    @staticmethod
+    def _frame_surface(frame: dict) -> Optional[str]:
+        """
+        Surface syntax of a frame's call site for stack traces, rendered once
+        from the call-site node (falling back to the parser's token text).
+        """
+        if "surface" in frame or "node" not in frame:
+            return frame.get("surface")
         surface = None
         try:
-            from slip.slip_printer import Printer
-
-            surface = Printer().pformat(call_site_node)
+            surface = (_PRINTER or _load_printer())().pformat(frame["node"])
         except Exception:
             surface = None
 
         # Fallback: use parser-provided token text when available
         if not surface:
             try:
+                loc = frame.get("call_site")
                 if isinstance(loc, dict):
                     t = loc.get("text")
                     if isinstance(t, str) and t.strip():
                         surface = t.strip()
             except Exception:
                 pass
-
-        self.call_stack.append(
-            {
-                "name": name,
-                "func": func,
-                "args": args,
-                "call_site": loc,
-                "surface": surface,
-                "source_kind": self.current_source,
-            }
-        )
-
-    def _pop_frame(self):
-        if self.call_stack:
-            self.call_stack.pop()
+        frame["surface"] = surface
+        return surface
 
     def _dbg(self, *parts):
-        import os, sys
-
-        if os.environ.get("SLIP_DEBUG"):
+        if _SLIP_DEBUG:
             try:
                 print("[DBG]", *parts, file=sys.stderr)
             except Exception:
@@ -1806,32 +2533,26 @@ class Evaluator:
         async def preprocess_expr(terms: list) -> list:
             out: list = []
             for term in terms:
-                # Detect (inject ...) or (splice ...) forms: a Group with a single inner expression
-                if isinstance(term, Group) and term.nodes and len(term.nodes) == 1:
-                    inner_expr = term.nodes[0]
-                    if inner_expr and isinstance(inner_expr[0], GetPath):
-                        head = inner_expr[0]
-                        if len(head.segments) == 1 and isinstance(
-                            head.segments[0], Name
-                        ):
-                            fname = head.segments[0].text
-                            args = inner_expr[1:]
-                            if fname == "inject":
-                                if len(args) != 1:
-                                    raise TypeError("inject expects 1 argument")
-                                val = await self._eval(args[0], scope)
-                                out.append(val)
-                                continue
-                            if fname == "splice":
-                                if len(args) != 1:
-                                    raise TypeError("splice expects 1 argument")
-                                val = await self._eval(args[0], scope)
-                                if isinstance(val, list):
-                                    out.extend(val)
-                                    continue
-                                raise TypeError("splice in expression requires a list")
-                # Recurse into nested Group (non-inject/splice)
                 if isinstance(term, Group):
+                    # (inject ...) or (splice ...) forms: a Group with a single inner expression
+                    fname = term.splice_kind
+                    if fname is not None:
+                        args = term.nodes[0][1:]
+                        if len(args) != 1:
+                            raise TypeError(f"{fname} expects 1 argument")
+                        val = await self._eval(args[0], scope)
+                        if fname is _INJECT:
+                            out.append(val)
+                            continue
+                        if isinstance(val, list):
+                            out.extend(val)
+                            continue
+                        raise TypeError("splice in expression requires a list")
+                    # Subtrees without templating forms only need a structural copy
+                    if not term.has_templating:
+                        out.extend(_copy_expr_terms([term]))
+                        continue
+                    # Recurse into nested Group (non-inject/splice)
                     new_inner = []
                     for expr in term.nodes:
                         new_inner.append(await preprocess_expr(expr))
@@ -1845,6 +2566,9 @@ class Evaluator:
                     continue
                 # Recurse into list literal elements
                 if isinstance(term, SlipList):
+                    if not term.has_templating:
+                        out.extend(_copy_expr_terms([term]))
+                        continue
                     new_items = []
                     for expr in term.nodes:
                         new_items.append(await preprocess_expr(expr))
@@ -1871,28 +2595,20 @@ class Evaluator:
             # Whole-expression splice: [(splice ...)]
             if len(expr) == 1:
                 t = expr[0]
-                if isinstance(t, Group) and t.nodes and len(t.nodes) == 1:
-                    inner = t.nodes[0]
-                    if inner and isinstance(inner[0], GetPath):
-                        head = inner[0]
-                        if (
-                            len(head.segments) == 1
-                            and isinstance(head.segments[0], Name)
-                            and head.segments[0].text == "splice"
-                        ):
-                            args = inner[1:]
-                            if len(args) != 1:
-                                raise TypeError("splice expects 1 argument")
-                            val = await self._eval(args[0], scope)
-                            if isinstance(val, Code):
-                                nested = await self._expand_code_literal(val, scope)
-                                out_exprs.extend(nested)
-                                continue
-                            if isinstance(val, list):
-                                for item in val:
-                                    out_exprs.append([item])
-                                continue
-                            raise TypeError("splice in statement requires code or list")
+                if isinstance(t, Group) and t.splice_kind is _SPLICE:
+                    args = t.nodes[0][1:]
+                    if len(args) != 1:
+                        raise TypeError("splice expects 1 argument")
+                    val = await self._eval(args[0], scope)
+                    if isinstance(val, Code):
+                        nested = await self._expand_code_literal(val, scope)
+                        out_exprs.extend(nested)
+                        continue
+                    if isinstance(val, list):
+                        for item in val:
+                            out_exprs.append([item])
+                        continue
+                    raise TypeError("splice in statement requires code or list")
             # Normal expression: recursively preprocess all nested terms
             out_exprs.append(await preprocess_expr(expr))
         return out_exprs
@@ -1906,9 +2622,7 @@ class Evaluator:
             return
         core = getattr(self, "core_scope", None)
         # Only load if StdLib has provided a core scope to receive the bindings
-        from slip.slip_datatypes import Scope as _Scope
-
-        if not isinstance(core, _Scope):
+        if not isinstance(core, Scope):
             return
         # Mark first to avoid recursion if eval() re-enters
         self._core_loaded = True
@@ -1964,30 +2678,51 @@ class Evaluator:
             return
 
     async def _eval_istring_expr(self, expr_text: str, scope: Scope):
-        from pathlib import Path as _Path
-        from koine import Parser as _Parser
-        from slip.slip_transformer import SlipTransformer as _Transformer
-
-        cls = type(self)
-        parser = getattr(cls, "_core_parser", None)
-        if parser is None:
-            grammar_path = _Path(__file__).parent.parent / "grammar" / "slip_grammar.yaml"
-            parser = _Parser.from_file(str(grammar_path))
-            cls._core_parser = parser
-
-        parse_out = parser.parse(expr_text)
-        if isinstance(parse_out, dict) and parse_out.get("status") in {"error", "err"}:
-            raise SyntaxError(parse_out.get("error_message") or expr_text)
-        ast_node = parse_out.get("ast") if isinstance(parse_out, dict) else parse_out
-        transformed = _Transformer().transform(ast_node)
-        exprs = getattr(transformed, "nodes", transformed)
-        if not exprs:
+        try:
+            exprs = _ISTRING_EXPR_CACHE[expr_text]
+        except KeyError:
+            from pathlib import Path as _Path
+            from koine import Parser as _Parser
+            from slip.slip_transformer import SlipTransformer as _Transformer
+
+            cls = type(self)
+            parser = getattr(cls, "_core_parser", None)
+            if parser is None:
+                grammar_path = _Path(__file__).parent.parent / "grammar" / "slip_grammar.yaml"
+                parser = _Parser.from_file(str(grammar_path))
+                cls._core_parser = parser
+
+            parse_out = parser.parse(expr_text)
+            if isinstance(parse_out, dict) and parse_out.get("status") in {"error", "err"}:
+                raise SyntaxError(parse_out.get("error_message") or expr_text)
+            ast_node = parse_out.get("ast") if isinstance(parse_out, dict) else parse_out
+            transformed = _Transformer().transform(ast_node)
+            if not isinstance(transformed, (Code, Group)):
+                transformed = Code(transformed if isinstance(transformed, list) else [[transformed]])
+            exprs = _cache_put(_ISTRING_EXPR_CACHE, expr_text, transformed)
+        if not exprs.nodes:
             return ""
-        return await self._eval(exprs, scope)
+        # Flat `{{name}}` holes read the binding directly; values that the full
+        # expression path would call or treat as a write target take the slow path.
+        path = exprs.__dict__.get("_hole_path", _NOT_PEEKED)
+        if path is _NOT_PEEKED:
+            path = exprs._hole_path = _simple_hole_path(exprs.nodes)
+        if path is not None:
+            self.current_node = path
+            v = await self.path_resolver.get(path, scope)
+            if not (callable(v) or isinstance(v, _HOLE_SLOW_TYPES)):
+                return v
+        # A cached block, so its compiled program is reused by every render.
+        return await self._exec_block(exprs, scope)
 
-    async def _stringify_istring_value(self, value, scope: Scope) -> str:
+    async def _stringify_istring_value(self, value, scope: Scope, to_str=_NOT_PEEKED) -> str:
+        # `to_str` lets a render resolve the `to-str` binding once for all of its holes
+        # (None when the lookup failed).
         try:
-            to_str = await self.path_resolver.get(GetPath([Name("to-str")]), scope)
+            if to_str is _NOT_PEEKED:
+                to_str = await self.path_resolver.get(_TO_STR_PATH, scope)
+            if to_str is None:
+                raise LookupError("to-str")
             value = await self.call(to_str, [value], scope)
         except Exception:
             std = getattr(self, "stdlib", None)
@@ -2004,25 +2739,84 @@ class Evaluator:
                 value = str(value)
         return str(value)
 
-    async def _render_istring(self, raw: str, scope: Scope) -> str:
-        text = dedent(raw)
-        if text.startswith("\n"):
-            text = text[1:]
-        if text.endswith("\n"):
-            text = text[:-1]
-
-        parts = []
-        pos = 0
-        for match in re.finditer(r"\{\{(.*?)\}\}", text, flags=re.DOTALL):
-            parts.append(text[pos:match.start()])
-            expr_text = match.group(1).strip()
-            if expr_text:
-                value = await self._eval_istring_expr(expr_text, scope)
-                parts.append(await self._stringify_istring_value(value, scope))
-            pos = match.end()
-        parts.append(text[pos:])
+    async def _render_istring(self, template: tuple, scope: Scope) -> str:
+        """Render a compiled i-string template (see _compile_istring_template)."""
+        chunks, exprs = template
+        if not exprs:
+            return chunks[0]
+        try:
+            to_str = await self.path_resolver.get(_TO_STR_PATH, scope)
+        except Exception:
+            to_str = None
+        parts = [chunks[0]]
+        for expr_text, chunk in zip(exprs, chunks[1:]):
+            value = await self._eval_istring_expr(expr_text, scope)
+            parts.append(await self._stringify_istring_value(value, scope, to_str))
+            parts.append(chunk)
         return "".join(parts)
 
+    @staticmethod
+    def _compile_block(nodes: List[Any]) -> tuple:
+        """Lower a block's expression list to flat (opcode, operand, plan) triples."""
+        if not nodes:
+            return ()
+        # Same shape rule as the list branch of _eval: a list of expressions,
+        # or a single expression (list of terms).
+        exprs = nodes if isinstance(nodes[0], list) else (nodes,)
+        program = []
+        for expr in exprs:
+            if len(expr) == 1 and type(expr[0]) in _BC_LITERAL_TYPES:
+                program.append((_BC_LITERAL, expr[0], None))
+            else:
+                program.append((_BC_EXPR, expr, _expr_plan(expr) if expr else None))
+        return tuple(program)
+
+    def _block_program(self, block: Any) -> tuple:
+        """The block's compiled program, cached on the block (SlipBlock mutators drop it)."""
+        nodes = block.nodes
+        cached = block.__dict__.get("_bytecode")
+        if cached is None or cached[0] is not nodes:
+            cached = (nodes, self._compile_block(nodes))
+            block._bytecode = cached
+        return cached[1]
+
+    async def _exec_block(self, block: Any, scope: Scope) -> Any:
+        """
+        Evaluate a Code/Group body; equivalent to ``_eval(block.nodes, scope)``.
+        The body is lowered once and cached on the block (SlipBlock mutators drop
+        the cache), so repeated runs skip the shape checks and the recursive
+        dispatch for literal statements.
+        """
+        if not self._core_loaded:
+            try:
+                await self._ensure_core_loaded()
+            except Exception:
+                pass
+        self.current_node = block.nodes
+        eval_expr = self._eval_expr
+        result = None
+        for op, operand, plan in self._block_program(block):
+            if op == _BC_LITERAL:
+                self.current_node = operand
+                result = operand
+                continue
+            result = await eval_expr(operand, scope, plan)
+            # Only propagate 'return' control-flow responses; other responses are data.
+            if is_return(result):
+                return result
+        return result
+
+    def _eval_sync(self, node: Any) -> Any:
+        """
+        The synchronous part of _eval: primitive and path literals evaluate to
+        themselves, so hot call sites can skip creating a coroutine for them.
+        Returns _NOT_SYNC when the node needs the full _eval.
+        """
+        if type(node) in _SYNC_VALUE_TYPES:
+            self.current_node = node
+            return node
+        return _NOT_SYNC
+
     async def _eval(self, node: Any, scope: Scope) -> Any:
         """Recursive dispatcher for evaluating any AST node."""
         # Load core library once before evaluating anything (needed for bare Evaluator usage)
@@ -2055,7 +2849,6 @@ class Evaluator:
 
         match node:
             case GetPath():
-                self.current_node = node
                 v = await self.path_resolver.get(node, scope)
                 # Ensure Ref/Cell values reduce when accessed through a path lookup.
                 if isinstance(v, (Ref, Cell)):
@@ -2067,17 +2860,23 @@ class Evaluator:
                 return node
 
             case Group():
-                self.current_node = node
-                return await self._eval(node.nodes, scope)
+                return await self._exec_block(node, scope)
 
             case SlipList():
-                results = []
-                this_val = getattr(scope, "bindings", {}).get("this", object())
-                for expr in node.nodes:
-                    v = await self._eval_expr(expr, scope)
+                # Items come from the cached block program: literal items are taken
+                # as-is, the rest are evaluated into a preallocated result list.
+                program = self._block_program(node)
+                results = [None] * len(program)
+                this_val = getattr(scope, "bindings", {}).get("this", _MISSING)
+                eval_expr = self._eval_expr
+                for i, (op, operand, plan) in enumerate(program):
+                    if op == _BC_LITERAL:
+                        results[i] = operand
+                        continue
+                    v = await eval_expr(operand, scope, plan)
                     if v is this_val:
                         raise PermissionError("`this` cannot be stored")
-                    results.append(v)
+                    results[i] = v
                 return results
 
             case ByteStream() as bs:
@@ -2087,125 +2886,93 @@ class Evaluator:
                     v = await self._eval_expr(expr, scope)
                     vals.append(v)
                 # Pack to bytes according to elem_type
-                import struct
-
                 t = (bs.elem_type or "").lower()
                 try:
-                    match t:
-                        case "u8":
-                            out = bytes(int(x) & 0xFF for x in vals)
-                        case "i8":
-                            out = bytes((int(x) + 256) % 256 for x in vals)
-                        case "u16":
-                            out = b"".join(
-                                struct.pack("<H", int(x) & 0xFFFF) for x in vals
-                            )
-                        case "i16":
-                            out = b"".join(struct.pack("<h", int(x)) for x in vals)
-                        case "u32":
-                            out = b"".join(
-                                struct.pack("<I", int(x) & 0xFFFFFFFF) for x in vals
-                            )
-                        case "i32":
-                            out = b"".join(struct.pack("<i", int(x)) for x in vals)
-                        case "u64":
-                            out = b"".join(
-                                struct.pack("<Q", int(x) & 0xFFFFFFFFFFFFFFFF)
-                                for x in vals
-                            )
-                        case "i64":
-                            out = b"".join(struct.pack("<q", int(x)) for x in vals)
-                        case "f32":
-                            out = b"".join(struct.pack("<f", float(x)) for x in vals)
-                        case "f64":
-                            out = b"".join(struct.pack("<d", float(x)) for x in vals)
-                        case "b1":
-                            b = 0
-                            count = 0
-                            chunks = []
-                            for x in vals:
-                                bit = 1 if bool(x) else 0
-                                b = ((b << 1) | bit) & 0xFF
-                                count += 1
-                                if count == 8:
-                                    chunks.append(b.to_bytes(1, "little"))
-                                    b = 0
-                                    count = 0
-                            if count > 0:
-                                b = (b << (8 - count)) & 0xFF
-                                chunks.append(b.to_bytes(1, "little"))
-                            out = b"".join(chunks)
-                        case _:
-                            raise TypeError(f"Unknown byte-stream type: {t!r}")
+                    fmt = _BYTESTREAM_FORMATS.get(t)
+                    if fmt is not None:
+                        # One packer call for the whole stream instead of a pack per item.
+                        code, conv, mask = fmt
+                        if mask is None:
+                            items = [conv(x) for x in vals]
+                        else:
+                            items = [int(x) & mask for x in vals]
+                        out = struct.pack(f"<{len(items)}{code}", *items)
+                    else:
+                        match t:
+                            case "u8":
+                                out = bytes(int(x) & 0xFF for x in vals)
+                            case "i8":
+                                out = bytes((int(x) + 256) % 256 for x in vals)
+                            case "b1":
+                                # MSB-first bits, the last byte zero-padded on the right.
+                                bits = "".join("1" if x else "0" for x in vals)
+                                if bits:
+                                    bits += "0" * (-len(bits) % 8)
+                                    out = int(bits, 2).to_bytes(len(bits) // 8, "big")
+                                else:
+                                    out = b""
+                            case _:
+                                raise TypeError(f"Unknown byte-stream type: {t!r}")
                 except Exception as e:
                     raise TypeError(f"Invalid value for {t} byte stream: {e}")
                 return out
 
             case tuple() as t if len(t) > 0 and t[0] == "dict":
-                from slip.slip_runtime import SlipDict
-
+                SlipDict = _SLIP_DICT or _load_slip_dict()
                 # Use a child scope so lookups (e.g., +, names) resolve via the parent chain,
                 # but ensure assignments inside the dict literal NEVER leak into the parent scope.
-                temp_scope = Scope(parent=scope)
-                for expr in node[1]:
-                    # Fast path: simple "<key>: <value>" assignments write directly to the temp scope
-                    if isinstance(expr, list) and expr and isinstance(expr[0], SetPath):
-                        sp = expr[0]
-                        if len(sp.segments) == 1:
-                            seg0 = sp.segments[0]
-                            key = None
-
-                            # Static key: Name segment
-                            if isinstance(seg0, Name):
-                                key = seg0.text
-
-                            # Dynamic/interpolated key: Group segment evaluates to the key
-                            elif isinstance(seg0, Group):
-                                # Dynamic/interpolated key: evaluate in the *outer* lexical scope so i-strings
-                                # can see bindings like `k` that exist outside the dict literal.
-                                #
-                                # Group evaluation returns the last expression's value; for a single i-string key
-                                # this yields a concrete Python str (after interpolation).
-                                key = await self._eval(seg0.nodes, scope)
-                                if isinstance(key, IString):
-                                    key = str(key)
-
-                            if key is not None:
-                                rhs_terms = expr[1:]
-                                # Normalize i-string sugar inside dict values:
-                                # allow "key: i\"...\"" syntax by treating [GetPath('i'), IString(...)] as a single IString value
-                                if (
-                                    len(rhs_terms) == 2
-                                    and isinstance(rhs_terms[0], GetPath)
-                                    and len(rhs_terms[0].segments) == 1
-                                    and isinstance(rhs_terms[0].segments[0], Name)
-                                    and rhs_terms[0].segments[0].text == "i"
-                                    and isinstance(rhs_terms[1], IString)
-                                ):
-                                    val = rhs_terms[1]
-                                else:
-                                    val = await self._eval_expr(rhs_terms, temp_scope)
-
-                                # Contract: `this` cannot be stored in containers.
-                                # `this` is bound in the surrounding call scope (not temp_scope).
-                                if val is getattr(scope, "bindings", {}).get(
-                                    "this", object()
-                                ):
-                                    raise PermissionError("`this` cannot be stored")
-
-                                temp_scope[str(key)] = val
-                                continue
-
-                    # Fallback: evaluate any other expressions for their value/side-effects
-                    await self._eval_expr(expr, temp_scope)
+                # The entries are copied out before release, so the scope is pooled like a
+                # call scope; a closure defined in the literal marks it captured.
+                if self.scope_pooling:
+                    temp_scope = Scope._acquire(parent=scope)
+                else:
+                    temp_scope = Scope(parent=scope)
+                # Contract: `this` cannot be stored in containers.
+                # `this` is bound in the surrounding call scope (not temp_scope).
+                this_val = getattr(scope, "bindings", {}).get("this", _MISSING)
+                for tag, head, rhs_terms, sugar, expr in _dict_literal_plan(node[1]):
+                    if tag == _DICT_EXPR:
+                        # Evaluate any other expressions for their value/side-effects
+                        await self._eval_expr(expr, temp_scope)
+                        continue
+                    if tag == _DICT_NAME:
+                        key = head
+                    else:
+                        # Dynamic/interpolated key: evaluate in the *outer* lexical scope so i-strings
+                        # can see bindings like `k` that exist outside the dict literal.
+                        #
+                        # Group evaluation returns the last expression's value; for a single i-string key
+                        # this yields a concrete Python str (after interpolation).
+                        key = await self._exec_block(head, scope)
+                        if key is None:
+                            await self._eval_expr(expr, temp_scope)
+                            continue
+                        if isinstance(key, IString):
+                            key = str(key)
+                    if sugar is not _MISSING:
+                        val = sugar
+                    else:
+                        val = await self._eval_expr(rhs_terms, temp_scope)
+                    if val is this_val:
+                        raise PermissionError("`this` cannot be stored")
+                    temp_scope[str(key)] = val
+                # Bulk copy at C level; map(str) keeps exact-str keys and normalizes subclasses.
                 out = SlipDict()
-                for k, v in temp_scope.bindings.items():
-                    out[str(k)] = v
+                bindings = temp_scope.bindings
+                out.data.update(zip(map(str, bindings), bindings.values()))
+                del bindings
+                # _release skips the scope if _mark_captured flagged it (e.g. a closure).
+                if self.scope_pooling:
+                    Scope._release(temp_scope)
                 return out
 
             case Code() as code:
-                # Definition-time expansion of inject/splice to produce a pure Code value
-                exprs = await self._expand_code_literal(code, scope)
+                # Definition-time expansion of inject/splice to produce a pure Code value.
+                # Without templating forms expansion is a plain copy, so skip the walk.
+                if code.has_templating:
+                    exprs = await self._expand_code_literal(code, scope)
+                else:
+                    exprs = [_copy_expr_terms(expr) for expr in code.nodes]
                 new_code = Code(exprs)
                 # Ensure the code block carries a reference to the core scope if it's the root
                 if not getattr(scope, "parent", None) and hasattr(self, "core_scope"):
@@ -2222,33 +2989,21 @@ class Evaluator:
 
             case Ref() as r:
                 # A Ref evaluates to the current value at its target path.
-                from slip.slip_datatypes import (
-                    Ref as _Ref,
-                    PathLiteral as _PL,
-                    GetPath as _GP,
-                )
-
                 p = r.path
-                if isinstance(p, _PL):
+                if isinstance(p, PathLiteral):
                     p = p.inner
-                if not isinstance(p, _GP):
+                if not isinstance(p, GetPath):
                     raise TypeError("ref expects a get-path")
                 return await self.path_resolver.get(p, scope)
 
             case Cell() as c:
                 # A Cell evaluates to its current computed value.
-                from slip.slip_datatypes import (
-                    Ref as _Ref,
-                    PathLiteral as _PL,
-                    GetPath as _GP,
-                )
-
                 call_scope = Scope(parent=c.closure)
 
                 async def _resolve_spec(spec):
                     # Resolve a cell input spec to its current value.
                     # Specs may be: Ref, PathLiteral(GetPath), GetPath, string/IString.
-                    if isinstance(spec, _Ref):
+                    if isinstance(spec, Ref):
                         return await self.path_resolver.get(spec.path, scope)
 
                     std = getattr(self, "stdlib", None)
@@ -2264,131 +3019,119 @@ class Evaluator:
                     bound_val = await _resolve_spec(spec)
                     call_scope[str(name)] = bound_val
 
-                return await self._eval(c.body.ast, call_scope)
+                return await self._exec_block(c.body, call_scope)
 
             case IString():
                 # Auto-dedent and evaluate each {{...}} hole as a SLIP expression
                 # in the current lexical scope.
-                rendered = await self._render_istring(str(node), scope)
+                # The split template is kept on the node, so re-evaluation skips
+                # the str copy and cache lookup of the full text.
+                d = node.__dict__
+                template = d.get("_template")
+                if template is None:
+                    template = node._template = _compile_istring_template(str(node))
+                if not template[1]:
+                    # No holes: the dedented text is the value; build that IString once.
+                    static = d.get("_static")
+                    if static is None:
+                        static = node._static = IString(template[0][0])
+                    return static
+                rendered = await self._render_istring(template, scope)
                 return IString(rendered)
 
             case _:
                 # It's a literal (int, str, bool, None, etc.)
                 return node
 
-    async def _eval_expr(self, terms: List[Any], scope: Scope) -> Any:
-        """Evaluates a single expression (a list of terms)."""
+    async def _eval_expr(
+        self, terms: List[Any], scope: Scope, plan: Optional[tuple] = None
+    ) -> Any:
+        """
+        Evaluates a single expression (a list of terms). `plan` is the
+        expression's _expr_plan, precomputed by block programs; it is derived
+        here when the caller does not have one.
+        """
         if not terms:
             return None
 
         head_uneval = terms[0]
 
         # Handle assignment/deletion forms first, as they consume the whole expression.
-        match head_uneval:
-            case SetPath():
-                # Contract: `this` is reserved and cannot be assigned as a normal binding target.
-                if (
-                    len(head_uneval.segments) == 1
-                    and isinstance(head_uneval.segments[0], Name)
-                    and head_uneval.segments[0].text == "this"
-                ):
-                    err = SyntaxError("`this` is reserved and cannot be assigned")
-                    try:
-                        err.slip_obj = head_uneval
-                    except Exception:
-                        pass
-                    raise err
-
-                # IR: the transformer may annotate writes as 'commit' vs 'value'.
-                write_kind = getattr(head_uneval, "write_kind", None)
-
-                value_expr = terms[1:]
-                if not value_expr:
-                    raise SyntaxError("SetPath must be followed by a value.")
+        kind = node_kind(head_uneval)
+        if kind == KIND_SET_PATH:
+            # Contract: `this` is reserved and cannot be assigned as a normal binding target.
+            if (
+                len(head_uneval.segments) == 1
+                and type(head_uneval.segments[0]) is Name
+                and head_uneval.segments[0].text is _THIS
+            ):
+                err = SyntaxError("`this` is reserved and cannot be assigned")
+                try:
+                    err.slip_obj = head_uneval
+                except Exception:
+                    pass
+                raise err
 
-                # Detect update-style RHS (seed with current value): "+ 1", "|heal", "|add 5", etc.
-                # Determine if RHS starts with a pipe operator (literal or alias to a PipedPath)
-                update_style = False
-                first = value_expr[0] if value_expr else None
-                if isinstance(first, PipedPath):
-                    update_style = True
-                elif isinstance(first, GetPath):
-                    try:
-                        resolved = await self._eval(first, scope)
-                        update_style = isinstance(resolved, PipedPath)
-                    except Exception:
-                        update_style = False
+            # IR: the transformer may annotate writes as 'commit' vs 'value'.
+            write_kind = getattr(head_uneval, "write_kind", None)
 
-                # Vectorized write: LHS ending with a filter on a plucked field
-                is_vectorized_target = (
-                    self.path_resolver._parse_vectorized_target(head_uneval) is not None
-                )
-                if is_vectorized_target:
-                    if update_style:
-                        # Apply RHS as per-element update seeded with each old value
-                        return await self.path_resolver.set_vectorized_update(
-                            head_uneval, value_expr, scope
-                        )
-                    else:
-                        # Plain assignment: broadcast or elementwise if RHS is list of matching length
-                        return await self.path_resolver.set_vectorized_assign(
-                            head_uneval, value_expr, scope
-                        )
+            value_expr = terms[1:]
+            if not value_expr:
+                raise SyntaxError("SetPath must be followed by a value.")
 
-                if update_style:
-                    # Try to read current value; if not found, or if the existing binding is itself a piped-path alias,
-                    # treat as a normal assignment (e.g., "+: |add" or rebind "/+: |sub") rather than an update.
-                    try:
-                        cur_val = await self.path_resolver.get(
-                            GetPath(head_uneval.segments, head_uneval.meta), scope
-                        )
-                        if isinstance(cur_val, PipedPath):
-                            update_style = False
-                    except PathNotFound:
-                        update_style = False
+            # Detect update-style RHS (seed with current value): "+ 1", "|heal", "|add 5", etc.
+            # Determine if RHS starts with a pipe operator (literal or alias to a PipedPath)
+            update_style = False
+            first = value_expr[0] if value_expr else None
+            if type(first) is PipedPath:
+                update_style = True
+            elif type(first) is GetPath:
+                try:
+                    resolved = await self._eval(first, scope)
+                    update_style = type(resolved) is PipedPath
+                except Exception:
+                    update_style = False
 
+            # Vectorized write: LHS ending with a filter on a plucked field
+            is_vectorized_target = (
+                self.path_resolver._parse_vectorized_target(head_uneval) is not None
+            )
+            if is_vectorized_target:
                 if update_style:
-                    # Seed the RHS chain with the current value, evaluate, set, and return the new value.
-                    new_value = unwrap_return(
-                        await self._eval_expr([cur_val] + value_expr, scope)
+                    # Apply RHS as per-element update seeded with each old value
+                    return await self.path_resolver.set_vectorized_update(
+                        head_uneval, value_expr, scope
+                    )
+                else:
+                    # Plain assignment: broadcast or elementwise if RHS is list of matching length
+                    return await self.path_resolver.set_vectorized_assign(
+                        head_uneval, value_expr, scope
                     )
 
-                    # Commit writes are rooted at the active transaction receiver, not lexical scope.
-                    if write_kind == "commit":
-                        recv = getattr(self, "_active_this_receiver", None)
-                        is_resolver = bool(
-                            getattr(self, "_active_this_is_resolver", False)
-                        )
-                        if recv is None or not is_resolver:
-                            err = PermissionError(
-                                "Committed writes require a resolver transaction (`fn {this: ResolverType, ...}`)"
-                            )
-                            try:
-                                err.slip_obj = head_uneval
-                            except Exception:
-                                pass
-                            raise err
-                        # Strip leading `this` and write into receiver namespace.
-                        tail = SetPath(
-                            list(head_uneval.segments[1:]),
-                            getattr(head_uneval, "meta", None),
-                        )
-                        self.current_node = head_uneval
-                        await self.path_resolver.set(tail, new_value, recv)
-                        return new_value
-
-                    self.current_node = head_uneval
-                    await self.path_resolver.set(head_uneval, new_value, scope)
-                    return new_value
+            if update_style:
+                # Try to read current value; if not found, or if the existing binding is itself a piped-path alias,
+                # treat as a normal assignment (e.g., "+: |add" or rebind "/+: |sub") rather than an update.
+                try:
+                    cur_val = await self.path_resolver.get(
+                        self.path_resolver._read_path(head_uneval), scope
+                    )
+                    if type(cur_val) is PipedPath:
+                        update_style = False
+                except PathNotFound:
+                    update_style = False
 
-                # Normal assignment: evaluate RHS as a value, set, return the assigned value (or merged GF)
-                self.current_node = head_uneval
-                value = unwrap_return(await self._eval_expr(value_expr, scope))
+            if update_style:
+                # Seed the RHS chain with the current value, evaluate, set, and return the new value.
+                new_value = unwrap_return(
+                    await self._eval_expr([cur_val] + value_expr, scope)
+                )
 
                 # Commit writes are rooted at the active transaction receiver, not lexical scope.
                 if write_kind == "commit":
                     recv = getattr(self, "_active_this_receiver", None)
-                    is_resolver = bool(getattr(self, "_active_this_is_resolver", False))
+                    is_resolver = bool(
+                        getattr(self, "_active_this_is_resolver", False)
+                    )
                     if recv is None or not is_resolver:
                         err = PermissionError(
                             "Committed writes require a resolver transaction (`fn {this: ResolverType, ...}`)"
@@ -2398,371 +3141,377 @@ class Evaluator:
                         except Exception:
                             pass
                         raise err
+                    # Strip leading `this` and write into receiver namespace.
                     tail = SetPath(
                         list(head_uneval.segments[1:]),
                         getattr(head_uneval, "meta", None),
                     )
-                    await self.path_resolver.set(tail, value, recv)
-                    return value
+                    self.current_node = head_uneval
+                    await self.path_resolver.set(tail, new_value, recv)
+                    return new_value
 
-                # Alias write: if LHS is a simple name bound to a path, write to that path instead of rebinding
-                if len(head_uneval.segments) == 1 and isinstance(
-                    head_uneval.segments[0], Name
-                ):
-                    tname = head_uneval.segments[0].text
+                self.current_node = head_uneval
+                await self.path_resolver.set(head_uneval, new_value, scope)
+                return new_value
+
+            # Normal assignment: evaluate RHS as a value, set, return the assigned value (or merged GF)
+            self.current_node = head_uneval
+            value = unwrap_return(
+                await self._eval_expr(
+                    value_expr, scope, plan[2] if plan is not None else None
+                )
+            )
+
+            # Commit writes are rooted at the active transaction receiver, not lexical scope.
+            if write_kind == "commit":
+                recv = getattr(self, "_active_this_receiver", None)
+                is_resolver = bool(getattr(self, "_active_this_is_resolver", False))
+                if recv is None or not is_resolver:
+                    err = PermissionError(
+                        "Committed writes require a resolver transaction (`fn {this: ResolverType, ...}`)"
+                    )
                     try:
-                        existing = scope[tname]
-                    except KeyError:
-                        existing = None
-                    from slip.slip_datatypes import GetPath as _GP, PathLiteral as _PL
+                        err.slip_obj = head_uneval
+                    except Exception:
+                        pass
+                    raise err
+                tail = SetPath(
+                    list(head_uneval.segments[1:]),
+                    getattr(head_uneval, "meta", None),
+                )
+                await self.path_resolver.set(tail, value, recv)
+                return value
 
-                    if isinstance(existing, _PL) and isinstance(
-                        getattr(existing, "inner", None), _GP
-                    ):
-                        existing = existing.inner
-                    if isinstance(existing, _GP):
-                        await self.path_resolver.set(
-                            SetPath(existing.segments, getattr(existing, "meta", None)),
-                            value,
-                            scope,
-                        )
-                        return value
+            # Alias write: if LHS is a simple name bound to a path, write to that path instead of rebinding
+            if len(head_uneval.segments) == 1 and isinstance(
+                head_uneval.segments[0], Name
+            ):
+                tname = head_uneval.segments[0].text
+                try:
+                    existing = scope[tname]
+                except KeyError:
+                    existing = None
+                if isinstance(existing, PathLiteral) and isinstance(
+                    getattr(existing, "inner", None), GetPath
+                ):
+                    existing = existing.inner
+                if type(existing) is GetPath:
+                    await self.path_resolver.set(
+                        SetPath(existing.segments, getattr(existing, "meta", None)),
+                        value,
+                        scope,
+                    )
+                    return value
 
-                if isinstance(value, SlipFunction):
-                    # Begin replacement: synthesize typed methods from examples when untyped
-                    sig_obj = None
-                    if hasattr(value, "meta"):
-                        mt = value.meta.get("type")
-                        if isinstance(mt, Sig):
-                            sig_obj = mt
+            if isinstance(value, SlipFunction):
+                # Begin replacement: synthesize typed methods from examples when untyped
+                sig_obj = None
+                if hasattr(value, "meta"):
+                    mt = value.meta.get("type")
+                    if isinstance(mt, Sig):
+                        sig_obj = mt
 
-                    def _pname(n):
-                        return n if isinstance(n, str) else getattr(n, "text", str(n))
+                def _pname(n):
+                    return n if isinstance(n, str) else getattr(n, "text", str(n))
 
-                    async def _resolve_value(node_obj):
-                        # Try in function closure first, then current scope
-                        try:
-                            return await self._eval(node_obj, value.closure)
-                        except Exception:
-                            return await self._eval(node_obj, scope)
+                async def _resolve_value(node_obj):
+                    # Try in function closure first, then current scope
+                    try:
+                        return await self._eval(node_obj, value.closure)
+                    except Exception:
+                        return await self._eval(node_obj, scope)
 
-                    # deduplicated: infer primitive name via helper
+                # deduplicated: infer primitive name via helper
 
-                    # Decide if function is already explicitly typed
-                    has_explicit_types = isinstance(sig_obj, Sig) and bool(
-                        getattr(sig_obj, "keywords", {})
-                    )
+                # Decide if function is already explicitly typed
+                has_explicit_types = isinstance(sig_obj, Sig) and bool(
+                    getattr(sig_obj, "keywords", {})
+                )
 
-                    # Gather parameter names (for untyped functions)
-                    param_names: list[str] = []
-                    if isinstance(sig_obj, Sig) and not has_explicit_types:
-                        param_names = [_pname(n) for n in (sig_obj.positional or [])]
-                    elif sig_obj is None and isinstance(value.args, Code):
-                        params = value.args.nodes
-                        for param_expr in params:
-                            pn = param_expr
-                            if isinstance(pn, list) and len(pn) == 1:
-                                pn = pn[0]
-                            if (
-                                isinstance(pn, GetPath)
-                                and len(pn.segments) == 1
-                                and isinstance(pn.segments[0], Name)
-                            ):
-                                param_names.append(pn.segments[0].text)
-
-                    methods_to_add = []
-                    if (not has_explicit_types) and getattr(value, "meta", None):
-                        methods_to_add = await self._synthesize_methods_from_examples(
-                            value, param_names, scope
-                        )
+                # Gather parameter names (for untyped functions)
+                param_names: list[str] = []
+                if isinstance(sig_obj, Sig) and not has_explicit_types:
+                    param_names = [_pname(n) for n in (sig_obj.positional or [])]
+                elif sig_obj is None and isinstance(value.args, Code):
+                    params = value.args.nodes
+                    for param_expr in params:
+                        pn = param_expr
+                        if isinstance(pn, list) and len(pn) == 1:
+                            pn = pn[0]
+                        if (
+                            type(pn) is GetPath
+                            and len(pn.segments) == 1
+                            and type(pn.segments[0]) is Name
+                        ):
+                            param_names.append(pn.segments[0].text)
 
-                    # Merge into a GenericFunction (existing or new)
-                    # Local-only merge: do not pull an existing container from parent scopes.
-                    lhs_name = (
-                        head_uneval.segments[0].text
-                        if len(head_uneval.segments) == 1
-                        and isinstance(head_uneval.segments[0], Name)
-                        else None
-                    )
-                    existing = (
-                        scope.bindings.get(lhs_name)
-                        if (lhs_name is not None and isinstance(scope, Scope))
-                        else None
+                methods_to_add = []
+                if (not has_explicit_types) and getattr(value, "meta", None):
+                    methods_to_add = await self._synthesize_methods_from_examples(
+                        value, param_names, scope
                     )
 
-                    if isinstance(existing, GenericFunction):
-                        if methods_to_add:
-                            merged = self._merge_methods_into_container(
-                                existing, methods_to_add
-                            )
-                            await self.path_resolver.set(head_uneval, merged, scope)
-                            return merged
-                        else:
-                            existing.add_method(value)
-                            await self.path_resolver.set(head_uneval, existing, scope)
-                            return existing
+                # Merge into a GenericFunction (existing or new)
+                # Local-only merge: do not pull an existing container from parent scopes.
+                lhs_name = (
+                    head_uneval.segments[0].text
+                    if len(head_uneval.segments) == 1
+                    and type(head_uneval.segments[0]) is Name
+                    else None
+                )
+                existing = (
+                    scope.bindings.get(lhs_name)
+                    if (lhs_name is not None and isinstance(scope, Scope))
+                    else None
+                )
+
+                if isinstance(existing, GenericFunction):
+                    if methods_to_add:
+                        merged = self._merge_methods_into_container(
+                            existing, methods_to_add
+                        )
+                        await self.path_resolver.set(head_uneval, merged, scope)
+                        return merged
                     else:
-                        name = None
-                        if isinstance(head_uneval.segments[-1], Name):
-                            name = head_uneval.segments[-1].text
-                        gf = GenericFunction(name)
-                        if methods_to_add:
-                            # Merge duplicates by signature and keep all examples
-                            sig_map = {}
-                            for m in methods_to_add:
-                                s = getattr(m, "meta", {}).get("type")
-                                key = repr(s) if s is not None else None
-                                if key is None or key not in sig_map:
-                                    sig_map[key] = m
-                                else:
-                                    try:
-                                        dst_ex = sig_map[key].meta.setdefault(
-                                            "examples", []
-                                        )
-                                        src_ex = (
-                                            getattr(m, "meta", {}).get("examples") or []
-                                        )
-                                        dst_ex.extend(
-                                            x for x in src_ex if x not in dst_ex
-                                        )
-                                    except Exception:
-                                        pass
-                            for m in sig_map.values():
-                                gf.add_method(m)
-                        else:
-                            gf.add_method(value)
-                        await self.path_resolver.set(head_uneval, gf, scope)
-                        return gf
-                    # End replacement
+                        existing.add_method(value)
+                        await self.path_resolver.set(head_uneval, existing, scope)
+                        return existing
                 else:
-
-                    def _rhs_mentions_name(terms, target):
-                        for t in terms:
-                            if (
-                                isinstance(t, GetPath)
-                                and len(t.segments) == 1
-                                and isinstance(t.segments[0], Name)
-                                and t.segments[0].text == target
-                            ):
-                                return True
-                            if isinstance(t, Group):
-                                for expr in t.nodes:
-                                    if _rhs_mentions_name(expr, target):
-                                        return True
-                            if isinstance(t, SlipList):
-                                for expr in t.nodes:
-                                    if _rhs_mentions_name(expr, target):
-                                        return True
-                            if isinstance(t, list):
-                                if _rhs_mentions_name(t, target):
-                                    return True
-                        return False
-
-                    prev_bind = getattr(self, "bind_locals_prefer_container", False)
-                    try:
-                        # Default local-by-default
-                        prefer_local = True
-                        # If assigning to a simple local name and RHS references that name, and a parent owns it, prefer owner write
-                        if len(head_uneval.segments) == 1 and isinstance(
-                            head_uneval.segments[0], Name
+                    name = None
+                    if type(head_uneval.segments[-1]) is Name:
+                        name = head_uneval.segments[-1].text
+                    gf = GenericFunction(name)
+                    if methods_to_add:
+                        # Merge duplicates by signature and keep all examples
+                        sig_map = {}
+                        for m in methods_to_add:
+                            s = getattr(m, "meta", {}).get("type")
+                            key = _sig_merge_key(s) if s is not None else None
+                            if key is None or key not in sig_map:
+                                sig_map[key] = m
+                            else:
+                                try:
+                                    dst_ex = sig_map[key].meta.setdefault(
+                                        "examples", []
+                                    )
+                                    src_ex = (
+                                        getattr(m, "meta", {}).get("examples") or []
+                                    )
+                                    dst_ex.extend(
+                                        x for x in src_ex if x not in dst_ex
+                                    )
+                                except Exception:
+                                    pass
+                        for m in sig_map.values():
+                            gf.add_method(m)
+                    else:
+                        gf.add_method(value)
+                    await self.path_resolver.set(head_uneval, gf, scope)
+                    return gf
+                # End replacement
+            else:
+                prev_bind = getattr(self, "bind_locals_prefer_container", False)
+                try:
+                    # Default local-by-default
+                    prefer_local = True
+                    # If assigning to a simple local name and RHS references that name, and a parent owns it, prefer owner write
+                    if len(head_uneval.segments) == 1 and isinstance(
+                        head_uneval.segments[0], Name
+                    ):
+                        tname = head_uneval.segments[0].text
+                        has_local = isinstance(scope, Scope) and (
+                            tname in scope.bindings
+                        )
+                        owner = (
+                            scope.find_owner(tname)
+                            if isinstance(scope, Scope)
+                            else None
+                        )
+                        if (
+                            (not has_local)
+                            and (owner is not None)
+                            and (owner is not scope)
                         ):
-                            tname = head_uneval.segments[0].text
-                            has_local = isinstance(scope, Scope) and (
-                                tname in scope.bindings
-                            )
-                            owner = (
-                                scope.find_owner(tname)
-                                if isinstance(scope, Scope)
-                                else None
-                            )
-                            if (
-                                (not has_local)
-                                and (owner is not None)
-                                and (owner is not scope)
-                            ):
-                                if _rhs_mentions_name(value_expr, tname):
-                                    prefer_local = False
-                        self.bind_locals_prefer_container = prefer_local
-                        await self.path_resolver.set(head_uneval, value, scope)
-                    finally:
-                        self.bind_locals_prefer_container = prev_bind
-                    return value
-
-            case tuple() as t if len(t) > 0 and t[0] == "multi-set":
-                set_paths = head_uneval[1]
-                value_expr = terms[1:]
-                if not value_expr:
-                    raise SyntaxError("multi-set must be followed by a value.")
-                # Accept a single raw Python list as a literal RHS (test-construction convenience)
-                if len(value_expr) == 1 and isinstance(value_expr[0], list):
-                    values = value_expr[0]
-                else:
-                    values = await self._eval_expr(value_expr, scope)
+                            if tname in _rhs_names(head_uneval, terms):
+                                prefer_local = False
+                    self.bind_locals_prefer_container = prefer_local
+                    await self.path_resolver.set(head_uneval, value, scope)
+                finally:
+                    self.bind_locals_prefer_container = prev_bind
+                return value
+
+        elif kind == KIND_NONE and _is_multi_set_tuple(head_uneval):
+            set_paths = head_uneval[1]
+            value_expr = terms[1:]
+            if not value_expr:
+                raise SyntaxError("multi-set must be followed by a value.")
+            # Accept a single raw Python list as a literal RHS (test-construction convenience)
+            if len(value_expr) == 1 and isinstance(value_expr[0], list):
+                values = value_expr[0]
+            else:
+                values = await self._eval_expr(value_expr, scope)
 
-                if not isinstance(values, list) or len(set_paths) != len(values):
-                    raise TypeError(
-                        f"Multi-set mismatch: pattern requires {len(set_paths)} values, got {len(values)}"
-                    )
-                for path, value in zip(set_paths, values):
-                    self.current_node = path
-                    await self.path_resolver.set(path, value, scope)
-                return None
+            if not isinstance(values, list) or len(set_paths) != len(values):
+                raise TypeError(
+                    f"Multi-set mismatch: pattern requires {len(set_paths)} values, got {len(values)}"
+                )
+            for path, value in zip(set_paths, values):
+                self.current_node = path
+                await self.path_resolver.set(path, value, scope)
+            return None
 
-            # Convenience: allow HTTP PUT using get-path + value, e.g.:
-            #   http://host/path "body"
-            # Treat as a SetPath to the same URL and perform PUT.
-            case GetPath():
-                try:
-                    url = self.path_resolver._extract_http_url(head_uneval)
-                except Exception:
-                    url = None
-                if url is not None and len(terms) >= 2:
-                    # Evaluate RHS to a value, then write via PathResolver.set
-                    value = unwrap_return(await self._eval_expr(terms[1:], scope))
-                    await self.path_resolver.set(
-                        SetPath(
-                            head_uneval.segments, getattr(head_uneval, "meta", None)
-                        ),
-                        value,
-                        scope,
-                    )
-                    return value
-                # Convenience: allow FS PUT using get-path + value, e.g.:
-                #   file://path/to/file "body"
-                # Treat as a SetPath to the same locator and perform PUT.
+        # Convenience: allow HTTP PUT using get-path + value, e.g.:
+        #   http://host/path "body"
+        # Treat as a SetPath to the same URL and perform PUT.
+        elif kind == KIND_GET_PATH:
+            try:
+                url = self.path_resolver._extract_http_url(head_uneval)
+            except Exception:
+                url = None
+            if url is not None and len(terms) >= 2:
+                # Evaluate RHS to a value, then write via PathResolver.set
+                value = unwrap_return(await self._eval_expr(terms[1:], scope))
+                await self.path_resolver.set(
+                    SetPath(
+                        head_uneval.segments, getattr(head_uneval, "meta", None)
+                    ),
+                    value,
+                    scope,
+                )
+                return value
+            # Convenience: allow FS PUT using get-path + value, e.g.:
+            #   file://path/to/file "body"
+            # Treat as a SetPath to the same locator and perform PUT.
+            try:
+                file_loc = self.path_resolver._extract_file_locator(head_uneval)
+            except Exception:
+                file_loc = None
+            if file_loc is not None and len(terms) >= 2:
+                value = unwrap_return(await self._eval_expr(terms[1:], scope))
+                await self.path_resolver.set(
+                    SetPath(
+                        head_uneval.segments, getattr(head_uneval, "meta", None)
+                    ),
+                    value,
+                    scope,
+                )
+                return value
+
+        elif kind == KIND_POST_PATH:
+            value_expr = terms[1:]
+            if not value_expr:
+                raise SyntaxError("PostPath must be followed by a value.")
+            value = unwrap_return(await self._eval_expr(value_expr, scope))
+            self.current_node = head_uneval
+            result = await self.path_resolver.post(head_uneval, value, scope)
+            return result
+
+        elif kind == KIND_DEL_PATH:
+            if len(terms) > 1:
+                raise SyntaxError("del-path cannot be part of a larger expression.")
+            # Contract: `this` is reserved and cannot be deleted.
+            target = head_uneval.path
+            if (
+                len(target.segments) == 1
+                and type(target.segments[0]) is Name
+                and target.segments[0].text is _THIS
+            ):
+                err = SyntaxError("`this` is reserved and cannot be deleted")
                 try:
-                    file_loc = self.path_resolver._extract_file_locator(head_uneval)
+                    err.slip_obj = head_uneval
                 except Exception:
-                    file_loc = None
-                if file_loc is not None and len(terms) >= 2:
-                    value = unwrap_return(await self._eval_expr(terms[1:], scope))
-                    await self.path_resolver.set(
-                        SetPath(
-                            head_uneval.segments, getattr(head_uneval, "meta", None)
-                        ),
-                        value,
-                        scope,
-                    )
-                    return value
-
-            case PostPath():
-                value_expr = terms[1:]
-                if not value_expr:
-                    raise SyntaxError("PostPath must be followed by a value.")
-                value = unwrap_return(await self._eval_expr(value_expr, scope))
-                self.current_node = head_uneval
-                result = await self.path_resolver.post(head_uneval, value, scope)
-                return result
-
-            case DelPath():
-                if len(terms) > 1:
-                    raise SyntaxError("del-path cannot be part of a larger expression.")
-                # Contract: `this` is reserved and cannot be deleted.
-                target = head_uneval.path
-                if (
-                    len(target.segments) == 1
-                    and isinstance(target.segments[0], Name)
-                    and target.segments[0].text == "this"
-                ):
-                    err = SyntaxError("`this` is reserved and cannot be deleted")
-                    try:
-                        err.slip_obj = head_uneval
-                    except Exception:
-                        pass
-                    raise err
-                self.current_node = head_uneval
-                result = await self.path_resolver.delete(head_uneval, scope)
-                return result
+                    pass
+                raise err
+            self.current_node = head_uneval
+            result = await self.path_resolver.delete(head_uneval, scope)
+            return result
 
         # If not assignment, it's a value/call expression.
         remaining_terms = terms
+        if plan is None:
+            plan = _expr_plan(terms)
+        head_name, split_at, _, arg_layout, special = plan
         # Check for special form (macro) call
         head_term = remaining_terms[0]
-        if isinstance(head_term, GetPath):
-            if len(head_term.segments) == 1 and isinstance(head_term.segments[0], Name):
-                func_name = head_term.segments[0].text
-                if func_name == "return" and len(remaining_terms) > 2:
-                    err = TypeError("invalid-args")
-                    err.slip_detail = (
-                        "return takes at most one value; wrap complex return expressions in parentheses"
-                    )
-                    try:
-                        err.slip_obj = head_term
-                    except Exception:
-                        pass
-                    raise err
-                # Short-circuiting logical forms are treated as special forms (macros)
-                if func_name in ("logical-and", "logical-or"):
-                    if len(remaining_terms) != 3:
-                        raise TypeError(f"{func_name} expects exactly 2 arguments")
-                    left = await self._eval(remaining_terms[1], scope)
-                    if func_name == "logical-and":
-                        if not left:
-                            return left
-                        return await self._eval(remaining_terms[2], scope)
-                    else:  # logical-or
-                        if left:
-                            return left
-                        return await self._eval(remaining_terms[2], scope)
-                if func_name in ("if", "fn", "while", "foreach"):
-                    self.current_node = head_term
-                    func = await self.path_resolver.get(head_term, scope)
-
-                    # Only consume args up to the first piped operator so chaining like:
-                    #   fn {...} [...] |example {...}
-                    # works by letting the pipe consume the function value.
-                    split_at = None
-                    for idx in range(1, len(remaining_terms)):
-                        if isinstance(remaining_terms[idx], PipedPath):
-                            split_at = idx
-                            break
-                    arg_end = split_at if split_at is not None else len(remaining_terms)
-                    args_raw = remaining_terms[1:arg_end]
-
+        if special:
+            func_name = head_name
+            if special == _SF_RETURN and len(remaining_terms) > 2:
+                err = TypeError("invalid-args")
+                err.slip_detail = (
+                    "return takes at most one value; wrap complex return expressions in parentheses"
+                )
+                try:
+                    err.slip_obj = head_term
+                except Exception:
+                    pass
+                raise err
+            # Short-circuiting logical forms are treated as special forms (macros)
+            if special == _SF_LOGICAL_AND or special == _SF_LOGICAL_OR:
+                if len(remaining_terms) != 3:
+                    raise TypeError(f"{func_name} expects exactly 2 arguments")
+                left = await self._eval(remaining_terms[1], scope)
+                if special == _SF_LOGICAL_AND:
+                    if not left:
+                        return left
+                    return await self._eval(remaining_terms[2], scope)
+                else:  # logical-or
+                    if left:
+                        return left
+                    return await self._eval(remaining_terms[2], scope)
+            if special == _SF_MACRO:
+                self.current_node = head_term
+                func = await self.path_resolver.get(head_term, scope)
+
+                # Only consume args up to the first piped operator so chaining like:
+                #   fn {...} [...] |example {...}
+                # works by letting the pipe consume the function value.
+                arg_end = split_at if split_at is not None else len(remaining_terms)
+                args_raw = remaining_terms[1:arg_end]
+
+                if _SLIP_DEBUG:
                     self._dbg(
                         "SPECIAL",
                         func_name,
                         "args_raw_types",
                         [type(a).__name__ for a in args_raw],
                     )
-                    self._push_frame(func_name, func, args_raw, head_term)
-                    _ok = False
-                    try:
-                        if inspect.iscoroutinefunction(func):
-                            result = await func(args_raw, scope=scope)
-                        else:
-                            result = func(args_raw, scope=scope)
-                        _ok = True
-                    finally:
-                        if _ok:
-                            self._pop_frame()
-
-                    # If there is a trailing pipe/infix chain, continue evaluation with the result as LHS.
-                    if split_at is not None:
-                        return await self._eval_expr(
-                            [result] + remaining_terms[arg_end:], scope
-                        )
-                    return result
+                self._push_frame(func_name, func, args_raw, head_term)
+                _ok = False
+                try:
+                    if inspect.iscoroutinefunction(func):
+                        result = await func(args_raw, scope=scope)
+                    else:
+                        result = func(args_raw, scope=scope)
+                    _ok = True
+                finally:
+                    if _ok:
+                        self._pop_frame()
+
+                # If there is a trailing pipe/infix chain, continue evaluation with the result as LHS.
+                if split_at is not None:
+                    return await self._eval_expr(
+                        [result] + remaining_terms[arg_end:], scope
+                    )
+                return result
 
         # Evaluate the rest of the expression as a call chain
-        self.current_node = remaining_terms[0]
-        head_val = await self._eval(remaining_terms[0], scope)
+        # (_eval_sync / _eval record the head as current_node).
+        head_val = self._eval_sync(head_term)
+        if head_val is _NOT_SYNC:
+            head_val = await self._eval(head_term, scope)
 
         # Dynamic assignment: if the head evaluates to a SetPath or MultiSetPath, treat it as an assignment target
-        from slip.slip_datatypes import SetPath as _SP, MultiSetPath as _MSP
-
-        if isinstance(head_val, _SP):
+        head_kind = node_kind(head_val)
+        if head_kind == KIND_SET_PATH:
             value = unwrap_return(await self._eval_expr(remaining_terms[1:], scope))
             self.current_node = remaining_terms[0]
             await self.path_resolver.set(head_val, value, scope)
             return value
-        if isinstance(head_val, _MSP) or (
-            isinstance(head_val, tuple)
-            and len(head_val) > 0
-            and head_val[0] == "multi-set"
+        if head_kind == KIND_MULTI_SET_PATH or (
+            head_kind == KIND_NONE and _is_multi_set_tuple(head_val)
         ):
             # Normalize targets list from runtime MultiSetPath or literal tuple form
-            targets = head_val.targets if isinstance(head_val, _MSP) else head_val[1]
+            targets = head_val.targets if head_kind == KIND_MULTI_SET_PATH else head_val[1]
             values = await self._eval_expr(remaining_terms[1:], scope)
             if not isinstance(values, list) or len(values) != len(targets):
                 raise TypeError(
@@ -2779,30 +3528,25 @@ class Evaluator:
         k = 1
 
         if isinstance(head_val, SlipCallable) or callable(head_val):
-            # Find first piped operator position (if any)
-            split_at = None
-            for idx in range(1, len(remaining_terms)):
-                # Only actual PipedPath terms start an infix chain. A PipedPathLiteral is a value.
-                if isinstance(remaining_terms[idx], PipedPath):
-                    split_at = idx
-                    break
+            # split_at: first piped operator position (if any), from the plan
             arg_end = split_at if split_at is not None else len(remaining_terms)
             arg_terms = remaining_terms[1:arg_end]
 
             # ADD: debug prep for prefix call
-            self._dbg(
-                "CALL prefix prepare",
-                "head_type",
-                getattr(head_val, "__class__", type(head_val)).__name__,
-                "split_at",
-                split_at,
-                "arg_end",
-                arg_end,
-                "argc_terms",
-                len(arg_terms),
-                "arg_term_types",
-                [type(t).__name__ for t in arg_terms],
-            )
+            if _SLIP_DEBUG:
+                self._dbg(
+                    "CALL prefix prepare",
+                    "head_type",
+                    getattr(head_val, "__class__", type(head_val)).__name__,
+                    "split_at",
+                    split_at,
+                    "arg_end",
+                    arg_end,
+                    "argc_terms",
+                    len(arg_terms),
+                    "arg_term_types",
+                    [type(t).__name__ for t in arg_terms],
+                )
 
             # Zero‑arity handling:
             # - If a piped operator follows, do not invoke; let the pipe consume the head as LHS.
@@ -2813,28 +3557,23 @@ class Evaluator:
                     k = 1  # defer to the pipe
                 else:
                     if self._should_autocall_zero_arity(head_val):
-                        name = None
-                        if (
-                            isinstance(remaining_terms[0], GetPath)
-                            and len(remaining_terms[0].segments) == 1
-                            and isinstance(remaining_terms[0].segments[0], Name)
-                        ):
-                            name = remaining_terms[0].segments[0].text
+                        name = head_name
                         evaluated_args = []
-                        self._dbg(
-                            "CALL prefix",
-                            getattr(head_val, "__class__", type(head_val)).__name__,
-                            "split_at",
-                            split_at,
-                            "argc_terms",
-                            0,
-                            "argc",
-                            0,
-                            "arg_term_types",
-                            [],
-                            "arg_types",
-                            [],
-                        )
+                        if _SLIP_DEBUG:
+                            self._dbg(
+                                "CALL prefix",
+                                getattr(head_val, "__class__", type(head_val)).__name__,
+                                "split_at",
+                                split_at,
+                                "argc_terms",
+                                0,
+                                "argc",
+                                0,
+                                "arg_term_types",
+                                [],
+                                "arg_types",
+                                [],
+                            )
                         self._push_frame(
                             name or "<call>",
                             head_val,
@@ -2843,7 +3582,10 @@ class Evaluator:
                         )
                         _ok = False
                         try:
-                            result = await self.call(head_val, evaluated_args, scope)
+                            ret = self._call_sync(head_val, evaluated_args, scope)
+                            if type(ret) is _PendingAwait:
+                                ret = await ret.awaitable
+                            result = ret
                             _ok = True
                         finally:
                             if _ok:
@@ -2853,113 +3595,55 @@ class Evaluator:
                         k = 1  # leave result=head_val (function value)
             else:
                 # existing evaluated-args call path remains unchanged
-                # Determine display name for stack frame
-                name = None
-                if (
-                    isinstance(remaining_terms[0], GetPath)
-                    and len(remaining_terms[0].segments) == 1
-                    and isinstance(remaining_terms[0].segments[0], Name)
-                ):
-                    name = remaining_terms[0].segments[0].text
-
-                from slip.slip_datatypes import (
-                    GetPath as _GP,
-                    Name as _Name,
-                    Code as _Code,
-                )
+                # Display name for the stack frame
+                name = head_name
 
                 evaluated_args = await self._fold_property_chain_for_args(
-                    arg_terms, scope
+                    arg_terms, scope, layout=arg_layout
                 )
 
-                # Auto‑invoke zero‑arity callables when they appear as arguments (e.g., 'keys current-scope')
-                async def _autocall_if_zero_arity(v):
-                    if self._should_autocall_zero_arity(v):
-                        return await self.call(v, [], scope)
-                    return v
-
-                def _is_call_primitive(fn):
-                    try:
-                        import inspect as _inspect
-
-                        if _inspect.ismethod(fn):
-                            self_obj = getattr(fn, "__self__", None)
-                            if (
-                                getattr(self_obj, "__class__", None).__name__
-                                == "StdLib"
-                                and getattr(fn, "__name__", "") == "_call"
-                            ):
-                                return True
-                    except Exception:
-                        pass
-                    return False
-
+                # Auto‑invoke zero‑arity callables when they appear as arguments (e.g., 'keys current-scope').
+                # Plain values (the usual argument) are ruled out before the arity check.
                 if evaluated_args and not _is_call_primitive(head_val):
-                    evaluated_args = [
-                        await _autocall_if_zero_arity(a) for a in evaluated_args
-                    ]
-                self._dbg(
-                    "CALL prefix",
-                    getattr(head_val, "__class__", type(head_val)).__name__,
-                    "split_at",
-                    split_at,
-                    "argc_terms",
-                    len(arg_terms),
-                    "argc",
-                    len(evaluated_args),
-                    "arg_term_types",
-                    [type(t).__name__ for t in arg_terms],
-                    "arg_types",
-                    [type(a).__name__ for a in evaluated_args],
-                )
+                    should_autocall = self._should_autocall_zero_arity
+                    for idx, a in enumerate(evaluated_args):
+                        if (type(a) in _SLIP_FUNCTION_TYPES or callable(a)) and (
+                            should_autocall(a)
+                        ):
+                            ret = self._call_sync(a, [], scope)
+                            if type(ret) is _PendingAwait:
+                                ret = await ret.awaitable
+                            evaluated_args[idx] = ret
+                if _SLIP_DEBUG:
+                    self._dbg(
+                        "CALL prefix",
+                        getattr(head_val, "__class__", type(head_val)).__name__,
+                        "split_at",
+                        split_at,
+                        "argc_terms",
+                        len(arg_terms),
+                        "argc",
+                        len(evaluated_args),
+                        "arg_term_types",
+                        [type(t).__name__ for t in arg_terms],
+                        "arg_types",
+                        [type(a).__name__ for a in evaluated_args],
+                    )
                 self._push_frame(
                     name or "<call>", head_val, evaluated_args, remaining_terms[0]
                 )
                 _ok = False
                 try:
-                    result = await self.call(head_val, evaluated_args, scope)
+                    ret = self._call_sync(head_val, evaluated_args, scope)
+                    if type(ret) is _PendingAwait:
+                        ret = await ret.awaitable
+                    result = ret
                     _ok = True
                 finally:
                     if _ok:
                         self._pop_frame()
                 k = arg_end
 
-        async def _rhs_span_for_logical(terms, op_index, scope):
-            """
-            Determine how many terms constitute the RHS operand for a logical op.
-            Recognize simple infix patterns by resolving the middle term to any piped operator:
-              <term> <operator> <term>  -> span 3
-            Also recognize unary piped operator form when only two terms are present:
-              <term> <operator>         -> span 2
-            Otherwise, treat RHS as a single term (span 1).
-            """
-            start = op_index + 1
-            # Try binary form: [term, op, term]
-            if start + 2 < len(terms):
-                mid = terms[start + 1]
-                try:
-                    # PipedPath literal counts as an operator
-                    if isinstance(mid, PipedPath):
-                        return 3
-                    # Resolve mid; if it resolves to a PipedPath, treat as operator
-                    resolved = await self._eval(mid, scope)
-                    if isinstance(resolved, PipedPath):
-                        return 3
-                except Exception:
-                    pass
-            # Try unary piped op form: [term, op]
-            if start + 1 < len(terms):
-                mid = terms[start + 1]
-                try:
-                    if isinstance(mid, PipedPath):
-                        return 2
-                    resolved = await self._eval(mid, scope)
-                    if isinstance(resolved, PipedPath):
-                        return 2
-                except Exception:
-                    pass
-            return 1
-
         while k < len(remaining_terms):
             op_term = remaining_terms[k]
             raw_op_term = op_term  # Preserve original term for error reporting
@@ -2974,37 +3658,41 @@ class Evaluator:
 
             # Decide whether to treat current piped op as unary
             unary_mode = False
+            # Value of remaining_terms[k + 1] from the peek, reused as the binary RHS.
+            peeked = _NOT_PEEKED
             if k + 1 >= len(remaining_terms):
                 unary_mode = True
             else:
                 # Peek next term: if it resolves to a PipedPath (an operator), this op is unary
                 try:
                     peek_raw = remaining_terms[k + 1]
-                    self.current_node = peek_raw
-                    peek_val = await self._eval(peek_raw, scope)
+                    peek_val = self._eval_sync(peek_raw)
+                    if peek_val is _NOT_SYNC:
+                        peek_val = await self._eval(peek_raw, scope)
+                    peeked = peek_val
                     pv = peek_val
                     while True:
-                        if isinstance(pv, PipedPath):
+                        kind = node_kind(pv)
+                        if kind == KIND_PIPED_PATH:
                             unary_mode = True
                             break
-                        if isinstance(pv, PathLiteral):
-                            inner = pv.inner
-                            if isinstance(inner, PipedPath):
+                        if kind == KIND_PATH_LITERAL:
+                            if node_kind(pv.inner) == KIND_PIPED_PATH:
                                 unary_mode = True
                             # Either way, stop unwrapping to avoid toggling PathLiteral <-> GetPath
                             break
-                        if isinstance(pv, GetPath):
+                        if kind == KIND_GET_PATH:
                             pv = await self._eval(pv, scope)
                             continue
                         if (
-                            isinstance(pv, Group)
+                            kind == KIND_GROUP
                             and pv.nodes
                             and isinstance(pv.nodes[0], list)
                             and pv.nodes[0]
                         ):
                             pv = pv.nodes[0][0]
                             continue
-                        if isinstance(pv, Code) and len(pv.nodes) == 1 and pv.nodes[0]:
+                        if kind == KIND_CODE and len(pv.nodes) == 1 and pv.nodes[0]:
                             pv = pv.nodes[0][0]
                             continue
                         break
@@ -3020,7 +3708,11 @@ class Evaluator:
                 self._push_frame(func_name or "<pipe>", func, [result], func_path)
                 _ok = False
                 try:
-                    result = await self.call(func, [result], scope)
+                    call_args = [result]
+                    ret = self._call_sync(func, call_args, scope)
+                    if type(ret) is _PendingAwait:
+                        ret = await ret.awaitable
+                    result = ret
                     _ok = True
                 finally:
                     if _ok:
@@ -3028,44 +3720,10 @@ class Evaluator:
                 k += 1
                 continue
 
-            if func_name == "logical-and":
-                # Short-circuit: only evaluate RHS if LHS is truthy
-                span = await _rhs_span_for_logical(remaining_terms, k, scope)
-                if not result:
-                    # Skip operator and the entire RHS operand
-                    k += 1 + span
-                    continue
-                rhs_start = k + 1
-                if span >= 2:
-                    # Evaluate the RHS slice (operator-inclusive) as a single sub-expression
-                    rhs_arg = await self._eval_expr(
-                        remaining_terms[rhs_start : rhs_start + span], scope
-                    )
-                else:
-                    self.current_node = remaining_terms[rhs_start]
-                    rhs_arg = await self._eval(remaining_terms[rhs_start], scope)
-                result = rhs_arg
-                k += 1 + span
-                continue
-
-            if func_name == "logical-or":
-                # Short-circuit: only evaluate RHS if LHS is falsey
-                span = await _rhs_span_for_logical(remaining_terms, k, scope)
-                if result:
-                    # Skip operator and the entire RHS operand
-                    k += 1 + span
-                    continue
-                rhs_start = k + 1
-                if span >= 2:
-                    # Evaluate the RHS slice (operator-inclusive) as a single sub-expression
-                    rhs_arg = await self._eval_expr(
-                        remaining_terms[rhs_start : rhs_start + span], scope
-                    )
-                else:
-                    self.current_node = remaining_terms[rhs_start]
-                    rhs_arg = await self._eval(remaining_terms[rhs_start], scope)
-                result = rhs_arg
-                k += 1 + span
+            if func_name in ("logical-and", "logical-or"):
+                result, k = await self._eval_short_circuit(
+                    func_name, result, remaining_terms, k, scope
+                )
                 continue
 
             # NOTE: logical-and/logical-or must short-circuit even when they originate from
@@ -3079,7 +3737,7 @@ class Evaluator:
             #
             # IMPORTANT: only triggers when the source token is a PipedPath (starts with `|`),
             # not for infix aliases like `+` that resolve to a PipedPath.
-            if isinstance(raw_op_term, PipedPath):
+            if type(raw_op_term) is PipedPath:
                 self.current_node = func_path
                 func = await self.path_resolver.get(func_path, scope)
 
@@ -3088,20 +3746,32 @@ class Evaluator:
                 j = k + 1
                 while j < len(remaining_terms):
                     t = remaining_terms[j]
-                    if isinstance(t, PipedPath):
+                    if type(t) is PipedPath:
                         break
-                    if isinstance(t, GetPath):
+                    if type(t) is GetPath:
                         try:
-                            resolved = await self._eval(t, scope)
-                            if isinstance(resolved, PipedPath):
+                            if j == k + 1 and peeked is not _NOT_PEEKED:
+                                resolved = peeked
+                            else:
+                                resolved = await self._eval(t, scope)
+                            if type(resolved) is PipedPath:
                                 break
                         except Exception:
                             pass
                     arg_terms.append(t)
                     j += 1
 
+                # The first argument (e.g. the sig of `|example {...}` or the code block of
+                # `|where [...]`) was already evaluated by the peek; hand it to the fold.
+                first_value = _NOT_PEEKED
+                if arg_terms and not (
+                    isinstance(arg_terms[0], list)
+                    and arg_terms[0]
+                    and isinstance(arg_terms[0][0], list)
+                ):
+                    first_value = peeked
                 evaluated_args = await self._fold_property_chain_for_args(
-                    arg_terms, scope
+                    arg_terms, scope, first_value=first_value
                 )
 
                 self._push_frame(
@@ -3109,7 +3779,11 @@ class Evaluator:
                 )
                 _ok = False
                 try:
-                    result = await self.call(func, [result, *evaluated_args], scope)
+                    call_args = [result, *evaluated_args]
+                    ret = self._call_sync(func, call_args, scope)
+                    if type(ret) is _PendingAwait:
+                        ret = await ret.awaitable
+                    result = ret
                     _ok = True
                 finally:
                     if _ok:
@@ -3124,23 +3798,33 @@ class Evaluator:
 
             if isinstance(rhs_term, Sig):
                 rhs_arg = rhs_term
+            elif peeked is not _NOT_PEEKED and not (
+                isinstance(rhs_term, list) and rhs_term and isinstance(rhs_term[0], list)
+            ):
+                # Already evaluated while deciding unary mode; do not evaluate it twice.
+                rhs_arg = peeked
             else:
                 rhs_arg = await self._eval_term_value(rhs_term, scope)
 
             self.current_node = func_path
             func = await self.path_resolver.get(func_path, scope)
-            self._dbg(
-                "PIPE",
-                func_name,
-                "lhs_type",
-                type(result).__name__,
-                "rhs_type",
-                type(rhs_arg).__name__,
-            )
+            if _SLIP_DEBUG:
+                self._dbg(
+                    "PIPE",
+                    func_name,
+                    "lhs_type",
+                    type(result).__name__,
+                    "rhs_type",
+                    type(rhs_arg).__name__,
+                )
             self._push_frame(func_name or "<pipe>", func, [result, rhs_arg], func_path)
             _ok = False
             try:
-                result = await self.call(func, [result, rhs_arg], scope)
+                call_args = [result, rhs_arg]
+                ret = self._call_sync(func, call_args, scope)
+                if type(ret) is _PendingAwait:
+                    ret = await ret.awaitable
+                result = ret
                 _ok = True
             finally:
                 if _ok:
@@ -3149,6 +3833,69 @@ class Evaluator:
 
         return result
 
+    async def _rhs_span_for_logical(self, terms, op_index, scope):
+        """
+        Determine how many terms constitute the RHS operand for a logical op.
+        Recognize simple infix patterns by resolving the middle term to any piped operator:
+          <term> <operator> <term>  -> span 3
+        Also recognize unary piped operator form when only two terms are present:
+          <term> <operator>         -> span 2
+        Otherwise, treat RHS as a single term (span 1).
+        """
+        start = op_index + 1
+        # Try binary form: [term, op, term]
+        if start + 2 < len(terms):
+            mid = terms[start + 1]
+            try:
+                # PipedPath literal counts as an operator
+                if type(mid) is PipedPath:
+                    return 3
+                # Resolve mid; if it resolves to a PipedPath, treat as operator
+                resolved = await self._eval(mid, scope)
+                if type(resolved) is PipedPath:
+                    return 3
+            except Exception:
+                pass
+        # Try unary piped op form: [term, op]
+        if start + 1 < len(terms):
+            mid = terms[start + 1]
+            try:
+                if type(mid) is PipedPath:
+                    return 2
+                resolved = await self._eval(mid, scope)
+                if type(resolved) is PipedPath:
+                    return 2
+            except Exception:
+                pass
+        return 1
+
+    async def _eval_short_circuit(self, func_name, result, remaining_terms, k, scope):
+        """
+        Short-circuit an infix logical-and / logical-or at operator index k.
+
+        Keep the LHS when it already decides the outcome (falsey for and, truthy for or);
+        otherwise evaluate the RHS operand once. Returns (value, next_k).
+        """
+        span = await self._rhs_span_for_logical(remaining_terms, k, scope)
+        next_k = k + 1 + span
+        keep_lhs = (func_name == "logical-and") ^ bool(result)
+        if keep_lhs:
+            return result, next_k
+        rhs_start = k + 1
+        if span >= 2:
+            # Evaluate the RHS slice (operator-inclusive) as a single sub-expression
+            return (
+                await self._eval_expr(
+                    remaining_terms[rhs_start : rhs_start + span], scope
+                ),
+                next_k,
+            )
+        rhs_term = remaining_terms[rhs_start]
+        v = self._eval_sync(rhs_term)
+        if v is _NOT_SYNC:
+            v = await self._eval(rhs_term, scope)
+        return v, next_k
+
     def _sig_param_order(self, sig) -> list[tuple[str, object | None]]:
         order = getattr(sig, "param_order", None)
         if order:
@@ -3167,85 +3914,38 @@ class Evaluator:
             params.append((name if isinstance(name, str) else getattr(name, "text", str(name)), type_spec))
         return params
 
-    async def _sig_types_match(self, sig, method, args, scope) -> bool:
-        # No typed constraints -> always matches
-        if not getattr(sig, "keywords", None):
-            return True
-
-        # Primitive type names we recognize in annotations
-        PRIMITIVES = {
-            "int",
-            "float",
-            "string",
-            "i-string",
-            "list",
-            "dict",
-            "scope",
-            "function",
-            "code",
-            "path",
-            "boolean",
-            "none",
-        }
+    def _sig_binding_plan(self, sig) -> tuple[tuple[str, ...], int, str | None, Any]:
+        """
+        Return (param_names, this_index, rest_name, binder) for binding call arguments.
 
-        # Helper: compute primitive type name for a value (mirrors StdLib._type_of)
-        def _type_name(val: object) -> str:
-            # Internal filtered selections behave as list for dispatch typing.
+        Computed once per Sig and cached on it; param_names follows _sig_param_order.
+        binder is a generated `_bind(bindings, args)` (see _compile_sig_binder) or None
+        when the generic zip-based binding must be used.
+        """
+        plan = getattr(sig, "_binding_plan", None)
+        if plan is None:
+            names = tuple(nm for nm, _type_spec in self._sig_param_order(sig))
+            this_i = names.index("this") if "this" in names else -1
+            rest = sig.rest
+            if rest is not None and not isinstance(rest, str):
+                rest = getattr(rest, "text", str(rest))
+            binder = None
+            if self.sig_binder_codegen and "meta" not in names:
+                binder = _compile_sig_binder(names)
+            plan = (names, this_i, rest, binder)
             try:
-                if hasattr(val, "realize") and callable(getattr(val, "realize")):
-                    return "list"
+                sig._binding_plan = plan
             except Exception:
                 pass
-            if val is None:
-                return "none"
-            if isinstance(val, bool):
-                return "boolean"
-            if isinstance(val, int) and not isinstance(val, bool):
-                return "int"
-            if isinstance(val, float):
-                return "float"
-            if isinstance(val, IString):
-                return "i-string"
-            if isinstance(val, str):
-                return "string"
-            if isinstance(val, list):
-                return "list"
-            if isinstance(val, collections.abc.Mapping):
-                return "dict"
-            if isinstance(val, Scope):
-                return "scope"
-            if isinstance(
-                val, (GetPath, SetPath, DelPath, PipedPath, PathLiteral, MultiSetPath)
-            ):
-                return "path"
-            if isinstance(val, (SlipFunction, GenericFunction)) or callable(val):
-                return "function"
-            if isinstance(val, Code):
-                return "code"
-            # Fallback: treat unknowns as string-like for typing purposes
-            return "string"
-
-        def _scope_matches(val_scope: Scope, target: Scope) -> bool:
-            """
-            Prototype match for dispatch typing.
-
-            Order:
-              1) single inheritance via `.parent`
-              2) attached command-sets via `meta.command_sets` (each matched via `.parent`)
-            """
-            if not isinstance(val_scope, Scope):
-                return False
-            if val_scope is target:
-                return True
+        return plan
 
-            # 1) Walk prototype chain only
-            cur = val_scope.parent
-            while isinstance(cur, Scope):
-                if cur is target:
-                    return True
-                cur = cur.parent
+    async def _sig_types_match(self, sig, method, args, scope) -> bool:
+        # No typed constraints -> always matches
+        if not getattr(sig, "keywords", None):
+            return True
 
-            return False
+        PRIMITIVES = _ANNOTATION_PRIMITIVES
+        _type_name = _type_name_of
 
         async def _spec_ok(spec, val) -> bool:
             # Unwrap path-literals
@@ -3344,58 +4044,10 @@ class Evaluator:
         return True
 
     def _primitive_type_name(self, val) -> str:
-        from slip.slip_datatypes import (
-            Scope,
-            Code,
-            IString,
-            SlipFunction,
-            GenericFunction,
-            GetPath,
-            SetPath,
-            DelPath,
-            PipedPath,
-            PathLiteral,
-            MultiSetPath,
-        )
-
-        # Internal filtered selections behave as list for dispatch typing.
-        try:
-            if hasattr(val, "realize") and callable(getattr(val, "realize")):
-                return "list"
-        except Exception:
-            pass
-        if val is None:
-            return "none"
-        if isinstance(val, bool):
-            return "boolean"
-        if isinstance(val, int) and not isinstance(val, bool):
-            return "int"
-        if isinstance(val, float):
-            return "float"
-        if isinstance(val, IString):
-            return "i-string"
-        if isinstance(val, str):
-            return "string"
-        if isinstance(val, list):
-            return "list"
-        if isinstance(val, collections.abc.Mapping):
-            return "dict"
-        if isinstance(val, Scope):
-            return "scope"
-        if isinstance(
-            val, (GetPath, SetPath, DelPath, PipedPath, PathLiteral, MultiSetPath)
-        ):
-            return "path"
-        if isinstance(val, (SlipFunction, GenericFunction)) or callable(val):
-            return "function"
-        if isinstance(val, Code):
-            return "code"
-        return "string"
+        return _type_name_of(val)
 
     def _scope_family(self, scope_obj) -> set:
-        from slip.slip_datatypes import Scope as _Scope
-
-        if not isinstance(scope_obj, _Scope):
+        if not isinstance(scope_obj, Scope):
             return set()
         # cache on the scope itself
         try:
@@ -3413,7 +4065,7 @@ class Evaluator:
             seen.add(cur)
             # parent
             p = cur.meta.get("parent")
-            if isinstance(p, _Scope):
+            if isinstance(p, Scope):
                 stack.append(p)
         try:
             scope_obj.meta["_family"] = seen
@@ -3423,9 +4075,7 @@ class Evaluator:
 
     def _value_family(self, val) -> tuple[set, int]:
         # Returns (family_set, size) where size is used as denominator in coverage
-        from slip.slip_datatypes import Scope as _Scope
-
-        if isinstance(val, _Scope):
+        if isinstance(val, Scope):
             fam = self._scope_family(val)
             return fam, len(fam) if fam else 1
         # primitives → singleton size
@@ -3433,22 +4083,14 @@ class Evaluator:
 
     def _compile_annotation_item(self, item, method_closure, current_scope):
         # Normalize a single annotation element into a compiled form
-        from slip.slip_datatypes import (
-            GetPath as _GP,
-            PathLiteral as _PL,
-            Name as _Name,
-            Sig as _Sig,
-            Scope as _Scope,
-        )
-
         # Path literal -> inner
-        if isinstance(item, _PL):
+        if isinstance(item, PathLiteral):
             item = item.inner
         # Single-name get-path → may resolve to scope or primitive name
         if (
-            isinstance(item, _GP)
+            isinstance(item, GetPath)
             and len(item.segments) == 1
-            and isinstance(item.segments[0], _Name)
+            and isinstance(item.segments[0], Name)
         ):
             n = item.segments[0].text
             # strip backticks
@@ -3462,11 +4104,9 @@ class Evaluator:
                     v = current_scope[n]
                 except Exception:
                     v = None
-            from slip.slip_datatypes import Scope as _Scope2, Sig as _Sig
-
-            if isinstance(v, _Scope2):
+            if isinstance(v, Scope):
                 return {"kind": "scope", "scope": v}
-            if isinstance(v, _Sig):
+            if isinstance(v, Sig):
                 # Alias to a Sig union: compile its positional items
                 compiled = []
                 for pos in getattr(v, "positional", []) or []:
@@ -3479,10 +4119,10 @@ class Evaluator:
             # else treat as primitive name
             return {"kind": "prim", "name": n}
         # Already a Scope
-        if isinstance(item, _Scope):
+        if isinstance(item, Scope):
             return {"kind": "scope", "scope": item}
         # Nested union (Sig) in annotation → union
-        if isinstance(item, _Sig):
+        if isinstance(item, Sig):
             # compile each positional child
             compiled = []
             for pos in getattr(item, "positional", []) or []:
@@ -3518,27 +4158,19 @@ class Evaluator:
 
     def _to_getpath_like(self, value):
         # Minimal helper to convert strings to GetPath(Name(...)) for annotation compilation
-        from slip.slip_datatypes import (
-            GetPath as _GP,
-            Name as _Name,
-            PathLiteral as _PL,
-        )
-
-        if isinstance(value, _GP):
+        if isinstance(value, GetPath):
             return value
-        if isinstance(value, _PL):
+        if isinstance(value, PathLiteral):
             return value.inner
         if isinstance(value, str):
-            return _GP([_Name(value)])
+            return GetPath([Name(value)])
         return value
 
     def _compile_method_signature(self, method, current_scope):
         # Early-bound compilation; cache on method.meta['_compiled_sig']
-        from slip.slip_datatypes import Sig as _Sig, Code as _Code
-
         meta = getattr(method, "meta", {}) or {}
         sig = meta.get("type")
-        if not isinstance(sig, _Sig):
+        if not isinstance(sig, Sig):
             return None
         cache = meta.get("_compiled_sig")
         if cache:
@@ -3585,11 +4217,7 @@ class Evaluator:
             if self._primitive_type_name(arg_val) == name:
                 return True, 1.0, 1, 1
             # If name is not a real primitive, attempt scope-name matching against the argument's family.
-            try:
-                from slip.slip_datatypes import Scope as _Scope
-            except Exception:
-                _Scope = None
-            if _Scope and isinstance(arg_val, _Scope):
+            if isinstance(arg_val, Scope):
                 arg_fam, arg_size = self._value_family(arg_val)
                 # Match by meta.name of any scope in the argument's family
                 for s in arg_fam:
@@ -3655,48 +4283,63 @@ class Evaluator:
     def _should_autocall_zero_arity(self, v):
         """
         True if v is a SLIP function or Python callable that can be called with zero required args.
-        Mirrors the prior nested predicate used in _eval_expr.
+        Generic functions cache the answer until their method set changes; Python
+        callables are cached per callable (see _py_zero_arity).
         """
+        t = type(v)
         try:
-            from slip.slip_datatypes import (
-                GenericFunction as _GF,
-                SlipFunction as _SF,
-                Sig as _Sig,
-                Code as _Code,
-            )
-
-            if isinstance(v, _GF):
-                for m in v.methods:
-                    s = getattr(m, "meta", {}).get("type")
-                    if isinstance(s, _Sig):
-                        base = len(s.positional) + len(s.keywords)
-                        if base == 0 and s.rest is None:
-                            return True
-                    else:
-                        if isinstance(m.args, _Code) and len(m.args.nodes) == 0:
-                            return True
-                return False
-            if isinstance(v, _SF):
-                s = getattr(v, "meta", {}).get("type")
-                if isinstance(s, _Sig):
-                    base = len(s.positional) + len(s.keywords)
-                    return base == 0 and s.rest is None
-                if isinstance(v.args, _Code) and len(v.args.nodes) == 0:
-                    return True
-                return False
+            if t is GenericFunction:
+                return v.has_zero_arity_method()
+            if t is SlipFunction:
+                return v.is_zero_arity()
         except Exception:
-            pass
+            return False
         # Python callable fallback
+        return self._py_zero_arity(v)
+
+    @staticmethod
+    def _callable_cache_get(weak, strong, func):
+        """
+        Look up a per-callable cache entry (None on a miss). Callables that cannot
+        be weak keys (unhashable, no weakref support) live in the id-keyed `strong`
+        map, a small LRU that keeps its entries alive so their ids cannot be reused.
+        """
         try:
-            # Fast, no-signature path with caching
-            needs = getattr(v, "_slip_zero_arity", None)
-            if needs is not None:
-                return bool(needs)
-            import inspect as _inspect
+            return weak.get(func)
+        except TypeError:
+            held = strong.pop(id(func), None)
+            if held is None or held[0] is not func:
+                return None
+            strong[id(func)] = held  # most recently used goes last
+            return held[1]
 
+    @staticmethod
+    def _callable_cache_put(weak, strong, func, entry):
+        try:
+            weak[func] = entry
+        except TypeError:
+            if len(strong) >= _CALLABLE_STRONG_CACHE_MAX:
+                del strong[next(iter(strong))]
+            strong[id(func)] = (func, entry)
+        return entry
+
+    def _py_zero_arity(self, v) -> bool:
+        """
+        True if the Python callable v has no required positional parameters,
+        computed once per callable. Bound methods cannot carry attributes, so the
+        answer lives in an evaluator-side cache like _py_call_shape's.
+        """
+        if not callable(v):
+            return False
+        cached = self._callable_cache_get(
+            self._zero_arity_cache, self._zero_arity_cache_strong, v
+        )
+        if cached is not None:
+            return cached
+        try:
             bound = False
             func = v
-            if _inspect.ismethod(v):
+            if inspect.ismethod(v):
                 func = getattr(v, "__func__", v)
                 bound = True
             code = getattr(func, "__code__", None)
@@ -3708,33 +4351,23 @@ class Evaluator:
                 if bound and req_pos > 0:
                     req_pos -= 1  # account for bound 'self'
                 zero = req_pos == 0
-                try:
-                    setattr(v, "_slip_zero_arity", zero)
-                except Exception:
-                    pass
-                return zero
-            # Fallback: use inspect.signature once and cache
-            import inspect
-
-            sig = inspect.signature(v)
-            req = [
-                p
-                for p in sig.parameters.values()
-                if p.kind
-                in (
-                    inspect.Parameter.POSITIONAL_ONLY,
-                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            else:
+                # No code object (builtins, callable instances): fall back to inspect.signature
+                sig = inspect.signature(v)
+                zero = not any(
+                    p.kind
+                    in (
+                        inspect.Parameter.POSITIONAL_ONLY,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    )
+                    and p.default is inspect._empty
+                    for p in sig.parameters.values()
                 )
-                and p.default is inspect._empty
-            ]
-            zero = len(req) == 0
-            try:
-                setattr(v, "_slip_zero_arity", zero)
-            except Exception:
-                pass
-            return zero
         except Exception:
-            return False
+            zero = False
+        return self._callable_cache_put(
+            self._zero_arity_cache, self._zero_arity_cache_strong, v, zero
+        )
 
     async def _eval_term_value(self, term, scope):
         # print(f"DEBUG: _eval_term_value term={type(term)} val={term}")
@@ -3759,107 +4392,47 @@ class Evaluator:
                 else:
                     out.append(await self._eval(expr, scope))
             return out
-        return await self._eval(term, scope)
-
-    async def _fold_property_chain_for_args(self, arg_terms, scope) -> list:
+        v = self._eval_sync(term)
+        if v is _NOT_SYNC:
+            v = await self._eval(term, scope)
+        return v
+
+    async def _fold_property_chain_for_args(
+        self, arg_terms, scope, first_value=_NOT_PEEKED, layout=None
+    ) -> list:
         """
         Evaluate arg_terms, folding consecutive single-name get-paths into property chains
         applied to the previous base value. Mirrors legacy inline logic.
-        """
-        from slip.slip_datatypes import (
-            GetPath as _GP,
-            Name as _Name,
-            Group as _Group,
-            Code as _Code,
-        )
 
+        first_value, when given, is the already-evaluated value of arg_terms[0].
+        layout is the precomputed _fold_layout(arg_terms), when the caller has it.
+        """
+        if layout is None:
+            layout = _fold_layout(arg_terms)
         evaluated_args = []
         i = 0
 
-        async def _apply_chain(base_val, segs):
-            cur = base_val
-            applied = 0
-            for seg in segs:
-                try:
-                    cur = await self.path_resolver._apply_segments(cur, [seg], scope)
-                    applied += 1
-                except Exception:
-                    break
-            return cur, applied
-
         while i < len(arg_terms):
             base_term = arg_terms[i]
-            base_val = await self._eval_term_value(base_term, scope)
-
-            segs = []
-            j = i + 1
-            allow_bare = isinstance(base_term, (_Group, _Code))
-            term_seg_counts = []
-
-            while j < len(arg_terms):
-                t = arg_terms[j]
-                if not isinstance(t, _GP):
-                    break
-                segs_list = list(getattr(t, "segments", []) or [])
-                if not segs_list:
-                    break
-
-                # Case 1: single-name get-path
-                if len(segs_list) == 1 and isinstance(segs_list[0], _Name):
-                    name_txt = segs_list[0].text
-                    if (
-                        isinstance(name_txt, str)
-                        and name_txt.startswith(".")
-                        and len(name_txt) > 1
-                    ):
-                        segs.append(_Name(name_txt[1:]))
-                        term_seg_counts.append(1)
-                        j += 1
-                        continue
-                    if allow_bare:
-                        segs.append(_Name(name_txt))
-                        term_seg_counts.append(1)
-                        j += 1
-                        continue
-                    break
-
-                # Case 2: multi-name get-path immediately after base; fold contiguous names
-                if j == i + 1 and all(isinstance(s, _Name) for s in segs_list):
-                    first_txt = segs_list[0].text
-                    if (
-                        isinstance(first_txt, str)
-                        and first_txt.startswith(".")
-                        and len(first_txt) > 1
-                    ) or allow_bare:
-                        added = 0
-                        for s in segs_list:
-                            txt = s.text
-                            if (
-                                isinstance(txt, str)
-                                and txt.startswith(".")
-                                and len(txt) > 1
-                            ):
-                                segs.append(_Name(txt[1:]))
-                            else:
-                                segs.append(_Name(txt))
-                            added += 1
-                        term_seg_counts.append(added)
-                        j += 1
-                        continue
-
-                break
+            if i == 0 and first_value is not _NOT_PEEKED:
+                base_val = first_value
+            else:
+                base_val = await self._eval_term_value(base_term, scope)
 
-            if segs:
-                self._dbg(
-                    "FOLD collect",
-                    "base_type",
-                    type(base_term).__name__,
-                    "segs",
-                    [getattr(s, "text", None) for s in segs],
-                    "term_counts",
-                    term_seg_counts,
-                )
-                cur, applied = await _apply_chain(base_val, segs)
+            fold = layout[i] if layout else None
+            if fold is not None:
+                segs, term_seg_counts = fold
+                if _SLIP_DEBUG:
+                    self._dbg(
+                        "FOLD collect",
+                        "base_type",
+                        type(base_term).__name__,
+                        "segs",
+                        [getattr(s, "text", None) for s in segs],
+                        "term_counts",
+                        term_seg_counts,
+                    )
+                cur, applied = self.path_resolver._try_apply_names(base_val, segs)
                 if applied > 0:
                     terms_used = 0
                     remaining = applied
@@ -3869,9 +4442,10 @@ class Evaluator:
                             remaining -= c
                         else:
                             break
-                    self._dbg(
-                        "FOLD apply", "applied", applied, "terms_used", terms_used
-                    )
+                    if _SLIP_DEBUG:
+                        self._dbg(
+                            "FOLD apply", "applied", applied, "terms_used", terms_used
+                        )
                     evaluated_args.append(cur)
                     i = i + 1 + terms_used
                     continue
@@ -3881,17 +4455,106 @@ class Evaluator:
 
         return evaluated_args
 
+    def _py_call_shape(self, func) -> tuple[bool, bool]:
+        """
+        Return (needs_scope, is_coro) for a Python callable, computing it once.
+
+        Entries live in a WeakKeyDictionary; callables that cannot be weakly
+        referenced or hashed (e.g. builtins) use a strong id-keyed fallback that
+        keeps the callable alive so its id cannot be reused.
+        """
+        entry = self._callable_cache_get(
+            self._py_call_cache, self._py_call_cache_strong, func
+        )
+        if entry is not None:
+            return entry
+
+        try:
+            needs = "scope" in inspect.signature(func).parameters
+        except Exception:
+            needs = False
+            # Best-effort fallback to kw-only detection via code object
+            code = getattr(func, "__code__", None)
+            if code is not None:
+                kwonly = getattr(code, "co_kwonlyargcount", 0)
+                if kwonly:
+                    pos = int(getattr(code, "co_argcount", 0))
+                    flags = int(getattr(code, "co_flags", 0))
+                    has_varargs = bool(flags & 0x04)  # CO_VARARGS
+                    start = pos + (1 if has_varargs else 0)
+                    names = tuple(code.co_varnames[start : start + kwonly])
+                    if "scope" in names:
+                        needs = True
+        entry = (needs, inspect.iscoroutinefunction(func))
+        return self._callable_cache_put(
+            self._py_call_cache, self._py_call_cache_strong, func, entry
+        )
+
+    def _call_sync(self, func: Any, args: List[Any], scope: Scope) -> Any:
+        """
+        Start a call, finishing it synchronously when possible: plain (non-coroutine)
+        Python callables are called directly, so hot call sites skip creating the
+        `call` coroutine. Anything left to await (SLIP functions, coroutine functions,
+        non-callables, awaitable results) comes back wrapped in _PendingAwait, so
+        call sites only do `if type(ret) is _PendingAwait: ret = await ret.awaitable`
+        (asyncio Tasks are returned as-is).
+        """
+        if type(func) in _SLIP_FUNCTION_TYPES or not callable(func):
+            return _PendingAwait(self.call(func, args, scope))
+        needs_scope, is_coro = self._py_call_shape(func)
+        if is_coro:
+            return _PendingAwait(self.call(func, args, scope))
+        if _SLIP_DEBUG:
+            self._dbg("Evaluator.call", type(func).__name__, "argc", len(args))
+        args = [unwrap_return(a) for a in args]
+        result = func(*args, scope=scope) if needs_scope else func(*args)
+        if type(result) not in _SYNC_VALUE_TYPES and inspect.isawaitable(result):
+            if isinstance(result, asyncio.Task):
+                return result
+            return _PendingAwait(result)
+        return result
+
     async def call(self, func: Any, args: List[Any], scope: Scope):
         """Calls a callable (SlipFunction or Python function)."""
-        self._dbg("Evaluator.call", type(func).__name__, "argc", len(args))
+        if _SLIP_DEBUG:
+            self._dbg("Evaluator.call", type(func).__name__, "argc", len(args))
         # Normalize arguments: unwrap 'return' responses so nested calls receive values.
         if isinstance(args, list):
             args = [unwrap_return(a) for a in args]
 
         if isinstance(func, GenericFunction):
-            self._dbg(
-                "GF call", func.name, "argc", len(args), "methods", len(func.methods)
-            )
+            if _SLIP_DEBUG:
+                self._dbg(
+                    "GF call", func.name, "argc", len(args), "methods", len(func.methods)
+                )
+
+            # Fast path: no typed parameters or guards, so _pick_best reduces to arity.
+            # Same tiers as below: exact Sig, then variadic Sig, then legacy methods;
+            # last-defined wins within a tier.
+            if func.homogeneous_kind() == "plain-no-sig":
+                argc = len(args)
+                chosen, chosen_tier = None, 3
+                for m in reversed(func.methods):
+                    sig = m.meta.get("type")
+                    tier = 0 if isinstance(sig, Sig) else 2
+                    if not isinstance(sig, Sig):
+                        sig = m.args
+                    if isinstance(sig, Sig):
+                        base = len(sig.positional) + len(sig.keywords)
+                        if sig.rest is not None:
+                            tier = tier or 1
+                            if argc < base:
+                                continue
+                        elif argc != base:
+                            continue
+                    elif isinstance(sig, Code) and argc != len(sig.nodes):
+                        continue
+                    if tier < chosen_tier:
+                        chosen, chosen_tier = m, tier
+                        if tier == 0:
+                            break
+                if chosen is not None:
+                    return await self.call(chosen, args, scope)
 
             # --- Refactor helpers (small, orthogonal) ---------------------------------
 
@@ -3999,7 +4662,7 @@ class Evaluator:
                 call_scope = Scope(parent=method.closure)
                 for g in guards:
                     val = (
-                        await self._eval(g.ast, call_scope)
+                        await self._exec_block(g, call_scope)
                         if hasattr(g, "ast")
                         else await self._eval(g, call_scope)
                     )
@@ -4008,6 +4671,9 @@ class Evaluator:
                         return False
                 return True
 
+            # Guard scopes built during this dispatch, keyed by closure + parameter shape.
+            guard_scopes: dict = {}
+
             async def _guard_passes(
                 method: SlipFunction, sig: Sig, call_args: list
             ) -> bool:
@@ -4015,27 +4681,36 @@ class Evaluator:
                 if not guards:
                     return True
 
-                call_scope = Scope(parent=method.closure)
-
-                # Bind parameters into guard scope so guards can reference them.
-                # NOTE: bind against the *real* sig/args (including `this`) so guard code can see `this`.
-                #
-                # In GenericFunction dispatch, call_args includes the receiver as the first argument
-                # when the signature declares `this: ...`.
-                arg_i = 0
-
-                for nm, _type_spec in self._sig_param_order(sig):
-                    if arg_i < len(call_args):
-                        call_scope[nm] = call_args[arg_i]
-                        arg_i += 1
-
-                if sig.rest is not None:
-                    nm = (
-                        sig.rest
-                        if isinstance(sig.rest, str)
-                        else getattr(sig.rest, "text", str(sig.rest))
-                    )
-                    call_scope[nm] = call_args[arg_i:] if arg_i < len(call_args) else []
+                # Methods sharing a closure and parameter shape see identical guard bindings,
+                # so one guard scope per shape is reused for this dispatch (reset to the
+                # parameter bindings before each use so guard-local writes never leak).
+                names, _this_i, rest_name, _binder = self._sig_binding_plan(sig)
+                shape_key = (id(method.closure), names, rest_name)
+                cached = guard_scopes.get(shape_key)
+                if cached is not None:
+                    call_scope, initial = cached
+                    call_scope.bindings.clear()
+                    call_scope.bindings.update(initial)
+                else:
+                    call_scope = Scope(parent=method.closure)
+
+                    # Bind parameters into guard scope so guards can reference them.
+                    # NOTE: bind against the *real* sig/args (including `this`) so guard code can see `this`.
+                    #
+                    # In GenericFunction dispatch, call_args includes the receiver as the first argument
+                    # when the signature declares `this: ...`.
+                    arg_i = 0
+
+                    for nm in names:
+                        if arg_i < len(call_args):
+                            call_scope[nm] = call_args[arg_i]
+                            arg_i += 1
+
+                    if rest_name is not None:
+                        call_scope[rest_name] = (
+                            call_args[arg_i:] if arg_i < len(call_args) else []
+                        )
+                    guard_scopes[shape_key] = (call_scope, dict(call_scope.bindings))
 
                 def _eval_guard_result(result):
                     result = unwrap_return(result)
@@ -4139,9 +4814,7 @@ class Evaluator:
 
             def _format_sig(sig: Sig) -> str:
                 try:
-                    from slip.slip_printer import Printer
-
-                    printer = Printer()
+                    printer = (_PRINTER or _load_printer())()
                     parts = []
                     for name, type_spec in self._sig_param_order(sig):
                         if type_spec is None:
@@ -4228,6 +4901,8 @@ class Evaluator:
                 """
                 exact: list[SlipFunction] = []
                 variadic: list[SlipFunction] = []
+                # Prescan once: without guards the tie-break is simply last-defined.
+                any_guards = any(_has_guards(m) for m in methods)
 
                 for m in methods:
                     s = getattr(m, "meta", {}).get("type")
@@ -4283,6 +4958,8 @@ class Evaluator:
                     # 3) select most specific (lexicographic)
                     best_key = min(_vec_key(v) for _ht, v, _m in matched)
                     best = [m for _ht, v, m in matched if _vec_key(v) == best_key]
+                    if not any_guards:
+                        return best[-1]
 
                     # 4) guards refine ties (guarded first), last-defined wins
                     guarded = [m for m in best if _has_guards(m)]
@@ -4354,7 +5031,10 @@ class Evaluator:
                             func.closure.meta["parent"] = core
                 except Exception:
                     pass
-                call_scope = Scope(parent=func.closure)
+                if self.scope_pooling:
+                    call_scope = Scope._acquire(parent=func.closure)
+                else:
+                    call_scope = Scope(parent=func.closure)
                 # Prefer signature-based binding when available. Fall back to legacy Code arg lists.
                 sig_obj = None
                 if hasattr(func, "meta"):
@@ -4375,90 +5055,79 @@ class Evaluator:
                 active_this_scope = None
                 active_this_is_resolver = False
 
-                self._dbg(
-                    "SlipFunction call",
-                    repr(func),
-                    "argc",
-                    len(args),
-                    "has_sig",
-                    bool(sig_obj),
-                )
+                if _SLIP_DEBUG:
+                    self._dbg(
+                        "SlipFunction call",
+                        repr(func),
+                        "argc",
+                        len(args),
+                        "has_sig",
+                        bool(sig_obj),
+                    )
                 if isinstance(sig_obj, Sig):
                     sig = sig_obj
+                    names, this_i, rest_name, binder = self._sig_binding_plan(sig)
+                    bound = min(len(names), len(args))
 
-                    # Normalize parameter name to a plain string
-                    def _pname(n):
-                        return n if isinstance(n, str) else getattr(n, "text", str(n))
-
-                    args_i = 0
-                    from slip.slip_datatypes import Scope as _Scope
-
-                    for nm, _type_spec in self._sig_param_order(sig):
-                        if args_i >= len(args):
-                            break
-                        v = args[args_i]
-                        args_i += 1
-                        if nm == "this":
+                    if 0 <= this_i < bound:
+                        v = args[this_i]
+                        try:
+                            is_resolver = bool(
+                                isinstance(v, Scope)
+                                and getattr(v, "meta", {}).get("resolver")
+                            )
+                        except Exception:
+                            is_resolver = False
+                        if not is_resolver:
+                            err = PermissionError(
+                                "`this` is reserved for resolver transactions; "
+                                "receiver must be a resolver (use `resolver #{...}`)"
+                            )
                             try:
-                                is_resolver = bool(
-                                    isinstance(v, _Scope)
-                                    and getattr(v, "meta", {}).get("resolver")
-                                )
+                                err.slip_obj = v
                             except Exception:
-                                is_resolver = False
-                            if not is_resolver:
-                                err = PermissionError(
-                                    "`this` is reserved for resolver transactions; "
-                                    "receiver must be a resolver (use `resolver #{...}`)"
-                                )
-                                try:
-                                    err.slip_obj = v
-                                except Exception:
-                                    pass
-                                raise err
-                            active_this_receiver = v
-                            active_this_is_resolver = True
-                        call_scope._set_allow_this_token(True)
-                        call_scope[nm] = v
-                        call_scope._set_allow_this_token(False)
-
-                    self._dbg(
-                        "Bind sig params",
-                        [
-                            (
-                                n,
-                                type(call_scope.get(n)).__name__
-                                if n in getattr(call_scope, "bindings", {})
-                                else None,
-                            )
-                            for n, _ in self._sig_param_order(sig)
-                        ],
-                    )
+                                pass
+                            raise err
+                        active_this_receiver = v
+                        active_this_is_resolver = True
+
+                    # Parameters are always bound with the `this` capability allowed, so a
+                    # single C-level update is equivalent to per-name Scope.__setitem__.
+                    # A parameter called `meta` must still hit the reserved-key check.
+                    if binder is not None:
+                        binder(call_scope.bindings, args)
+                    else:
+                        if "meta" in names:
+                            for nm, v in zip(names, args):
+                                call_scope[nm] = v
+                        call_scope.bindings.update(zip(names, args))
 
                     # Handle rest parameter from the first unbound call argument.
-                    if sig.rest is not None:
-                        call_scope[_pname(sig.rest)] = (
-                            args[args_i:] if len(args) > args_i else []
-                        )
+                    if rest_name is not None:
+                        call_scope[rest_name] = args[bound:] if len(args) > bound else []
+
+                    if _SLIP_DEBUG:
                         self._dbg(
-                            "Bind rest",
-                            (
-                                sig.rest
-                                if isinstance(sig.rest, str)
-                                else getattr(sig.rest, "text", str(sig.rest))
-                            ),
+                            "Bind sig params",
+                            [
+                                (n, type(call_scope.bindings[n]).__name__)
+                                for n in names[:bound]
+                            ],
+                            "rest",
+                            rest_name,
                             "count",
-                            max(0, len(args) - args_i),
+                            max(0, len(args) - bound),
                         )
 
                 elif isinstance(func.args, Code):
-                    self._dbg(
-                        "Legacy arg binding",
-                        "param_count",
-                        len(func.args.nodes),
-                        "argc",
-                        len(args),
-                    )
+                    if _SLIP_DEBUG:
+                        self._dbg(
+                            "Legacy arg binding",
+                            "param_count",
+                            len(func.args.nodes),
+                            "argc",
+                            len(args),
+                        )
                     # The AST for parameters like `[x]` from parser is `[[GetPath('x')]]`.
                     # Manually constructed test ASTs may incorrectly be `[GetPath('x')]`.
                     params = func.args.nodes
@@ -4498,10 +5167,11 @@ class Evaluator:
                 self.current_local_scope = call_scope
                 try:
                     try:
-                        self._dbg("Call-scope bindings", list(call_scope.keys()))
+                        if _SLIP_DEBUG:
+                            self._dbg("Call-scope bindings", list(call_scope.keys()))
                     except Exception:
                         pass
-                    result = await self._eval(func.body.nodes, call_scope)
+                    result = await self._exec_block(func.body, call_scope)
                 finally:
                     self.current_local_scope = prev_local
                     # Restore prior transaction context
@@ -4511,73 +5181,26 @@ class Evaluator:
                         self._active_this_is_resolver = prev_active_this_is_resolver
                     except Exception:
                         pass
-
-                from slip.slip_datatypes import ReturnSignal as _RS
+                # Only reached on normal completion; _release refuses captured scopes.
+                if self.scope_pooling:
+                    Scope._release(call_scope)
 
                 # Handle ReturnSignal control-flow (early exit) coming from function bodies.
-                try:
-                    from slip.slip_datatypes import ReturnSignal as _RS
-                except Exception:
-                    _RS = None
-
-                if _RS is not None and isinstance(result, _RS):
-                    inner = result.value
-                    # If the ReturnSignal carried a Response, return that Response (data).
-                    if isinstance(inner, Response):
-                        return inner
-                    # Otherwise return the payload value directly.
-                    return inner
-
-                if isinstance(result, Response):
-                    # Unwrap legacy Response(return ...) sentinel for compatibility.
-                    if (
-                        isinstance(result.status, PathLiteral)
-                        and isinstance(result.status.inner, GetPath)
-                        and len(result.status.inner.segments) == 1
-                        and isinstance(result.status.inner.segments[0], Name)
-                        and result.status.inner.segments[0].text == "return"
-                    ):
-                        return result.value
-                    return result
-                return result
+                # The payload is returned as-is; a Response payload is data.
+                if type(result) is ReturnSignal:
+                    return result.value
 
-            case _ if callable(func):
-                # Prepare kwargs for Python functions that need `scope`
-                kwargs = {}
-                try:
-                    needs = getattr(func, "_slip_accepts_scope", None)
-                    if needs is None:
-                        try:
-                            sig = inspect.signature(func)
-                            needs = "scope" in sig.parameters
-                        except Exception:
-                            needs = False
-                            # Best-effort fallback to kw-only detection via code object
-                            code = getattr(func, "__code__", None)
-                            if code is not None:
-                                kwonly = getattr(code, "co_kwonlyargcount", 0)
-                                if kwonly:
-                                    pos = int(getattr(code, "co_argcount", 0))
-                                    flags = int(getattr(code, "co_flags", 0))
-                                    has_varargs = bool(flags & 0x04)  # CO_VARARGS
-                                    start = pos + (1 if has_varargs else 0)
-                                    names = tuple(
-                                        code.co_varnames[start : start + kwonly]
-                                    )
-                                    if "scope" in names:
-                                        needs = True
-                        try:
-                            setattr(func, "_slip_accepts_scope", needs)
-                        except Exception:
-                            pass
-                    if needs:
-                        kwargs["scope"] = scope
-                except Exception:
-                    pass
+                # Unwrap legacy Response(return ...) sentinel for compatibility.
+                return _unwrap_return_response(result)
 
-                if inspect.iscoroutinefunction(func):
-                    return await func(*args, **kwargs)
-                result = func(*args, **kwargs)
+            case _ if callable(func):
+                # Pass `scope` to Python functions that declare it; shape is cached per callable.
+                needs_scope, is_coro = self._py_call_shape(func)
+                if is_coro:
+                    if needs_scope:
+                        return await func(*args, scope=scope)
+                    return await func(*args)
+                result = func(*args, scope=scope) if needs_scope else func(*args)
                 if inspect.isawaitable(result):
                     # Do not await asyncio.Task; return handle so background tasks remain concurrent
                     if isinstance(result, asyncio.Task):
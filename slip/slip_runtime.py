@@ -18,7 +18,13 @@ from dataclasses import dataclass, field
 
 from koine import Parser
 from slip.slip_transformer import SlipTransformer
-from slip.slip_interpreter import Evaluator
+from slip.slip_interpreter import (
+    Evaluator,
+    _debug_enabled,
+    _HTTP_SCHEMES,
+    _FILE_SCHEMES,
+    _LOCATOR_SCHEMES,
+)
 from slip.slip_datatypes import (
     Scope,
     Code,
@@ -31,12 +37,27 @@ from slip.slip_datatypes import (
     Group,
     List as SlipList,
     ReturnSignal,
+    IString,
+    SlipFunction,
+    GenericFunction,
+    DelPath,
+    PipedPath,
+    MultiSetPath,
 )
 
 # Canonical PathLiteral status singletons (use these everywhere)
 _OK_STATUS = PathLiteral(GetPath([Name("ok")]))
 _ERR_STATUS = PathLiteral(GetPath([Name("err")]))
 
+
+def _type_literal(name: str) -> PathLiteral:
+    """`name` as a path literal, as returned by type-of (ok/err use the status singletons)."""
+    if name == "ok":
+        return _OK_STATUS
+    if name == "err":
+        return _ERR_STATUS
+    return PathLiteral(GetPath([Name(name)]))
+
 # ===================================================================
 # 1. Core Data Structures & Global State
 # ===================================================================
@@ -274,9 +295,17 @@ class StdLib:
     def _eq(self, a, b):
         res = a == b
         try:
-            self.evaluator._dbg(
-                "EQ", type(a).__name__, id(a), "==", type(b).__name__, id(b), "->", res
-            )
+            if _debug_enabled():
+                self.evaluator._dbg(
+                    "EQ",
+                    type(a).__name__,
+                    id(a),
+                    "==",
+                    type(b).__name__,
+                    id(b),
+                    "->",
+                    res,
+                )
         except Exception:
             pass
         return res
@@ -535,26 +564,9 @@ class StdLib:
             pass
 
     def _package_http_result(self, raw, mode: str | None):
-        if mode in (None, "none"):
-            return raw
-        if isinstance(raw, tuple) and len(raw) == 3:
-            status, value, headers = raw
-            if mode == "lite":
-                return [status, value]
-            if mode == "full":
-                # Normalize header keys to lowercase for consistent lookups
-                norm_headers = headers
-                try:
-                    items = headers.items() if hasattr(headers, "items") else []
-                    norm_headers = {str(k).lower(): v for k, v in items}
-                except Exception:
-                    pass
-                return {
-                    "status": status,
-                    "value": value,
-                    "meta": {"headers": norm_headers},
-                }
-        return raw
+        from slip.slip_http import package_response
+
+        return package_response(raw, mode)
 
     async def _get(self, target, *, scope: Scope):
         from slip.slip_http import http_get
@@ -698,9 +710,9 @@ class StdLib:
 
         elif isinstance(target, (str, _IStr)):
             s = str(target).strip()
-            if s.startswith("http://") or s.startswith("https://"):
+            if s.startswith(_HTTP_SCHEMES):
                 url = s
-            elif s.startswith("file://"):
+            elif s.startswith(_FILE_SCHEMES):
                 file_loc = s
             else:
                 raise PathNotFound("import")
@@ -718,12 +730,8 @@ class StdLib:
             segs = getattr(target, "segments", None) or []
             if len(segs) == 1 and isinstance(segs[0], Name):
                 token = segs[0].text
-                if isinstance(token, str) and (
-                    token.startswith("file://")
-                    or token.startswith("http://")
-                    or token.startswith("https://")
-                ):
-                    if token.startswith("file://"):
+                if isinstance(token, str) and token.startswith(_LOCATOR_SCHEMES):
+                    if token.startswith(_FILE_SCHEMES):
                         file_loc = token
                     else:
                         url = token
@@ -889,7 +897,8 @@ class StdLib:
 
     # --- Object Model ---
     def _scope(self, config: dict):
-        self.evaluator._dbg("scope()", "config_type", type(config).__name__)
+        if _debug_enabled():
+            self.evaluator._dbg("scope()", "config_type", type(config).__name__)
         # Accept any mapping-like object (dict, SlipObject, etc.)
         is_mapping = isinstance(config, collections.abc.Mapping)
         if is_mapping and "meta" in config:
@@ -901,7 +910,8 @@ class StdLib:
         return s
 
     def _resolver(self, config: dict):
-        self.evaluator._dbg("resolver()", "config_type", type(config).__name__)
+        if _debug_enabled():
+            self.evaluator._dbg("resolver()", "config_type", type(config).__name__)
         # Accept any mapping-like object (dict, SlipObject, etc.)
         is_mapping = isinstance(config, collections.abc.Mapping)
         if is_mapping and "meta" in config:
@@ -914,13 +924,14 @@ class StdLib:
         return s
 
     def _inherit(self, obj: Scope, proto: Scope):
-        self.evaluator._dbg(
-            "inherit()",
-            "target_is_scope",
-            isinstance(obj, Scope),
-            "proto_is_scope",
-            isinstance(proto, Scope),
-        )
+        if _debug_enabled():
+            self.evaluator._dbg(
+                "inherit()",
+                "target_is_scope",
+                isinstance(obj, Scope),
+                "proto_is_scope",
+                isinstance(proto, Scope),
+            )
         if not isinstance(obj, Scope) or not isinstance(proto, Scope):
             raise TypeError("inherit expects (scope, scope)")
         obj.inherit(proto)
@@ -935,6 +946,7 @@ class StdLib:
         return time.time()
 
     def _current_scope(self, *, scope: Scope):
+        scope._mark_captured()
         return scope
 
     def _task(self, code: Code, *, scope: Scope):
@@ -951,6 +963,7 @@ class StdLib:
 
         evaluator = self.evaluator
         parent_scope = scope
+        parent_scope._mark_captured()
 
         async def _runner():
             child = Scope(parent=parent_scope)
@@ -1109,9 +1122,10 @@ class StdLib:
 
     # --- Language Primitives ---
     async def _if(self, args: list, *, scope: Scope):
-        self.evaluator._dbg(
-            "if()", "argc", len(args), "arg_types", [type(a).__name__ for a in args]
-        )
+        if _debug_enabled():
+            self.evaluator._dbg(
+                "if()", "argc", len(args), "arg_types", [type(a).__name__ for a in args]
+            )
         if len(args) < 2 or len(args) > 3:
             raise TypeError(f"if expects 2 or 3 arguments, got {len(args)}")
 
@@ -1218,9 +1232,10 @@ class StdLib:
 
     async def _foreach(self, args: list, *, scope: Scope):
         # Assumes root.slip is loaded and provides operator aliases.
-        self.evaluator._dbg(
-            "foreach()", "argc", len(args), "types", [type(a).__name__ for a in args]
-        )
+        if _debug_enabled():
+            self.evaluator._dbg(
+                "foreach()", "argc", len(args), "types", [type(a).__name__ for a in args]
+            )
         if len(args) != 3:
             raise TypeError(
                 f"foreach expects 3 arguments (vars-sig, collection, body), got {len(args)}"
@@ -1486,8 +1501,7 @@ class StdLib:
             temp_scope = Scope()
             ev.run(code.ast, temp_scope)
             out = SlipDict()
-            for k, v in temp_scope.bindings.items():
-                out[k] = v
+            out.data.update(temp_scope.bindings)
             return out
 
         # Runtime-path: return a coroutine the evaluator can await
@@ -1497,8 +1511,7 @@ class StdLib:
             for expr in code.ast:
                 await ev._eval_expr(expr, temp_scope)
             out = SlipDict()
-            for k, v in temp_scope.bindings.items():
-                out[k] = v
+            out.data.update(temp_scope.bindings)
             return out
 
         return _async_impl()
@@ -1514,7 +1527,7 @@ class StdLib:
 
         last = None
         exprs = code.ast
-        if not getattr(code, "_expanded", False):
+        if not getattr(code, "_expanded", False) and code.has_templating:
             exprs = await ev._expand_code_literal(
                 code, scope
             )  # expand against caller’s scope
@@ -1527,7 +1540,7 @@ class StdLib:
         Execute code within target_scope for writes, but resolve inject/splice from the caller’s scope.
         """
         exprs = code.ast
-        if not getattr(code, "_expanded", False):
+        if not getattr(code, "_expanded", False) and code.has_templating:
             exprs = await self.evaluator._expand_code_literal(
                 code, scope
             )  # expand against caller’s scope
@@ -1622,27 +1635,10 @@ class StdLib:
           - Response with a PathLiteral status whose single segment is the name "return"
             (legacy sentinel; kept for backward compatibility)
         """
-        from slip.slip_datatypes import (
-            ReturnSignal as _RS,
-            Response as _Resp,
-            PathLiteral as _PL,
-            GetPath as _GP,
-            Name as _Name,
-        )
-
-        if isinstance(val, _RS):
+        t = type(val)
+        if t is ReturnSignal:
             return True
-        if isinstance(val, _Resp):
-            st = getattr(val, "status", None)
-            if isinstance(st, _PL):
-                inner = getattr(st, "inner", None)
-                if (
-                    isinstance(inner, _GP)
-                    and len(inner.segments) == 1
-                    and isinstance(inner.segments[0], _Name)
-                ):
-                    return inner.segments[0].text == "return"
-        return False
+        return t is Response and val._is_return
 
     def _return(self, value: Any = None):
         try:
@@ -1664,7 +1660,6 @@ class StdLib:
             GetPath as _GP,
             Name as _Name,
         )
-        from slip.slip_runtime import SlipDict as _SlipDict
 
         ev = self.evaluator
 
@@ -1701,7 +1696,7 @@ class StdLib:
                 outcome = _Resp(_OK_STATUS, result)
 
         end = len(ev.side_effects)
-        out = _SlipDict()
+        out = SlipDict()
         out["outcome"] = outcome
         out["effects"] = _EffectsView(ev.side_effects, start, end)
         return out
@@ -1757,14 +1752,13 @@ class StdLib:
 
     def _clone(self, value):
         # Safe deep copy that avoids recursion issues with complex objects.
-        from slip.slip_runtime import SlipDict as _SlipDict
 
         if isinstance(value, list):
             return [self._clone(v) for v in value]
         if isinstance(value, dict):
             return {k: self._clone(v) for k, v in value.items()}
-        if isinstance(value, _SlipDict):
-            out = _SlipDict()
+        if isinstance(value, SlipDict):
+            out = SlipDict()
             for k, v in value.items():
                 out[k] = self._clone(v)
             return out
@@ -1800,17 +1794,16 @@ class StdLib:
                 if prototype_name in registry:
                     return registry[prototype_name]
 
-                from slip.slip_interpreter import TYPE_REGISTRY, _next_type_id
-                import slip.slip_interpreter as _interp
+                from slip.slip_interpreter import TYPE_REGISTRY, _type_id_counter
 
+                type_id = next(_type_id_counter)
                 proto = Scope()
                 proto.meta["name"] = prototype_name
-                proto.meta["type_id"] = _next_type_id
-                proto.meta["type-id"] = _next_type_id
+                proto.meta["type_id"] = type_id
+                proto.meta["type-id"] = type_id
                 proto.meta["generated"] = True
                 proto.meta["generated-from"] = "hydration"
-                TYPE_REGISTRY[prototype_name] = _next_type_id
-                _interp._next_type_id = _next_type_id + 1
+                TYPE_REGISTRY[prototype_name] = type_id
                 registry[prototype_name] = proto
                 try:
                     root_scope = getattr(self.evaluator, "root_scope", None)
@@ -1907,17 +1900,16 @@ class StdLib:
         if prototype_name in registry:
             return registry[prototype_name]
 
-        from slip.slip_interpreter import TYPE_REGISTRY, _next_type_id
-        import slip.slip_interpreter as _interp
+        from slip.slip_interpreter import TYPE_REGISTRY, _type_id_counter
 
+        type_id = next(_type_id_counter)
         proto = Scope()
         proto.meta["name"] = prototype_name
-        proto.meta["type_id"] = _next_type_id
-        proto.meta["type-id"] = _next_type_id
+        proto.meta["type_id"] = type_id
+        proto.meta["type-id"] = type_id
         proto.meta["generated"] = True
         proto.meta["generated-from"] = "host-object"
-        TYPE_REGISTRY[prototype_name] = _next_type_id
-        _interp._next_type_id = _next_type_id + 1
+        TYPE_REGISTRY[prototype_name] = type_id
         registry[prototype_name] = proto
         try:
             if isinstance(root_scope, Scope) and prototype_name not in root_scope:
@@ -1938,29 +1930,7 @@ class StdLib:
         return wrap_host_path_value(raw, [], self._resolve_host_prototype)
 
     def _type_of(self, value):
-        from slip.slip_datatypes import (
-            Scope,
-            Code,
-            IString,
-            SlipFunction,
-            GenericFunction,
-            GetPath,
-            SetPath,
-            DelPath,
-            PipedPath,
-            PathLiteral,
-            MultiSetPath,
-            Name,
-        )
-        from slip.slip_runtime import SlipDict
-
-        def lit(name: str):
-            if name == "ok":
-                return _OK_STATUS
-            if name == "err":
-                return _ERR_STATUS
-            return PathLiteral(GetPath([Name(name)]))
-
+        lit = _type_literal
         if value is None:
             return lit("none")
         if isinstance(value, bool):
@@ -2438,7 +2408,6 @@ class ScriptRunner:
             Name as _Name,
             Response as _Resp,
         )
-        from slip.slip_runtime import SlipDict as _SlipDict
 
         # Realize internal lazy selections/views at the host boundary.
         try:
@@ -2477,7 +2446,7 @@ class ScriptRunner:
                 return str(v)
 
         # SlipDict -> plain dict
-        if isinstance(v, _SlipDict):
+        if isinstance(v, SlipDict):
             return {str(k): self._host_normalize(val) for k, val in v.items()}
 
         # Scope -> plain dict of current bindings
@@ -2734,7 +2703,7 @@ class ScriptRunner:
 
         frames = []
         for frame in stack:
-            surface = frame.get("surface")
+            surface = self.evaluator._frame_surface(frame)
             if isinstance(surface, str) and surface.strip():
                 frames.append(surface.strip())
                 continue
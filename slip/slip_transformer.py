@@ -440,7 +440,7 @@ class SlipTransformer:
             if op is None:
                 raise ValueError("filter-query missing operator")
             # Legacy sugar: turn [> X] into a predicate chain [>, X]
-            pred = [GetPath([Name(op)])] + (rhs_ast if isinstance(rhs_ast, list) else [rhs_ast])
+            pred = FilterQuery.legacy_predicate(op, rhs_ast)
             obj = FilterQuery(op, rhs_ast, pred)
             return self._attach_loc(obj, node)
 
@@ -77,6 +77,14 @@ async def test_b1_bit_packing_full_and_partial():
     src2 = "b1#[1,0,1]"
     res2 = await run_slip(src2)
     assert_ok(res2, bytes([0xA0]))
+    # Multi-byte runs pack MSB-first across byte boundaries
+    res3 = await run_slip("b1#[1,1,1,1,1,1,1,1,0,1]")
+    assert_ok(res3, bytes([0xFF, 0x40]))
+
+@pytest.mark.asyncio
+async def test_signed_out_of_range_is_an_error():
+    res = await run_slip("i16#[40000]")
+    assert res.status == 'err'
 
 @pytest.mark.asyncio
 async def test_file_put_with_bytestream(tmp_path):
@@ -8,3 +8,15 @@ def test_http_trailing_segment_str_helpers_roundtrip():
     assert pr._http_has_trailing_segments_str(s) is True
     assert pr._canonicalize_http_token(s) == "http://h/a"
     assert pr._http_has_trailing_segments_str("http://h/a") is False
+
+def test_http_token_regex_scan_edge_cases():
+    ev = Evaluator()
+    pr = ev.path_resolver
+    # No path slash: dots belong to the host and are kept
+    assert pr._canonicalize_http_token("http://h.example.com") == "http://h.example.com"
+    assert pr._http_has_trailing_segments_str("http://h.example.com") is False
+    # Cut markers before the path slash stop the scan
+    assert pr._canonicalize_http_token("http://h#(x)/a.b") == "http://h"
+    # '[' counts as trailing even after the inline config
+    assert pr._http_has_trailing_segments_str("http://h/a#(cfg)[0]") is True
+    assert pr._http_has_trailing_segments_str("http://h/a#(c.fg)") is False
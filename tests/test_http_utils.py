@@ -1,6 +1,6 @@
 import pytest
 
-from slip.slip_http import normalize_response_mode, http_request
+from slip.slip_http import normalize_response_mode, package_response, prepare_payload, http_request
 
 @pytest.mark.asyncio
 async def test_http_request_default_success_and_modes(monkeypatch):
@@ -102,3 +102,31 @@ async def test_http_request_non_2xx_raises(monkeypatch):
 
     with pytest.raises(RuntimeError):
         await http_request("GET", "http://example/fail", config={"retries": 0})
+
+
+def test_package_response_modes():
+    raw = (404, {"err": 1}, {"Content-Type": "application/json"})
+    assert package_response(raw, "lite") == [404, {"err": 1}]
+    assert package_response(raw, "full") == {
+        "status": 404,
+        "value": {"err": 1},
+        "meta": {"headers": {"content-type": "application/json"}},
+    }
+    assert package_response(raw, "none") is raw
+    assert package_response(raw, None) is raw
+    # Plain bodies pass through regardless of mode
+    assert package_response({"ok": True}, "lite") == {"ok": True}
+
+
+def test_prepare_payload_content_type_and_json_default():
+    cfg = {"content-type": "application/json", "headers": {"X-A": "1"}}
+    assert prepare_payload({"a": 1}, cfg).replace(" ", "").replace("\n", "") == '{"a":1}'
+    assert cfg["headers"] == {"X-A": "1", "Content-Type": "application/json"}
+
+    cfg = {}
+    prepare_payload([1, 2], cfg)
+    assert cfg["headers"] == {"Content-Type": "application/json"}
+
+    cfg = {"content-type": "text/plain"}
+    assert prepare_payload("hi", cfg) == "hi"
+    assert prepare_payload(3, {}) == "3"
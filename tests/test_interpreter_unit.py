@@ -1,11 +1,15 @@
 import pytest
 
-from slip.slip_interpreter import _tmpl_normalize_value, _scope_to_dict, Evaluator
+from slip.slip_interpreter import (
+    _tmpl_normalize_value, _scope_to_dict, _scope_matches, Evaluator,
+    _expr_plan, _BC_LITERAL, _BC_EXPR, _SF_NONE, _SF_MACRO
+)
 from slip.slip_datatypes import (
     Scope, Code, IString, SlipFunction, GenericFunction, Sig,
-    GetPath, Name, PathLiteral, SetPath, DelPath, PipedPath, MultiSetPath
+    GetPath, Name, PathLiteral, SetPath, DelPath, PipedPath, MultiSetPath, Group
 )
 from slip import ScriptRunner
+import slip.slip_interpreter as si
 
 
 def test_tmpl_normalize_value_and_scope_to_dict():
@@ -29,6 +33,8 @@ def test_tmpl_normalize_value_and_scope_to_dict():
     # _tmpl_normalize_value on various inputs
     assert _tmpl_normalize_value(IString("X")) == "X"
     assert _tmpl_normalize_value([IString("Y"), 1]) == ["Y", 1]
+    for leaf in ("s", 1, 1.5, True, None):
+        assert _tmpl_normalize_value(leaf) is leaf
     norm = _tmpl_normalize_value(child)  # scope -> plain dict
     assert norm["a"] == 2 and isinstance(norm["inner"], dict)
 
@@ -154,3 +160,590 @@ async def test_unary_piped_operator_custom_and_error_cases():
     res_err = await ScriptRunner().handle_script("5 |add")
     assert res_err.status == 'err'
     assert "TypeError: invalid-args in (add)" in (res_err.error_message or "")
+
+
+@pytest.mark.asyncio
+async def test_eval_short_circuit_keeps_deciding_lhs():
+    ev = Evaluator()
+    boom = GetPath([Name("missing-name")])  # would raise PathNotFound if evaluated
+    terms = [None, GetPath([Name("and")]), boom]
+    assert await ev._eval_short_circuit("logical-and", 0, terms, 1, Scope()) == (0, 3)
+    assert await ev._eval_short_circuit("logical-or", 5, terms, 1, Scope()) == (5, 3)
+
+    s = Scope()
+    s["y"] = 7
+    terms = [None, GetPath([Name("or")]), GetPath([Name("y")])]
+    assert await ev._eval_short_circuit("logical-or", False, terms, 1, s) == (7, 3)
+    assert await ev._eval_short_circuit("logical-and", True, terms, 1, s) == (7, 3)
+
+
+@pytest.mark.asyncio
+async def test_sig_binding_plan_cached_and_binds_rest():
+    ev = Evaluator()
+    sig = Sig(["a", "b"], {}, "more", None)
+    plan = ev._sig_binding_plan(sig)
+    assert plan[:3] == (("a", "b"), -1, "more")
+    assert callable(plan[3])
+    assert ev._sig_binding_plan(sig) is plan
+
+    res = await ScriptRunner().handle_script(
+        """
+        f: fn {a, b, more...} [ #[a, b, more] ]
+        f 1 2 3 4
+        """
+    )
+    assert res.status == "ok" and res.value == [1, 2, [3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_plain_no_sig_generic_fast_path_respects_arity():
+    ev = Evaluator()
+    one = SlipFunction(Code([[GetPath([Name("x")])]]), Code([[1]]), Scope())
+    two = SlipFunction(
+        Code([[GetPath([Name("x")])], [GetPath([Name("y")])]]), Code([[2]]), Scope()
+    )
+    gf = GenericFunction("g")
+    gf.add_method(one)
+    gf.add_method(two)
+    assert gf.homogeneous_kind() == "plain-no-sig"
+    assert await ev.call(gf, ["a"], Scope()) == 1
+    assert await ev.call(gf, ["a", "b"], Scope()) == 2
+
+    # An untyped Sig keeps the set plain; a typed parameter invalidates it
+    gf.add_method(_make_fn_with_sig(positional=["x"]))
+    assert gf.homogeneous_kind() == "plain-no-sig"
+    gf.add_method(_make_fn_with_sig(keywords={"x": GetPath([Name("int")])}))
+    assert gf.homogeneous_kind() == "mixed"
+
+
+@pytest.mark.asyncio
+async def test_parsed_untyped_generic_takes_plain_fast_path(monkeypatch):
+    runner = ScriptRunner()
+    typed_checks = []
+    real = runner.evaluator._sig_types_match
+
+    async def counting(*a, **kw):
+        typed_checks.append(a)
+        return await real(*a, **kw)
+
+    monkeypatch.setattr(runner.evaluator, "_sig_types_match", counting)
+    res = await runner.handle_script(
+        """
+        g: fn {x} [ "one" ]
+        g: fn {x, y} [ "two" ]
+        g: fn {x, more...} [ "many" ]
+        h: fn {x} [ x ]
+        h: fn {x: int} [ "int" ]
+        #[g 1, g 1 2, g 1 2 3, h 5]
+        """
+    )
+    assert res.status == "ok" and res.value == ["one", "two", "many", "int"]
+    g = runner.evaluator.root_scope["g"]
+    assert g.homogeneous_kind() == "plain-no-sig"
+    assert runner.evaluator.root_scope["h"].homogeneous_kind() == "mixed"
+    # Only the typed `h` reached full dispatch
+    assert typed_checks and all(m not in g.methods for _sig, m, *_ in typed_checks)
+
+
+def test_type_name_of_exact_and_fallback_types():
+    from slip.slip_interpreter import _type_name_of, _Selection
+
+    assert _type_name_of(None) == "none"
+    assert _type_name_of(True) == "boolean"
+    assert _type_name_of(3) == "int"
+    assert _type_name_of(IString("s")) == "i-string"
+    assert _type_name_of(_Selection([1, 2], [0])) == "list"
+    assert _type_name_of({"a": 1}) == "dict"
+    assert _type_name_of(Scope()) == "scope"
+    assert _type_name_of(GetPath([Name("x")])) == "path"
+    assert _type_name_of(Code([])) == "code"
+    assert Evaluator()._primitive_type_name(1.5) == "float"
+
+
+def test_compile_sig_binder_full_and_partial_arity():
+    from slip.slip_interpreter import _compile_sig_binder
+
+    bind = _compile_sig_binder(("a", "b"))
+    full = {}
+    bind(full, [1, 2, 3])
+    assert full == {"a": 1, "b": 2}
+    partial = {}
+    bind(partial, [1])
+    assert partial == {"a": 1}
+    assert _compile_sig_binder(()) is None
+
+
+@pytest.mark.asyncio
+async def test_py_call_shape_cached_for_weak_and_unhashable_callables():
+    ev = Evaluator()
+    seen = []
+
+    def needs_scope(x, *, scope):
+        seen.append(scope)
+        return x + 1
+
+    s = Scope()
+    assert await ev.call(needs_scope, [1], s) == 2 and seen == [s]
+    assert ev._py_call_shape(needs_scope) == (True, False)
+    assert needs_scope in ev._py_call_cache
+
+    # Unhashable callables cannot be weak keys; they use the strong fallback
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, items):
+            return len(items)
+
+    fn = Unhashable()
+    assert await ev.call(fn, [[1, 2, 3]], s) == 3
+    assert ev._py_call_cache_strong[id(fn)] == (fn, (False, False))
+
+    # ... which is a bounded LRU: a hit refreshes, the oldest entry is evicted
+    others = [Unhashable() for _ in range(si._CALLABLE_STRONG_CACHE_MAX)]
+    for i, other in enumerate(others):
+        if i == 1:
+            assert ev._py_call_shape(fn) == (False, False)
+        ev._py_call_shape(other)
+    assert len(ev._py_call_cache_strong) == si._CALLABLE_STRONG_CACHE_MAX
+    assert id(fn) in ev._py_call_cache_strong
+    assert id(others[0]) not in ev._py_call_cache_strong
+
+
+@pytest.mark.asyncio
+async def test_binary_infix_rhs_evaluated_once():
+    res = await ScriptRunner().handle_script(
+        """
+        calls: #[]
+        bump: fn {} [
+          calls: calls + #[1]
+          10
+        ]
+        r: 1 + (bump)
+        #[r, len calls]
+        """
+    )
+    assert res.status == "ok" and res.value == [11, 1]
+
+
+def test_scope_matches_walks_prototype_chain():
+    base = Scope()
+    mid = Scope(parent=base)
+    leaf = Scope(parent=mid)
+    other = Scope()
+    assert _scope_matches(leaf, leaf)
+    assert _scope_matches(leaf, base)
+    assert not _scope_matches(leaf, other)
+    assert not _scope_matches(base, leaf)
+    assert not _scope_matches({"a": 1}, base)
+
+
+@pytest.mark.asyncio
+async def test_pipe_call_first_argument_evaluated_once():
+    res = await ScriptRunner().handle_script(
+        """
+        calls: #[]
+        bump: fn {} [
+          calls: calls + #[1]
+          10
+        ]
+        add: fn {a, b} [ a + b ]
+        r: 1 |add (bump)
+        #[r, len calls]
+        """
+    )
+    assert res.status == "ok" and res.value == [11, 1]
+
+
+@pytest.mark.asyncio
+async def test_pooled_call_scopes_do_not_break_closures():
+    res = await ScriptRunner().handle_script(
+        """
+        make-adder: fn {n} [ fn {x} [ x + n ] ]
+        inc: fn {x} [ x + 1 ]
+        add2: make-adder 2
+        add5: make-adder 5
+        #[inc 1, inc 2, add2 10, add5 10, add2 1]
+        """
+    )
+    assert res.status == "ok" and res.value == [2, 3, 12, 15, 3]
+
+
+@pytest.mark.asyncio
+async def test_captured_call_scope_survives_pool_reuse():
+    Scope._free_list.clear()
+    res = await ScriptRunner().handle_script(
+        """
+        make-adder: fn {n} [ fn {x} [ x + n ] ]
+        grab: fn {v} [ current-scope ]
+        inc: fn {x} [ x + 1 ]
+        add2: make-adder 2
+        saved: grab 7
+        #[inc 1, inc 2, inc 3, add2 10, saved.v, add2]
+        """
+    )
+    assert res.status == "ok" and res.value[:5] == [2, 3, 4, 12, 7]
+    closure = res.value[5].methods[0].closure
+    assert Scope._free_list
+    assert all(s is not closure for s in Scope._free_list)
+    assert closure["n"] == 2
+
+
+def test_compile_istring_template_splits_once_and_caches():
+    from slip.slip_interpreter import _compile_istring_template, _ISTRING_TEMPLATE_CACHE
+    raw = "\n    Hi {{name}}, {{ }}you are {{ age + 1 }}!\n"
+    chunks, exprs = _compile_istring_template(raw)
+    assert chunks == ("Hi ", ", you are ", "!")
+    assert exprs == ("name", "age + 1")
+    assert _ISTRING_TEMPLATE_CACHE[raw] is _compile_istring_template(raw)
+
+
+def test_unwrap_return_response_only_unwraps_return_status():
+    from slip.slip_interpreter import _unwrap_return_response
+    from slip.slip_datatypes import Response
+    ret = Response(PathLiteral(GetPath([Name("return")])), 5)
+    ok = Response(PathLiteral(GetPath([Name("ok")])), 5)
+    assert _unwrap_return_response(ret) == 5
+    assert _unwrap_return_response(ok) is ok
+    assert _unwrap_return_response(7) == 7
+
+
+def test_dbg_follows_refreshed_debug_flag(monkeypatch, capsys):
+    import slip.slip_interpreter as si
+    ev = Evaluator()
+    monkeypatch.setenv("SLIP_DEBUG", "1")
+    si._refresh_debug_flags()
+    try:
+        assert si._debug_enabled()
+        ev._dbg("hello")
+        assert "[DBG] hello" in capsys.readouterr().err
+    finally:
+        monkeypatch.delenv("SLIP_DEBUG")
+        si._refresh_debug_flags()
+    assert not si._debug_enabled()
+    ev._dbg("quiet")
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.asyncio
+async def test_exec_block_caches_program_and_drops_it_on_mutation():
+    ev = Evaluator()
+    scope = Scope()
+    block = Code([[1], ["two"], [None]])
+    assert await ev._exec_block(block, scope) is None
+    program = block._bytecode
+    assert await ev._exec_block(block, scope) is None
+    assert block._bytecode is program
+    block[2] = [3]
+    assert "_bytecode" not in block.__dict__
+    assert await ev._exec_block(block, scope) == 3
+
+
+def test_block_program_carries_expression_plans():
+    pipe = PipedPath([Name("add")])
+    expr = [GetPath([Name("fn")]), Code([]), pipe, 1]
+    program = Evaluator._compile_block([[7], expr])
+    assert program[0] == (_BC_LITERAL, 7, None)
+    assert program[1] == (_BC_EXPR, expr, ("fn", 2, None, (), _SF_MACRO))
+    assert _expr_plan([1, PathLiteral(pipe)]) == (None, None, None, (), _SF_NONE)
+    # Assignments carry the plan of their value terms
+    assign = [SetPath([Name("x")]), 1, pipe, 2]
+    assert _expr_plan(assign) == (None, 2, (None, 1, None, (), _SF_NONE), (), _SF_NONE)
+    # Property chains after a call argument are fused once into Name segments
+    base = Code([])
+    layout = _expr_plan([GetPath([Name("f")]), base, GetPath([Name(".a")]), GetPath([Name("b")])])[3]
+    assert layout[1] is None and layout[2] is None
+    segs, counts = layout[0]
+    assert [n.text for n in segs] == ["a", "b"] and counts == (1, 1)
+
+
+def test_dict_literal_plan_classifies_once_per_node():
+    from slip.slip_interpreter import _dict_literal_plan, _DICT_NAME, _DICT_GROUP, _DICT_EXPR, _MISSING
+    from slip.slip_datatypes import Group
+    sugar = IString("hi {{x}}")
+    exprs = [
+        [SetPath([Name("a")]), 1],
+        [SetPath([Name("b")]), GetPath([Name("i")]), sugar],
+        [SetPath([Group([["k"]])]), 2],
+        [GetPath([Name("noop")])],
+    ]
+    plan = _dict_literal_plan(exprs)
+    assert [p[0] for p in plan] == [_DICT_NAME, _DICT_NAME, _DICT_GROUP, _DICT_EXPR]
+    assert plan[0][1] == "a" and plan[0][3] is _MISSING
+    assert plan[1][3] is sugar
+    assert _dict_literal_plan(exprs) is plan
+
+
+@pytest.mark.asyncio
+async def test_istring_node_keeps_its_split_template():
+    res = await ScriptRunner().handle_script(
+        """
+        out: #[]
+        foreach {n} #[1, 2] [
+          out: out + #["n={{n}}, m={{n * 10}}"]
+        ]
+        out
+        """
+    )
+    assert res.status == "ok" and res.value == ["n=1, m=10", "n=2, m=20"]
+    node = IString("a {{x}}")
+    ev = Evaluator()
+    scope = Scope()
+    scope["x"] = 1
+    await ev._eval(node, scope)
+    assert node._template == (("a ", ""), ("x",))
+
+
+def test_rhs_names_collects_nested_reads_and_caches_per_expression():
+    from slip.slip_interpreter import _rhs_names
+    from slip.slip_datatypes import Group, List as SlipList
+    target = SetPath([Name("x")])
+    terms = [
+        target,
+        GetPath([Name("a")]),
+        Group([[GetPath([Name("b")])]]),
+        SlipList([[GetPath([Name("c")]), GetPath([Name("d"), Name("e")])]]),
+    ]
+    names = _rhs_names(target, terms)
+    assert names == {"a", "b", "c"}
+    assert _rhs_names(target, terms) is names
+    assert _rhs_names(target, [target, GetPath([Name("z")])]) == {"z"}
+
+
+def test_eval_sync_handles_only_self_evaluating_nodes():
+    from slip.slip_interpreter import _NOT_SYNC
+    ev = Evaluator()
+    lit = PathLiteral(GetPath([Name("a")]))
+    assert ev._eval_sync(3) == 3 and ev._eval_sync(None) is None
+    assert ev._eval_sync(lit) is lit and ev.current_node is lit
+    assert ev._eval_sync(IString("{{x}}")) is _NOT_SYNC
+    assert ev._eval_sync(GetPath([Name("a")])) is _NOT_SYNC
+
+
+def test_type_name_table_agrees_with_isinstance_chain():
+    import slip.slip_interpreter as si
+    from slip.slip_datatypes import GenericFunction
+    samples = [
+        None, True, 1, 1.5, IString("s"), "s", [1], {"a": 1},
+        GetPath([Name("a")]), SetPath([Name("a")]), DelPath(GetPath([Name("a")])),
+        PipedPath([Name("a")]), PathLiteral(GetPath([Name("a")])),
+        MultiSetPath([SetPath([Name("a")])]),
+        SlipFunction(Code([]), Code([]), Scope()), GenericFunction("f"), Code([]),
+    ]
+    table = si._EXACT_PRIMITIVE_TYPE_NAMES
+    try:
+        si._EXACT_PRIMITIVE_TYPE_NAMES = {}
+        expected = [si._type_name_of(v) for v in samples]
+    finally:
+        si._EXACT_PRIMITIVE_TYPE_NAMES = table
+    assert [si._type_name_of(v) for v in samples] == expected
+
+
+@pytest.mark.asyncio
+async def test_istring_without_holes_reuses_its_dedented_value():
+    ev = Evaluator()
+    node = IString("\n    plain\n      text\n")
+    first = await ev._eval(node, Scope())
+    assert first == "plain\n  text" and isinstance(first, IString)
+    assert await ev._eval(node, Scope()) is first
+
+
+@pytest.mark.asyncio
+async def test_example_signatures_are_reused_for_literal_samples():
+    ev = Evaluator()
+    fn = SlipFunction(Code([[GetPath([Name("a")])]]), Code([]), Scope())
+    fn.meta["examples"] = [Sig([], {"a": 1}), Sig([], {"a": "s"})]
+    first = await ev._synthesize_methods_from_examples(fn, ["a"], Scope())
+    cached = fn._example_sigs
+    second = await ev._synthesize_methods_from_examples(fn, ["a"], Scope())
+    assert fn._example_sigs is cached
+    assert [m.meta["type"].merge_key() for m in first] == [
+        m.meta["type"].merge_key() for m in second
+    ]
+    assert first[0] is not second[0] and first[0].meta["type"] is not second[0].meta["type"]
+    fn.meta["examples"].append(Sig([], {"a": 2.5}))
+    third = await ev._synthesize_methods_from_examples(fn, ["a"], Scope())
+    assert len(third) == 3
+
+
+@pytest.mark.asyncio
+async def test_dict_literal_scope_pooling_keeps_captured_scopes():
+    res = await ScriptRunner().handle_script(
+        """
+        d: #{x: 1, get-x: fn {} [ x ]}
+        e: #{x: 2, y: 3}
+        f: #{x: 4}
+        #[d.get-x, e.y, f.x, d.x, d]
+        """
+    )
+    assert res.status == "ok" and res.value[:4] == [1, 3, 4, 1]
+    closure = res.value[4]["get-x"].closure
+    assert closure._captured and all(s is not closure for s in Scope._free_list)
+
+
+@pytest.mark.asyncio
+async def test_istring_bare_name_holes_match_full_evaluation():
+    from slip.slip_interpreter import _simple_hole_path
+    res = await ScriptRunner().handle_script(
+        """
+        name: "Ada"
+        greet: fn {} [ "hi" ]
+        items: #[1, 2]
+        "{{name}} {{greet}} {{items}} {{name}}!"
+        """
+    )
+    assert res.status == "ok" and res.value == "Ada hi [1, 2] Ada!"
+    assert _simple_hole_path([[GetPath([Name("x")])]]) is not None
+    assert _simple_hole_path([[GetPath([Name("x"), Name("y")])]]) is None
+    assert _simple_hole_path([[GetPath([Name("x")]), 1]]) is None
+
+
+@pytest.mark.asyncio
+async def test_operator_site_cache_follows_rebinding():
+    ev = Evaluator()
+    scope = Scope()
+    scope["op"] = PipedPath([Name("add")])
+    term = GetPath([Name("op")])
+    path, name = await ev._resolve_operator_to_func_path(term, scope)
+    assert name == "add"
+    assert (await ev._resolve_operator_to_func_path(term, scope))[0] is path
+    scope["op"] = PipedPath([Name("sub")])
+    assert (await ev._resolve_operator_to_func_path(term, scope))[1] == "sub"
+
+    # Alias walks are redone but end at the same PipedPath, so the path is reused
+    scope["alias"] = PathLiteral(GetPath([Name("op")]))
+    alias = GetPath([Name("alias")])
+    first = await ev._resolve_operator_to_func_path(alias, scope)
+    assert (await ev._resolve_operator_to_func_path(alias, scope))[0] is first[0]
+
+    # An alias of an alias is re-walked on every run.
+    res = await ScriptRunner().handle_script(
+        """
+        y: `|add`
+        x: `y`
+        f: fn {a} [ a x 1 ]
+        p: f 5
+        y: `|sub`
+        #[p, f 5]
+        """
+    )
+    assert res.status == "ok" and res.value == [6, 4]
+
+    # Operators wrapped in a mutable Code value are re-walked after in-place edits.
+    for edit, expected in (("op[0][0]: `|sub`", [6, 4]), ("op[0]: #[ `|mul` ]", [6, 5])):
+        res = await ScriptRunner().handle_script(
+            f"""
+            op: [ |add ]
+            f: fn {{a}} [ a op 1 ]
+            p: f 5
+            {edit}
+            #[p, f 5]
+            """
+        )
+        assert res.status == "ok" and res.value == expected
+
+
+@pytest.mark.asyncio
+async def test_eval_expr_accepts_legacy_multi_set_tuple_head():
+    ev = Evaluator()
+    scope = Scope()
+    targets = [SetPath([Name("a")]), SetPath([Name("b")])]
+    assert await ev._eval_expr([("multi-set", targets), [1, 2]], scope) is None
+    assert scope["a"] == 1 and scope["b"] == 2
+
+
+def test_py_zero_arity_is_cached_per_callable():
+    ev = Evaluator()
+
+    class Lib:
+        def now(self):
+            return 1
+
+        def add(self, a, b=2):
+            return a + b
+
+    lib = Lib()
+    now = lib.now  # held, as a scope binding would hold it
+    assert ev._should_autocall_zero_arity(now) is True
+    assert ev._should_autocall_zero_arity(lib.add) is False
+    assert ev._zero_arity_cache[now] is True
+    assert ev._should_autocall_zero_arity(len) is False
+    # Plain values are never cached
+    assert ev._should_autocall_zero_arity([1, 2]) is False
+    assert not ev._zero_arity_cache_strong
+
+    # Unhashable callables share the bounded strong fallback
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self):
+            return 1
+
+    fns = [Unhashable() for _ in range(si._CALLABLE_STRONG_CACHE_MAX + 5)]
+    assert all(ev._py_zero_arity(f) is True for f in fns)
+    assert len(ev._zero_arity_cache_strong) == si._CALLABLE_STRONG_CACHE_MAX
+    assert id(fns[0]) not in ev._zero_arity_cache_strong
+    assert ev._zero_arity_cache_strong[id(fns[-1])] == (fns[-1], True)
+
+
+def test_frame_surface_is_rendered_on_demand():
+    ev = Evaluator()
+    ev._push_frame("add", None, [1, 2], [GetPath([Name("add")]), 1, 2])
+    frame = ev.call_stack[-1]
+    assert "surface" not in frame
+    assert ev._frame_surface(frame) == "add 1 2"
+    assert frame["surface"] == "add 1 2"
+
+
+@pytest.mark.asyncio
+async def test_call_sync_calls_plain_callables_directly():
+    ev = Evaluator()
+    scope = Scope()
+    assert ev._call_sync(lambda a, b: a + b, [1, 2], scope) == 3
+
+    async def coro_fn(x):
+        return x
+
+    # SLIP and coroutine functions come back pending for the caller to await
+    pending = ev._call_sync(coro_fn, [1], scope)
+    assert type(pending) is si._PendingAwait and await pending.awaitable == 1
+    fn = SlipFunction(Code([]), Code([[1]]), scope)
+    pending = ev._call_sync(fn, [], scope)
+    assert type(pending) is si._PendingAwait and await pending.awaitable == 1
+
+    # Sync callables that hand back an awaitable are awaited by the caller
+    pending = ev._call_sync(lambda: coro_fn(5), [], scope)
+    assert type(pending) is si._PendingAwait and await pending.awaitable == 5
+
+
+@pytest.mark.asyncio
+async def test_code_literal_values_do_not_share_nested_groups():
+    res = await ScriptRunner().handle_script(
+        """
+        mk: fn {} [ [ (1 + 2) ] ]
+        c1: mk
+        g: c1[0][0]
+        g[0]: #[9]
+        mk
+        """
+    )
+    assert res.status == "ok"
+    group = res.value.nodes[0][0]
+    assert isinstance(group, Group) and group.nodes[0][0] == 1
+
+
+@pytest.mark.asyncio
+async def test_templated_code_literal_does_not_share_plain_subtrees():
+    res = await ScriptRunner().handle_script(
+        """
+        k: 5
+        mk: fn {} [ [ (inject k) (1 + 2) ] ]
+        c1: mk
+        g: c1[0][1]
+        g[0]: #[9]
+        mk
+        """
+    )
+    assert res.status == "ok"
+    group = res.value.nodes[0][1]
+    assert res.value.nodes[0][0] == 5
+    assert isinstance(group, Group) and group.nodes[0][0] == 1
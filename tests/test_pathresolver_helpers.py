@@ -1,4 +1,5 @@
-from slip.slip_interpreter import Evaluator
+import pytest
+from slip.slip_interpreter import Evaluator, _MISSING
 from slip.slip_datatypes import GetPath, SetPath, Name
 
 def test_http_token_canonicalization_and_trailing_detection():
@@ -53,3 +54,320 @@ def test_extract_file_locator_variants_and_trailing():
     # If path has extra segments, has trailing segments is True
     p3 = GetPath([Name("file:///tmp/x.json"), Name("more")])
     assert pr._has_file_trailing_segments(p3) is True
+
+def test_locator_scans_are_memoized_on_the_path_node():
+    ev = Evaluator()
+    pr = ev.path_resolver
+
+    p = GetPath([Name("http://h/a.b")])
+    calls = []
+    orig = pr._scan_http_locator
+    pr._scan_http_locator = lambda path: calls.append(path) or orig(path)
+    assert pr._extract_http_url(p) == "http://h/a"
+    assert pr._extract_http_url(p) == "http://h/a"
+    # URL and trailing-segment flag come from the same scan
+    assert pr._has_http_trailing_segments(p) is True
+    assert len(calls) == 1
+    assert p._slip_http_scan == ("http://h/a", True)
+
+    # Non-locator paths memoize the negative result too
+    q = GetPath([Name("x")])
+    assert pr._extract_file_locator(q) is None
+    assert "_slip_file_loc" in q.__dict__
+
+@pytest.mark.asyncio
+async def test_get_segment_key_dispatch():
+    from slip.slip_datatypes import Scope, Slice, PathSegment
+
+    ev = Evaluator()
+    pr = ev.path_resolver
+    scope = Scope()
+
+    assert await pr._get_segment_key(Name(".outcome"), scope) == "outcome"
+    assert await pr._get_segment_key(Name("plain"), scope) == "plain"
+    assert await pr._get_segment_key(Slice(None, None), scope) == slice(None, None)
+
+    # Subclasses resolve to their base handler
+    class MySlice(Slice):
+        pass
+
+    assert await pr._get_segment_key(MySlice(None, None), scope) == slice(None, None)
+
+    class Odd(PathSegment):
+        pass
+
+    with pytest.raises(TypeError):
+        await pr._get_segment_key(Odd(), scope)
+
+def test_resolve_plan_is_memoized_on_the_path():
+    from slip.slip_datatypes import Root
+
+    ev = Evaluator()
+    pr = ev.path_resolver
+    p = GetPath([Root, Name("a"), Name("b")])
+    plan = pr._resolve_plan(p)
+    rooted, segments, body, last = plan
+    assert rooted is True
+    assert [s.text for s in segments] == ["a", "b"]
+    assert [s.text for s in body] == ["a"] and last.text == "b"
+    assert pr._resolve_plan(p) is plan
+
+def test_resolve_program_compiles_segments_once():
+    from slip.slip_datatypes import Parent, Pwd, Index, FilterQuery
+    from slip.slip_interpreter import _OP_NAME, _OP_PARENT, _OP_FILTER, _OP_KEY
+
+    ev = Evaluator()
+    pr = ev.path_resolver
+    fq = FilterQuery(">", [1])
+    idx = Index([1])
+    p = GetPath([Parent, Pwd, Name(".a"), idx, fq, Name("b")])
+    program, body = pr._resolve_program(p)
+    assert program == (
+        (_OP_PARENT, None, None),
+        (_OP_NAME, "a", ".a"),
+        (_OP_KEY, idx, None),
+        (_OP_FILTER, fq, None),
+        (_OP_NAME, "b", "b"),
+    )
+    assert body == program[:-1]
+    assert pr._resolve_program(p)[0] is program
+
+    # Predicate normalization is compiled once per filter segment
+    plan = pr._predicate_plan(fq)
+    assert plan[1] is not None and pr._predicate_plan(fq) is plan
+
+def test_item_overlay_reads_through_without_copying():
+    from slip.slip_datatypes import Scope
+
+    ev = Evaluator()
+    pr = ev.path_resolver
+    parent = Scope()
+    parent["limit"] = 5
+
+    item = {"hp": 12, "name": "orc"}
+    overlay = pr._build_item_overlay_scope(item, parent)
+    assert overlay["hp"] == 12 and overlay["limit"] == 5
+    overlay["hp"] = 0  # predicate-local write
+    assert overlay["hp"] == 0 and item["hp"] == 12
+
+    obj = Scope()
+    obj["hp"] = 3
+    overlay = pr._build_item_overlay_scope(obj, parent)
+    overlay["tmp"] = 1
+    assert overlay["hp"] == 3 and "tmp" not in obj.bindings
+
+    # Non-str keys still go through the copying path
+    overlay = pr._build_item_overlay_scope({1: "a"}, parent)
+    assert overlay["1"] == "a"
+
+def test_item_overlay_plain_object_attributes_are_cached_per_type():
+    from slip.slip_datatypes import Scope
+    from slip.slip_interpreter import _OVERLAY_ATTR_CACHE
+
+    class Mob:
+        kind = "orc"
+
+        def __init__(self, hp):
+            self.hp = hp
+            self._secret = 1
+
+        def attack(self):
+            return 1
+
+        @property
+        def alive(self):
+            return self.hp > 0
+
+    ev = Evaluator()
+    pr = ev.path_resolver
+    overlay = pr._build_item_overlay_scope(Mob(3), Scope())
+    assert dict(overlay.bindings) == {"alive": True, "hp": 3, "kind": "orc"}
+    assert "attack" not in _OVERLAY_ATTR_CACHE[Mob]
+
+
+@pytest.mark.asyncio
+async def test_slice_key_reads_literal_endpoints_without_evaluating():
+    from slip.slip_datatypes import Scope, Slice, GetPath, Name
+
+    ev = Evaluator()
+    pr = ev.path_resolver
+    calls = []
+    orig = ev._eval_expr
+
+    async def spy(expr, scope):
+        calls.append(expr)
+        return await orig(expr, scope)
+
+    ev._eval_expr = spy
+    scope = Scope()
+    scope["n"] = 4
+    assert await pr._slice_key(Slice([1], [3]), scope) == slice(1, 3)
+    assert calls == []
+    assert await pr._slice_key(Slice([1], [GetPath([Name("n")])]), scope) == slice(1, 4)
+    assert len(calls) == 1
+
+
+def test_name_only_keys_plan():
+    from slip.slip_datatypes import GetPath, SetPath, Name, Parent, Root, Index
+
+    pr = Evaluator().path_resolver
+    assert pr._name_only_keys(SetPath([Name("a"), Name(".b"), Name("c")])) == (("a", "b"), "c")
+    assert pr._name_only_keys(GetPath([Root, Name("x")])) == ((), "x")
+    assert pr._name_only_keys(GetPath([Parent, Name("x")])) is None
+    assert pr._name_only_keys(GetPath([Name("xs"), Index([0])])) is None
+
+
+def test_vectorized_target_parse_is_memoized_on_the_node():
+    from slip.slip_datatypes import SetPath, Name, FilterQuery
+
+    pr = Evaluator().path_resolver
+    filt = FilterQuery(">", [10])
+    sp = SetPath([Name("players"), Name("hp"), filt])
+    parsed = pr._parse_vectorized_target(sp)
+    assert parsed[1:3] == ("hp", filt)
+    assert pr._parse_vectorized_target(sp) is parsed
+    base = pr._vectorized_base_path(sp)
+    assert base.segments == [Name("players")]
+    assert pr._vectorized_base_path(sp) is base
+    assert pr._parse_vectorized_target(SetPath([Name("a"), Name("b")])) is None
+
+
+@pytest.mark.asyncio
+async def test_collect_vector_targets_compiles_predicate_once():
+    from slip.slip_datatypes import Scope, FilterQuery
+
+    pr = Evaluator().path_resolver
+    calls = []
+    orig = pr._normalize_relative_predicate_terms
+
+    def spy(terms):
+        calls.append(terms)
+        return orig(terms)
+
+    pr._normalize_relative_predicate_terms = spy
+    items = [{"hp": 1}, {"hp": 20}, {"hp": 30}]
+    # A bare Evaluator has no core operators, so nothing matches; only compilation is checked.
+    await pr._collect_vector_targets(
+        items, "hp", FilterQuery(">", [10]), Scope(), include_old=False
+    )
+    assert len(calls) == 1
+
+
+def test_pluck_homogeneous_and_mixed_items():
+    from types import SimpleNamespace
+    from slip.slip_datatypes import Scope
+    from slip.slip_interpreter import PathResolver, PathNotFound
+
+    s = Scope()
+    s["hp"] = 2
+    assert PathResolver._pluck([{"hp": 1}, {"hp": 3}], "hp") == [1, 3]
+    assert PathResolver._pluck([s, {"hp": 5}, SimpleNamespace(hp=7)], "hp") == [2, 5, 7]
+    assert PathResolver._pluck([], "hp") == []
+    with pytest.raises(PathNotFound):
+        PathResolver._pluck([{"hp": 1}, {}], "hp")
+    with pytest.raises(TypeError):
+        PathResolver._pluck([SimpleNamespace(hp=1), SimpleNamespace()], "hp")
+
+
+def test_field_reader_matches_read_field():
+    from types import SimpleNamespace
+    from slip.slip_datatypes import Scope
+
+    pr = Evaluator().path_resolver
+    s = Scope()
+    s["hp"] = 4
+    for item in ({"hp": 1}, SimpleNamespace(hp=2), s):
+        read = pr._field_reader(type(item), "hp")
+        assert read(item) == pr._read_field(item, "hp")
+
+
+def test_field_write_fn_matches_write_field():
+    from types import SimpleNamespace
+    from slip.slip_datatypes import Scope
+
+    pr = Evaluator().path_resolver
+    write = pr._field_write_fn("hp")
+    items = [{"hp": 1}, SimpleNamespace(hp=2), Scope()]
+    for item in items:
+        write(item, 9)
+    assert [pr._read_field(item, "hp") for item in items] == [9, 9, 9]
+
+
+@pytest.mark.asyncio
+async def test_literal_filter_predicate_is_folded():
+    from slip.slip_datatypes import Scope, FilterQuery
+
+    pr = Evaluator().path_resolver
+    calls = []
+    pr._build_item_overlay_scope = lambda item, scope: calls.append(item)
+    items = [1, 2, 3]
+    keep = await pr._apply_filter(items, FilterQuery(None, None, predicate_ast=[True]), Scope())
+    drop = await pr._apply_filter(items, FilterQuery(None, None, predicate_ast=[0]), Scope())
+    assert list(keep) == items and list(drop) == []
+    assert calls == []
+    assert pr._constant_predicate([1, 2]) is None
+    assert pr._predicate_plan(FilterQuery(None, None, predicate_ast=[True]))[3] is True
+
+
+@pytest.mark.asyncio
+async def test_resolve_value_own_binding_and_meta_fallback():
+    from slip.slip_datatypes import Scope, GetPath, Name
+
+    pr = Evaluator().path_resolver
+    proto = Scope()
+    proto["inherited"] = 2
+    s = Scope(parent=proto)
+    s["own"] = 1
+    s.bindings["meta"] = "shadow"  # e.g. a bound parameter named meta
+    assert await pr._resolve_value(GetPath([Name("own")]), s) == 1
+    assert await pr._resolve_value(GetPath([Name("inherited")]), s) == 2
+    assert await pr._resolve_value(GetPath([Name("meta")]), s) is s.meta
+
+
+def test_item_overlay_reuses_preloaded_field():
+    from slip.slip_datatypes import Scope
+
+    class Probe:
+        def __init__(self):
+            self.reads = 0
+            self.other = 5
+
+        @property
+        def hp(self):
+            self.reads += 1
+            return 3
+
+    pr = Evaluator().path_resolver
+    item = Probe()
+    overlay = pr._build_item_overlay_scope(item, Scope(), ("hp", 3))
+    assert overlay["hp"] == 3 and overlay["other"] == 5
+    assert item.reads == 0
+
+
+def test_read_path_is_built_once_per_write_path():
+    pr = Evaluator().path_resolver
+    sp = SetPath([Name("a"), Name("b")])
+    gp = pr._read_path(sp)
+    assert isinstance(gp, GetPath) and gp.segments is sp.segments
+    assert pr._read_path(sp) is gp
+
+
+def test_try_apply_name_reports_misses_without_raising():
+    pr = Evaluator().path_resolver
+
+    class Obj:
+        hp = 7
+
+    assert pr._try_apply_name({"a": 1}, Name("a")) == 1
+    assert pr._try_apply_name({"a": 1}, Name("b")) is _MISSING
+    assert pr._try_apply_name(Obj(), Name("hp")) == 7
+    assert pr._try_apply_name(Obj(), Name("mp")) is _MISSING
+    assert pr._try_apply_name([{"a": 1}, {"a": 2}], Name("a")) == [1, 2]
+    assert pr._try_apply_name([{"a": 1}, {}], Name("a")) is _MISSING
+
+
+def test_try_apply_names_counts_segments_walked():
+    pr = Evaluator().path_resolver
+    data = {"a": {"b": {"c": 3}}}
+    assert pr._try_apply_names(data, (Name("a"), Name("b"), Name("c"))) == (3, 3)
+    assert pr._try_apply_names(data, (Name("a"), Name("x"), Name("c"))) == ({"b": {"c": 3}}, 1)
@@ -4,7 +4,7 @@ from slip.slip_datatypes import (
     PathLiteral,
     GetPath, SetPath, DelPath, Name, Index, Slice, Group,
     Root, Parent, Pwd, PipedPath, MultiSetPath,
-    SlipBlock, PathSegment, Sig
+    SlipBlock, PathSegment, Sig, FilterQuery, GenericFunction
 )
 
 # --- Scope Tests ---
@@ -390,3 +390,120 @@ def test_sig_with_conjunction_keyword_value():
     assert s1 == s2
     r = repr(s1)
     assert "and" in r
+
+
+def test_node_kind_tags():
+    from slip.slip_datatypes import (
+        node_kind, KIND_NONE, KIND_GET_PATH, KIND_PIPED_PATH, KIND_PATH_LITERAL,
+        KIND_GROUP, KIND_CODE,
+    )
+
+    gp = GetPath([Name("x")])
+    assert node_kind(gp) == KIND_GET_PATH
+    assert node_kind(PipedPath([Name("add")])) == KIND_PIPED_PATH
+    assert node_kind(PathLiteral(gp)) == KIND_PATH_LITERAL
+    assert node_kind(Group([[gp]])) == KIND_GROUP
+    assert node_kind(Code([[gp]])) == KIND_CODE
+    assert node_kind(1) == KIND_NONE
+    # Scope bindings never leak into the tag lookup
+    s = Scope()
+    s["_kind"] = KIND_GET_PATH
+    assert node_kind(s) == KIND_NONE
+
+
+def test_scope_release_pools_only_uncaptured_scopes():
+    parent = Scope()
+    s = Scope._acquire(parent)
+    s["x"] = 1
+    assert Scope._release(s)
+    reused = Scope._acquire(parent)
+    assert reused is s
+    assert dict(reused.bindings) == {} and reused.parent is parent
+
+    captured = Scope._acquire(parent)
+    SlipFunction(Code([]), Code([]), captured)
+    assert captured._captured and parent._captured
+    assert not Scope._release(captured)
+    stored = Scope._acquire(parent)
+    Scope()["s"] = stored
+    assert not Scope._release(stored)
+
+
+def test_name_key_strips_leading_dot_and_interns():
+    import sys
+    n = Name("." + "hp")
+    assert n.text == ".hp" and n.key == "hp"
+    assert n.key is sys.intern("hp")
+    plain = Name("".join(["us", "er"]))
+    assert plain.key is plain.text is sys.intern("user")
+    assert Name(".").key == "."
+    assert Name(IString(".x")).key == "x"
+
+
+def test_scope_root_scope_walks_parents():
+    root = Scope()
+    mid = Scope(parent=root)
+    leaf = Scope(parent=mid)
+    leaf["root"] = 1
+    assert leaf._root_scope() is root
+    assert root._root_scope() is root
+    # attribute-style access to a binding named `root` is not shadowed
+    assert leaf.root == 1
+
+
+def test_filter_query_legacy_predicate():
+    assert FilterQuery.legacy_predicate(">", [10]) == [GetPath([Name(">")]), 10]
+    assert FilterQuery.legacy_predicate("=", 3) == [GetPath([Name("=")]), 3]
+
+
+def test_response_is_return_tracks_status():
+    ret = PathLiteral(GetPath([Name("return")]))
+    ok = PathLiteral(GetPath([Name("ok")]))
+    r = Response(ret, 1)
+    assert r._is_return
+    r.status = ok
+    assert not r._is_return and r.status is ok
+    assert not Response("return", 1)._is_return
+
+
+def test_code_has_templating_scan_and_invalidation():
+    inject = Group([[GetPath([Name("inject")]), 1]])
+    plain = Code([[GetPath([Name("x")]), Group([[1]])]])
+    assert not plain.has_templating
+    plain[0] = [List([[inject]])]
+    assert plain.has_templating
+    assert Code([[("dict", [[inject]])]]).has_templating
+
+
+def test_group_splice_kind():
+    g = Group([[GetPath([Name("splice")]), 1]])
+    assert g.splice_kind == "splice"
+    assert Group([[GetPath([Name("x")]), 1]]).splice_kind is None
+    assert Group([[1], [2]]).splice_kind is None
+    g[0] = [GetPath([Name("inject")]), 1]
+    assert g.splice_kind == "inject"
+
+
+def test_sig_merge_key():
+    a = Sig([], {"x": GetPath([Name("int")])})
+    b = Sig([], {"x": GetPath([Name("int")])})
+    c = Sig([], {"y": GetPath([Name("int")]), "x": GetPath([Name("int")])})
+    d = Sig([], {"x": GetPath([Name("int")]), "y": GetPath([Name("int")])})
+    assert a.merge_key() == b.merge_key()
+    assert c.merge_key() != d.merge_key()
+    assert isinstance(Sig(["x"], {}, where=Code([[1]])).merge_key(), str)
+
+
+def test_generic_function_zero_arity_cached_until_methods_change():
+    gf = GenericFunction("f")
+    one_arg = SlipFunction(Code([[GetPath([Name("x")])]]), Code([]), Scope())
+    gf.add_method(one_arg)
+    assert gf.has_zero_arity_method() is False
+    assert gf._has_zero_arity is False
+    gf.add_method(SlipFunction(Code([]), Code([]), Scope()))
+    assert gf._has_zero_arity is None
+    assert gf.has_zero_arity_method() is True
+
+    typed = SlipFunction(Code([]), Code([]), Scope())
+    typed.meta["type"] = Sig(["a"], {}, None, None)
+    assert typed.is_zero_arity() is False
@@ -845,6 +845,17 @@ async def test_code_inject_and_statement_splice_expand(evaluator, root_scope):
     assert isinstance(out_splice, Code)
     assert out_splice.ast == [[1], [2]]
 
+@pytest.mark.asyncio
+async def test_code_expand_copies_untemplated_subtrees(evaluator, root_scope):
+    root_scope['val'] = 42
+    plain = Group([[1]])
+    inject = Group([[GetPath([Name('inject')]), GetPath([Name('val')])]])
+    code = Code([[plain, Group([[inject]])]])
+    out = await evaluator.eval(code, root_scope)
+    assert out.ast[0][0] is not plain and out.ast[0][0].ast == [[1]]
+    assert out.ast[0][1] is not code.ast[0][1]
+    assert out.ast[0][1].ast == [[42]]
+
 @pytest.mark.asyncio
 async def test_attribute_fallback_on_plain_object_and_pluck_error(evaluator, root_scope):
     class Obj:
@@ -101,3 +101,16 @@ def test_where_syntax_error_multiple_clauses():
     code = "f: fn { n |where n > 0 |where n < 10 } [ n ]"
     res = run_slip(code)
     assert res.status == 'err'
+
+def test_guard_scope_reuse_does_not_leak_guard_locals():
+    # Both guarded methods share a parameter shape. The last-defined guard is
+    # checked first and rebinds n; the next guard must still see the argument.
+    code = """
+    pick: fn { n |where n > 10 } [ `big` ]
+    pick: fn { n |where (n: 0) > 1 } [ `unreachable` ]
+    pick: fn { n } [ `small` ]
+    #[ pick 15, pick 5 ]
+    """
+    res = run_slip(code)
+    assert res.status == 'ok', res.error_message
+    assert res.value == ["`big`", "`small`"]